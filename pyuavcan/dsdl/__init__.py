@@ -22,11 +22,18 @@ Below is the inheritance diagram for the classes defined in this module.
    :parts: 1
 """
 
-from ._compiler import generate_package as generate_package
-from ._compiler import GeneratedPackageInfo as GeneratedPackageInfo
+import typing as _typing
+
+if _typing.TYPE_CHECKING:  # pragma: no cover
+    from ._compiler import generate_package as generate_package
+    from ._compiler import GeneratedPackageInfo as GeneratedPackageInfo
 
 from ._composite_object import serialize as serialize
 from ._composite_object import deserialize as deserialize
+from ._composite_object import serialize_many as serialize_many
+from ._composite_object import deserialize_many as deserialize_many
+from ._composite_object import serialize_columns as serialize_columns
+from ._composite_object import deserialize_columns as deserialize_columns
 
 from ._composite_object import CompositeObject as CompositeObject
 from ._composite_object import ServiceObject as ServiceObject
@@ -38,10 +45,34 @@ from ._composite_object import FixedPortServiceObject as FixedPortServiceObject
 from ._composite_object import get_fixed_port_id as get_fixed_port_id
 from ._composite_object import get_model as get_model
 from ._composite_object import get_class as get_class
+from ._composite_object import find_classes_by_fixed_port_id as find_classes_by_fixed_port_id
 from ._composite_object import get_extent_bytes as get_extent_bytes
 
 from ._composite_object import get_attribute as get_attribute
 from ._composite_object import set_attribute as set_attribute
 
+from ._buffer_pool import SerializationBufferPool as SerializationBufferPool
+from ._buffer_pool import SerializationBufferPoolStatistics as SerializationBufferPoolStatistics
+from ._buffer_pool import SerializedRepresentationLease as SerializedRepresentationLease
+
+from ._lazy_view import LazyView as LazyView
+
 from ._builtin_form import to_builtin as to_builtin
 from ._builtin_form import update_from_builtin as update_from_builtin
+
+
+# The code generator depends on PyDSDL and Nunavut, which take a long time to import. Generated packages import this
+# module but do not need the code generator, so it is imported only when one of its entities is accessed.
+_LAZY_COMPILER_ENTITIES = {"generate_package", "GeneratedPackageInfo"}
+
+
+def __getattr__(name: str) -> _typing.Any:
+    if name in _LAZY_COMPILER_ENTITIES:
+        from . import _compiler
+
+        return getattr(_compiler, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> _typing.List[str]:
+    return sorted(set(globals()) | _LAZY_COMPILER_ENTITIES)
@@ -0,0 +1,232 @@
+# Copyright (c) 2021 UAVCAN Consortium
+# This software is distributed under the terms of the MIT License.
+# Author: Pavel Kirienko <pavel@uavcan.org>
+
+from __future__ import annotations
+import typing
+import logging
+import dataclasses
+
+import numpy
+
+from . import _serialized_representation
+from ._composite_object import CompositeObject
+
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class SerializationBufferPoolStatistics:
+    acquired: int = 0
+    """Total number of buffers handed out by the pool."""
+
+    allocated: int = 0
+    """How many of the acquired buffers had to be newly allocated because there were no idle buffers to reuse."""
+
+    recycled: int = 0
+    """How many buffers were returned to the pool for reuse."""
+
+    discarded: int = 0
+    """
+    How many buffers could not be reused because their memory was still referenced by someone at the time of release
+    (e.g., a transport that delivers outgoing transfers by reference, like the loopback transport), or because
+    the pool was full. Such buffers are left to the garbage collector.
+    """
+
+
+class SerializedRepresentationLease:
+    """
+    A serialized representation stored in a buffer that belongs to a :class:`SerializationBufferPool`.
+    The fragments can be used until the lease is released back to the pool;
+    there is no need to release it explicitly if the buffer is not to be reused.
+    """
+
+    def __init__(self, storage: bytearray, fragmented_payload: typing.Sequence[memoryview], dirty_bytes: int) -> None:
+        self._storage: typing.Optional[bytearray] = storage
+        self._fragmented_payload: typing.Optional[typing.Sequence[memoryview]] = fragmented_payload
+        self._dirty_bytes = dirty_bytes
+
+    @property
+    def fragmented_payload(self) -> typing.Sequence[memoryview]:
+        """
+        The serialized representation, same as returned by :func:`pyuavcan.dsdl.serialize`.
+        Raises :class:`ValueError` if the lease is already released.
+        """
+        if self._fragmented_payload is None:
+            raise ValueError(f"{self} is already released")
+        return self._fragmented_payload
+
+    def __repr__(self) -> str:
+        if self._fragmented_payload is None:
+            return f"{type(self).__name__}(released)"
+        return f"{type(self).__name__}({'+'.join(f'{len(x)}B' for x in self._fragmented_payload)})"
+
+
+class SerializationBufferPool:
+    """
+    Each invocation of :func:`pyuavcan.dsdl.serialize` allocates a new zero-filled buffer large enough to
+    accommodate the largest possible serialized representation of the type (i.e., the extent),
+    which may be kilobytes even if the actual representation is only a few bytes long.
+    This class eliminates the allocation by recycling the buffers; it is intended for high-rate publishers.
+    Buffers are grouped into size classes of powers of two, so types of similar extent share the same buffers.
+
+    The pool does not need to know how the serialized representation is used.
+    Once the owner of a lease is done with it (e.g., the transport has returned from ``send()``),
+    it should invoke :meth:`release`. The buffer is returned to the pool only if nobody else retains
+    references to its memory at that moment; that is, the user of the fragments (like the transport)
+    signals that it is done with them simply by dropping the references. Otherwise, the buffer is
+    left to the garbage collector, so a premature release can never corrupt the data.
+
+    Instances are not thread-safe.
+
+    >>> pool = SerializationBufferPool()
+    >>> pool.size_class(1)
+    64
+    >>> pool.size_class(1000)
+    1024
+    >>> pool.size_class(1024)
+    2048
+    """
+
+    MIN_SIZE_CLASS_BYTES = 64
+
+    def __init__(self, max_idle_buffers_per_size_class: int = 4) -> None:
+        """
+        :param max_idle_buffers_per_size_class: Released buffers in excess of this limit are discarded.
+        """
+        self._max_idle = int(max_idle_buffers_per_size_class)
+        if self._max_idle < 0:
+            raise ValueError(f"Invalid idle buffer limit: {self._max_idle}")
+        self._idle: typing.Dict[int, typing.List[bytearray]] = {}
+        self._statistics = SerializationBufferPoolStatistics()
+
+    def serialize(self, obj: CompositeObject) -> SerializedRepresentationLease:
+        """
+        Like :func:`pyuavcan.dsdl.serialize`, but the serialized representation is stored in a pooled buffer.
+        """
+        capacity = obj._EXTENT_BYTES_  # pylint: disable=protected-access
+        storage = self._acquire(self.size_class(capacity))
+        ser = _serialized_representation.Serializer.new_in_buffer(numpy.frombuffer(memoryview(storage), numpy.uint8))
+        obj._serialize_(ser)  # pylint: disable=protected-access
+        # The serializer may touch one extra byte past the end when writing unaligned values.
+        dirty = (ser.current_bit_length + 7) // 8 + 1
+        return SerializedRepresentationLease(storage, tuple(ser.fragmented_buffer), dirty)
+
+    def release(self, lease: SerializedRepresentationLease) -> bool:
+        """
+        Invalidates the lease and attempts to return its buffer to the pool.
+        The caller shall drop all references to the fragments before invoking this method.
+        Returns True if the buffer is going to be reused, False if it is left to the garbage collector.
+        Repeated invocations have no effect and return False.
+        """
+        storage, lease._storage = lease._storage, None  # pylint: disable=protected-access
+        lease._fragmented_payload = None  # pylint: disable=protected-access
+        if storage is None:
+            return False
+        idle = self._idle.setdefault(len(storage), [])
+        if len(idle) >= self._max_idle or not _is_exclusively_owned(storage):
+            self._statistics.discarded += 1
+            return False
+        dirty = lease._dirty_bytes  # pylint: disable=protected-access
+        storage[:dirty] = bytes(dirty)  # The serializer relies on the buffer being zero-filled.
+        idle.append(storage)
+        self._statistics.recycled += 1
+        return True
+
+    def size_class(self, capacity_bytes: int) -> int:
+        """
+        The size of the buffer used for a serialized representation of the specified maximum size.
+        The result exceeds the capacity because the serializer requires an extra byte at the end.
+        """
+        out = self.MIN_SIZE_CLASS_BYTES
+        while out <= capacity_bytes:
+            out <<= 1
+        return out
+
+    def sample_statistics(self) -> SerializationBufferPoolStatistics:
+        return dataclasses.replace(self._statistics)
+
+    def _acquire(self, size: int) -> bytearray:
+        self._statistics.acquired += 1
+        try:
+            return self._idle[size].pop()
+        except (KeyError, IndexError):
+            self._statistics.allocated += 1
+            return bytearray(size)
+
+    def __repr__(self) -> str:
+        idle = {k: len(v) for k, v in self._idle.items() if v}
+        return f"{type(self).__name__}(idle={idle}, statistics={self._statistics})"
+
+
+def _is_exclusively_owned(storage: bytearray) -> bool:
+    """
+    A bytearray cannot be resized while its buffer is exported (e.g., to a memoryview or a NumPy array),
+    which allows us to detect whether anyone still references the memory.
+    """
+    try:
+        storage.append(0)
+    except BufferError:
+        return False
+    storage.pop()
+    return True
+
+
+def _unittest_buffer_pool() -> None:
+    from pytest import raises
+    from ._composite_object import deserialize
+
+    class Blob(CompositeObject):
+        _EXTENT_BYTES_ = 100
+
+        def __init__(self, data: bytes) -> None:
+            self.data = data
+
+        def _serialize_(self, _ser_: _serialized_representation.Serializer) -> None:
+            _ser_.add_unaligned_bit(True)  # Misalign to make sure the extra byte is cleaned up.
+            _ser_.add_unaligned_bytes(numpy.frombuffer(self.data, numpy.uint8))
+            _ser_.skip_bits(7)
+
+        @staticmethod
+        def _deserialize_(_des_: _serialized_representation.Deserializer) -> Blob:
+            assert _des_.fetch_unaligned_bit()
+            out = Blob(_des_.fetch_unaligned_bytes(_des_.remaining_bit_length // 8).tobytes())
+            _des_.skip_bits(7)
+            return out
+
+    pool = SerializationBufferPool(max_idle_buffers_per_size_class=1)
+    with raises(ValueError):
+        SerializationBufferPool(-1)
+
+    lease = pool.serialize(Blob(b"\xFF\xFF"))
+    assert bytes(lease.fragmented_payload[0]) == b"\xFF\xFF\x01"
+    restored = deserialize(Blob, lease.fragmented_payload)
+    assert restored is not None and restored.data == b"\xFF\xFF"
+    assert pool.release(lease)
+    assert not pool.release(lease)
+    with raises(ValueError):
+        print(lease.fragmented_payload)
+    assert pool.sample_statistics() == SerializationBufferPoolStatistics(acquired=1, allocated=1, recycled=1)
+
+    # The recycled buffer is reused and it is clean.
+    lease = pool.serialize(Blob(b"\x00"))
+    assert bytes(lease.fragmented_payload[0]) == b"\x01\x00"
+    restored = deserialize(Blob, lease.fragmented_payload)
+    assert restored is not None and restored.data == b"\x00"
+    assert pool.sample_statistics().allocated == 1
+
+    # Retained fragments prevent recycling.
+    retained = lease.fragmented_payload
+    assert not pool.release(lease)
+    assert bytes(retained[0]) == b"\x01\x00"
+    del retained
+    assert pool.sample_statistics() == SerializationBufferPoolStatistics(
+        acquired=2, allocated=1, recycled=1, discarded=1
+    )
+
+    # The pool is full.
+    a, b = pool.serialize(Blob(b"")), pool.serialize(Blob(b""))
+    assert pool.release(a)
+    assert not pool.release(b)
+    print(pool, a)
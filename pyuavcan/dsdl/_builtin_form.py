@@ -2,14 +2,17 @@
 # This software is distributed under the terms of the MIT License.
 # Author: Pavel Kirienko <pavel@uavcan.org>
 
+from __future__ import annotations
 import typing
 
 import numpy
-import pydsdl
 
 from ._composite_object import CompositeObject, get_model, get_attribute, set_attribute, get_class
 from ._composite_object import CompositeObjectTypeVar
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pydsdl
+
 
 def to_builtin(obj: CompositeObject) -> typing.Dict[str, typing.Any]:
     """
@@ -46,6 +49,8 @@ def to_builtin(obj: CompositeObject) -> typing.Dict[str, typing.Any]:
 def _to_builtin_impl(
     obj: typing.Union[CompositeObject, numpy.ndarray, str, bool, int, float], model: pydsdl.SerializableType
 ) -> typing.Union[typing.Dict[str, typing.Any], typing.List[typing.Any], str, bool, int, float]:
+    import pydsdl  # Not imported at the module level because it takes a long time to import.
+
     if isinstance(model, pydsdl.CompositeType):
         assert isinstance(obj, CompositeObject)
         return {
@@ -132,6 +137,8 @@ def update_from_builtin(destination: CompositeObjectTypeVar, source: typing.Any)
     if not isinstance(destination, CompositeObject):  # pragma: no cover
         raise TypeError(f"Bad destination: expected a CompositeObject, got {type(destination).__name__}")
 
+    import pydsdl  # Not imported at the module level because it takes a long time to import.
+
     model = get_model(destination)
     _raise_if_service_type(model)
 
@@ -172,6 +179,8 @@ def update_from_builtin(destination: CompositeObjectTypeVar, source: typing.Any)
 
 
 def _raise_if_service_type(model: pydsdl.SerializableType) -> None:
+    import pydsdl  # Not imported at the module level because it takes a long time to import.
+
     if isinstance(model, pydsdl.ServiceType):  # pragma: no cover
         raise TypeError(
             f"Built-in form is not defined for service types. "
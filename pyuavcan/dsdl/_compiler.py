@@ -2,22 +2,29 @@
 # This software is distributed under the terms of the MIT License.
 # Author: Pavel Kirienko <pavel@uavcan.org>
 
+from __future__ import annotations
 import os
 import sys
 import time
 import gzip
 import typing
 import pickle
+import struct
+import shutil
+import hashlib
 import base64
 import pathlib
+import tempfile
 import logging
 import itertools
 import dataclasses
+import concurrent.futures
 
 import pydsdl
 import nunavut
 import nunavut.jinja
 import nunavut.postprocessors
+import nunavut.version
 
 
 _AnyPath = typing.Union[str, pathlib.Path]
@@ -29,6 +36,16 @@ _OUTPUT_FILE_PERMISSIONS = 0o444
 Read-only for all because the files are autogenerated and should not be edited manually.
 """
 
+_NAMESPACE_TEMPLATE_NAME = "Namespace.j2"
+
+_MANIFEST_FILE_SUFFIX = ".pyuavcan_dsdl_manifest"
+"""
+The generation manifest is stored in the output directory in a hidden file named after the root namespace.
+Removing the manifest forces complete regeneration of the package on the next invocation.
+"""
+
+_DSDL_FILE_GLOB = "*.uavcan"
+
 _logger = logging.getLogger(__name__)
 
 
@@ -57,6 +74,7 @@ def generate_package(
     lookup_directories: typing.Optional[typing.List[_AnyPath]] = None,
     output_directory: typing.Optional[_AnyPath] = None,
     allow_unregulated_fixed_port_id: bool = False,
+    jobs: typing.Optional[int] = 1,
 ) -> typing.Optional[GeneratedPackageInfo]:
     """
     This function runs the DSDL compiler, converting a specified DSDL root namespace into a Python package.
@@ -100,6 +118,12 @@ def generate_package(
     :data:`pyuavcan.__version__` in ``output_directory``, so that the generated package cache is
     invalidated automatically when a different version of the library is used.
 
+    The generator stores a manifest with the digests of the source definitions in a hidden file in the output
+    directory. If none of the definitions (including those in the lookup directories) have changed since the last
+    invocation, the function returns immediately without reading the namespace. Otherwise, only the types whose
+    definitions have changed, along with the types that depend on them, are regenerated, unless the set of types
+    has changed, in which case the entire package is regenerated. Removal of the manifest forces regeneration.
+
     Having generated a package, consider updating the include path set of your Python IDE to take advantage
     of code completion and static type checking.
 
@@ -130,6 +154,12 @@ def generate_package(
         data types with fixed port-ID. If you are not sure what it means, do not use it, and read the UAVCAN
         specification first. The default is False.
 
+    :param jobs: The number of worker processes used for rendering the generated modules.
+        If None, the number of CPU cores is used. The default is 1, meaning that no worker processes are started.
+        The output is the same regardless of the number of jobs.
+        Different root namespaces can be generated concurrently by invoking this function from separate processes,
+        which also parallelizes the reading of the DSDL definitions.
+
     :return: An instance of :class:`GeneratedPackageInfo` describing the generated package,
         unless the root namespace is empty, in which case it's None.
 
@@ -179,6 +209,10 @@ def generate_package(
     """
     started_at = time.monotonic()
 
+    jobs = int(jobs if jobs is not None else (os.cpu_count() or 1))
+    if jobs < 1:
+        raise ValueError(f"Invalid number of jobs: {jobs}")
+
     if isinstance(lookup_directories, (str, bytes, pathlib.Path)):
         # https://forum.uavcan.org/t/nestedrootnamespaceerror-in-basic-usage-demo/794
         raise TypeError(f"Lookup directories shall be an iterable of paths, not {type(lookup_directories).__name__}")
@@ -192,37 +226,161 @@ def generate_package(
             "Consider specifying a different output directory instead."
         )
 
-    # Read the DSDL definitions
-    composite_types = pydsdl.read_namespace(
-        root_namespace_directory=str(root_namespace_directory),
-        lookup_directories=list(map(str, lookup_directories or [])),
-        allow_unregulated_fixed_port_id=allow_unregulated_fixed_port_id,
+    # Skip everything if nothing has changed since the last invocation
+    lookup_directory_paths = [pathlib.Path(x).resolve() for x in (lookup_directories or [])]
+    manifest_file = output_directory / f".{root_namespace_directory.name}{_MANIFEST_FILE_SUFFIX}"
+    manifest = _GenerationManifest.load(manifest_file)
+    fingerprint = _compute_generator_fingerprint(lookup_directory_paths, allow_unregulated_fixed_port_id)
+    source_digests = _digest_sources([root_namespace_directory] + lookup_directory_paths)
+    root_namespace_name: str
+    if (
+        manifest is not None
+        and manifest.fingerprint == fingerprint
+        and manifest.source_digests == source_digests
+        and (output_directory / manifest.package_name / "__init__.py").is_file()
+    ):
+        _logger.info(
+            "Generated package %r is up to date with the root namespace %r (%d types), checked in %.1f seconds",
+            manifest.package_name,
+            str(root_namespace_directory),
+            len(manifest.models),
+            time.monotonic() - started_at,
+        )
+        composite_types = list(manifest.models)
+        root_namespace_name = manifest.package_name
+    else:
+        # Read the DSDL definitions
+        composite_types = pydsdl.read_namespace(
+            root_namespace_directory=str(root_namespace_directory),
+            lookup_directories=list(map(str, lookup_directory_paths)),
+            allow_unregulated_fixed_port_id=allow_unregulated_fixed_port_id,
+        )
+        if not composite_types:
+            _logger.info("Root namespace directory %r does not contain DSDL definitions", root_namespace_directory)
+            return None
+        (root_namespace_name,) = set(map(lambda x: x.root_namespace, composite_types))
+        _logger.info("Read %d definitions from root namespace %r", len(composite_types), root_namespace_name)
+
+        # Only the types affected by the changes need to be regenerated if the previous output is compatible
+        stale_types: typing.Optional[typing.List[pydsdl.CompositeType]] = None
+        if (
+            manifest is not None
+            and manifest.fingerprint == fingerprint
+            and manifest.package_name == root_namespace_name
+            and _type_names(manifest.models) == _type_names(composite_types)
+            and (output_directory / root_namespace_name / "__init__.py").is_file()
+        ):
+            changed = {k for k, v in source_digests.items() if manifest.source_digests.get(k) != v}
+            stale_types = [t for t in composite_types if _get_dependency_sources(t) & changed]
+            _logger.info("%d of %d types are affected by the changes", len(stale_types), len(composite_types))
+
+        if stale_types is None or stale_types:
+            _generate_code(
+                composite_types if stale_types is None else stale_types,
+                root_namespace_directory,
+                output_directory,
+                generate_namespace_types=stale_types is None,
+                jobs=jobs,
+            )
+        _logger.info(
+            "Generated %d types from the root namespace %r in %.1f seconds",
+            len(composite_types if stale_types is None else stale_types),
+            root_namespace_name,
+            time.monotonic() - started_at,
+        )
+        _GenerationManifest(
+            fingerprint=fingerprint,
+            source_digests=source_digests,
+            package_name=root_namespace_name,
+            models=composite_types,
+        ).store(manifest_file)
+
+    # A minor UX improvement; see https://github.com/UAVCAN/pyuavcan/issues/115
+    for p in sys.path:
+        if pathlib.Path(p).resolve() == pathlib.Path(output_directory):
+            break
+    else:
+        if os.name == "nt":
+            quick_fix = f'Quick fix: `$env:PYTHONPATH += ";{output_directory.resolve()}"`'
+        elif os.name == "posix":
+            quick_fix = f'Quick fix: `export PYTHONPATH="{output_directory.resolve()}"`'
+        else:
+            quick_fix = "Quick fix is not available for this OS."
+        _logger.info(
+            "Generated package is stored in %r, which is not in Python module search path list. "
+            "The package will fail to import unless you add the destination directory to sys.path or PYTHONPATH. %s",
+            str(output_directory),
+            quick_fix,
+        )
+
+    return GeneratedPackageInfo(
+        path=pathlib.Path(output_directory) / pathlib.Path(root_namespace_name),
+        models=composite_types,
+        name=root_namespace_name,
     )
-    if not composite_types:
-        _logger.info("Root namespace directory %r does not contain DSDL definitions", root_namespace_directory)
-        return None
-    (root_namespace_name,) = set(map(lambda x: x.root_namespace, composite_types))  # type: str,
-    _logger.info("Read %d definitions from root namespace %r", len(composite_types), root_namespace_name)
 
+
+def _generate_code(
+    types: typing.List[pydsdl.CompositeType],
+    root_namespace_directory: pathlib.Path,
+    output_directory: pathlib.Path,
+    generate_namespace_types: bool,
+    jobs: int,
+) -> None:
+    jobs = min(jobs, len(types))
+    if jobs <= 1:
+        _render(types, root_namespace_directory, output_directory, _TEMPLATE_DIRECTORY, generate_namespace_types)
+        return
+
+    # The modules are independent of each other, so the types are split between the workers arbitrarily.
+    # The namespace modules depend on the complete set of types, so they are rendered here while the workers are busy.
+    types = sorted(types, key=lambda t: (t.full_name, t.version.major, t.version.minor))
+    _logger.info("Rendering %d types using %d worker processes", len(types), jobs)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                _render,
+                types[index::jobs],
+                root_namespace_directory,
+                output_directory,
+                _TEMPLATE_DIRECTORY,
+                False,
+            )
+            for index in range(jobs)
+        ]
+        if generate_namespace_types:
+            _render_namespaces(types, root_namespace_directory, output_directory)
+        for f in futures:
+            f.result()  # Propagate the exceptions from the workers, if any.
+
+
+def _render(
+    types: typing.List[pydsdl.CompositeType],
+    root_namespace_directory: pathlib.Path,
+    output_directory: pathlib.Path,
+    templates_directory: pathlib.Path,
+    generate_namespace_types: bool,
+) -> None:
     # Template primitives
     filters = {
         "pickle": _pickle_object,
         "numpy_scalar_type": _numpy_scalar_type,
+        "fixed_layout_groups": _fixed_layout_groups,
+        "static_prefix_fields": _static_prefix_fields,
     }
 
     # Generate code
-    assert isinstance(output_directory, pathlib.Path)
     language_context = nunavut.lang.LanguageContext("py", namespace_output_stem="__init__")
     root_ns = nunavut.build_namespace_tree(
-        types=composite_types,
+        types=types,
         root_namespace_dir=str(root_namespace_directory),
         output_dir=str(output_directory),
         language_context=language_context,
     )
     generator = nunavut.jinja.DSDLCodeGenerator(
         namespace=root_ns,
-        generate_namespace_types=nunavut.YesNoDefault.YES,
-        templates_dir=_TEMPLATE_DIRECTORY,
+        generate_namespace_types=nunavut.YesNoDefault.YES if generate_namespace_types else nunavut.YesNoDefault.NO,
+        templates_dir=templates_directory,
         followlinks=True,
         additional_filters=filters,
         post_processors=[
@@ -232,36 +390,117 @@ def generate_package(
         ],
     )
     generator.generate_all()
-    _logger.info(
-        "Generated %d types from the root namespace %r in %.1f seconds",
-        len(composite_types),
-        root_namespace_name,
-        time.monotonic() - started_at,
-    )
 
-    # A minor UX improvement; see https://github.com/UAVCAN/pyuavcan/issues/115
-    for p in sys.path:
-        if pathlib.Path(p).resolve() == pathlib.Path(output_directory):
-            break
-    else:
-        if os.name == "nt":
-            quick_fix = f'Quick fix: `$env:PYTHONPATH += ";{output_directory.resolve()}"`'
-        elif os.name == "posix":
-            quick_fix = f'Quick fix: `export PYTHONPATH="{output_directory.resolve()}"`'
-        else:
-            quick_fix = "Quick fix is not available for this OS."
-        _logger.info(
-            "Generated package is stored in %r, which is not in Python module search path list. "
-            "The package will fail to import unless you add the destination directory to sys.path or PYTHONPATH. %s",
-            str(output_directory),
-            quick_fix,
-        )
 
-    return GeneratedPackageInfo(
-        path=pathlib.Path(output_directory) / pathlib.Path(root_namespace_name),
-        models=composite_types,
-        name=root_namespace_name,
-    )
+def _render_namespaces(
+    types: typing.List[pydsdl.CompositeType],
+    root_namespace_directory: pathlib.Path,
+    output_directory: pathlib.Path,
+) -> None:
+    """
+    Nunavut cannot render the namespace modules without rendering the types, so we render the complete package
+    into a temporary directory using empty templates for the types, and then move only the namespace modules
+    into the output directory.
+    """
+    output_directory.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix=".", dir=output_directory) as tmp:
+        templates_directory = pathlib.Path(tmp, "templates")
+        templates_directory.mkdir()
+        for p in _TEMPLATE_DIRECTORY.glob("*Type.j2"):
+            (templates_directory / p.name).write_text("")
+        shutil.copy(_TEMPLATE_DIRECTORY / _NAMESPACE_TEMPLATE_NAME, templates_directory)
+        render_directory = pathlib.Path(tmp, "output")
+        _render(types, root_namespace_directory, render_directory, templates_directory, True)
+        for src in render_directory.rglob("__init__.py"):
+            dst = output_directory / src.relative_to(render_directory)
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            if dst.exists():
+                dst.chmod(0o644)  # The generated files are read-only, which prevents replacement on some platforms.
+            os.replace(src, dst)
+        for p in render_directory.rglob("*"):
+            if p.is_file():
+                p.chmod(0o644)  # Allow cleanup on all platforms.
+
+
+@dataclasses.dataclass(frozen=True)
+class _GenerationManifest:
+    """
+    Stored in the output directory next to the generated package to avoid regenerating it needlessly.
+    The models are stored to avoid re-reading the namespace if nothing has changed.
+    """
+
+    fingerprint: str
+    """Digest of everything that affects the generated code except the DSDL definitions."""
+
+    source_digests: typing.Dict[str, str]
+    """Path of every DSDL definition in the root namespace and the lookup directories mapped to its digest."""
+
+    package_name: str
+    models: typing.Sequence[pydsdl.CompositeType]
+
+    @staticmethod
+    def load(path: pathlib.Path) -> typing.Optional[_GenerationManifest]:
+        try:
+            with open(path, "rb") as f:
+                out = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:  # Corrupted or produced by an incompatible version of the library; regenerate.
+            _logger.info("Ignoring invalid generation manifest %r: %s", str(path), ex)
+            return None
+        return out if isinstance(out, _GenerationManifest) else None
+
+    def store(self, path: pathlib.Path) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(self, f, protocol=4)
+        os.replace(tmp, path)  # Atomic replacement to avoid leaving a truncated manifest behind.
+
+
+def _compute_generator_fingerprint(lookup_directories: typing.List[pathlib.Path], allow_unregulated: bool) -> str:
+    h = hashlib.sha256()
+    config = pydsdl.__version__, nunavut.version.__version__, list(map(str, lookup_directories)), allow_unregulated
+    h.update(repr(config).encode())
+    # The generated code depends on the templates and on the filters defined in this file.
+    for p in [pathlib.Path(__file__)] + sorted(_TEMPLATE_DIRECTORY.glob("*")):
+        h.update(p.name.encode())
+        h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+def _digest_sources(root_namespace_directories: typing.Iterable[pathlib.Path]) -> typing.Dict[str, str]:
+    out: typing.Dict[str, str] = {}
+    for d in root_namespace_directories:
+        for p in sorted(d.rglob(_DSDL_FILE_GLOB)):
+            out[str(p.resolve())] = hashlib.sha256(p.read_bytes()).hexdigest()
+    return out
+
+
+def _type_names(types: typing.Iterable[pydsdl.CompositeType]) -> typing.Set[typing.Tuple[str, int, int]]:
+    return {(t.full_name, t.version.major, t.version.minor) for t in types}
+
+
+def _get_dependency_sources(t: pydsdl.CompositeType) -> typing.Set[str]:
+    """
+    Paths of the definitions of the type itself and of all types it depends on directly or indirectly.
+    The generated code embeds information about the dependencies (e.g., their models and bit length sets),
+    so a type has to be regenerated whenever any of its dependencies is changed.
+    """
+    out: typing.Set[str] = set()
+
+    def visit(ty: pydsdl.SerializableType) -> None:
+        if isinstance(ty, pydsdl.ArrayType):
+            visit(ty.element_type)
+        elif isinstance(ty, pydsdl.CompositeType):
+            ty = ty.inner_type
+            key = str(pathlib.Path(ty.source_file_path).resolve())
+            if key not in out:
+                out.add(key)
+                for f in ty.fields:
+                    visit(f.data_type)
+
+    visit(t)
+    return out
 
 
 def _pickle_object(x: typing.Any) -> str:
@@ -287,3 +526,107 @@ def _numpy_scalar_type(t: pydsdl.Any) -> str:
         return f"_np_.float{pick_width(t.bit_length)}"
     assert not isinstance(t, pydsdl.PrimitiveType), "Forgot to handle some primitive types"
     return f"_np_.object_"
+
+
+@dataclasses.dataclass(frozen=True)
+class _FieldGroup:
+    """
+    A sequence of adjacent fields of a structure type. If ``struct_format`` is not None, the fields are all
+    byte-aligned and of standard bit length (or padding of an integer number of bytes), which allows the
+    generated code to (de)serialize the entire group at once using a precomputed :class:`struct.Struct`
+    instead of per-field Serializer/Deserializer calls.
+    """
+
+    name: str
+    """Name of the class attribute holding the :class:`struct.Struct` instance; empty if not applicable."""
+
+    struct_format: typing.Optional[str]
+    fields: typing.List[typing.Tuple[pydsdl.Field, pydsdl.BitLengthSet]]
+
+    @property
+    def value_fields(self) -> typing.List[pydsdl.Field]:
+        return [f for f, _ in self.fields if not isinstance(f, pydsdl.PaddingField)]
+
+    @property
+    def numpy_layout(self) -> typing.List[typing.Tuple[pydsdl.Field, str, int]]:
+        """
+        For each value field: the field, its little-endian NumPy scalar format, and its byte offset within the group.
+        This is used to construct a NumPy structured dtype for columnar (de)serialization.
+        """
+        assert self.struct_format
+        out: typing.List[typing.Tuple[pydsdl.Field, str, int]] = []
+        origin = min(self.fields[0][1])
+        for f, offset in self.fields:
+            if not isinstance(f, pydsdl.PaddingField):
+                kind = "f" if isinstance(f.data_type, pydsdl.FloatType) else "i"
+                if isinstance(f.data_type, pydsdl.UnsignedIntegerType):
+                    kind = "u"
+                out.append((f, f"<{kind}{f.data_type.bit_length // 8}", (min(offset) - origin) // 8))
+        return out
+
+    @property
+    def byte_size(self) -> int:
+        assert self.struct_format
+        return struct.calcsize(self.struct_format)
+
+
+def _fixed_layout_groups(t: pydsdl.StructureType) -> typing.List[_FieldGroup]:
+    """
+    Splits the fields of the structure into groups that can be handled by the fast fixed-layout path and
+    the remaining fields that have to be handled by the generic Serializer/Deserializer calls.
+    The fast path is applicable to a field if its offset is byte-aligned for every possible layout of the
+    preceding fields and its type is either a standard-bit-length scalar or a byte-sized padding field.
+    """
+
+    def struct_code(f: pydsdl.Field, offset: pydsdl.BitLengthSet) -> typing.Optional[str]:
+        ty = f.data_type
+        if not offset.is_aligned_at_byte():
+            return None
+        if isinstance(ty, pydsdl.VoidType):
+            return f"{ty.bit_length // 8}x" if ty.bit_length % 8 == 0 else None
+        if isinstance(ty, pydsdl.IntegerType) and ty.standard_bit_length:
+            code = {8: "b", 16: "h", 32: "i", 64: "q"}[ty.bit_length]
+            return code if isinstance(ty, pydsdl.SignedIntegerType) else code.upper()
+        if isinstance(ty, pydsdl.FloatType):
+            return {16: "e", 32: "f", 64: "d"}[ty.bit_length]
+        return None
+
+    out: typing.List[_FieldGroup] = []
+    codes: typing.List[str] = []
+    run: typing.List[typing.Tuple[pydsdl.Field, pydsdl.BitLengthSet]] = []
+
+    def flush() -> None:
+        if run:
+            if any(not isinstance(f, pydsdl.PaddingField) for f, _ in run):
+                out.append(_FieldGroup(f"_FIXED_LAYOUT_{len(out)}_", "<" + "".join(codes), run.copy()))
+            else:  # Padding alone is handled by skipping bits, no need to pack anything.
+                out.append(_FieldGroup("", None, run.copy()))
+        codes.clear()
+        run.clear()
+
+    for field, offset in t.iterate_fields_with_offsets(pydsdl.BitLengthSet(0)):
+        code = struct_code(field, offset)
+        if code is None:
+            flush()
+            out.append(_FieldGroup("", None, [(field, offset)]))
+        else:
+            codes.append(code)
+            run.append((field, offset))
+    flush()
+    assert sum(len(g.fields) for g in out) == len(t.fields)
+    return out
+
+
+def _static_prefix_fields(t: pydsdl.StructureType) -> typing.List[typing.Tuple[pydsdl.Field, pydsdl.BitLengthSet]]:
+    """
+    The non-padding fields whose offset does not depend on the values of the preceding fields,
+    which allows the generated code to decode them individually without parsing the preceding fields.
+    The static prefix ends at the first field that follows a variable-length entity.
+    """
+    out: typing.List[typing.Tuple[pydsdl.Field, pydsdl.BitLengthSet]] = []
+    for field, offset in t.iterate_fields_with_offsets(pydsdl.BitLengthSet(0)):
+        if len(offset) != 1:
+            break
+        if not isinstance(field, pydsdl.PaddingField):
+            out.append((field, offset))
+    return out
@@ -11,10 +11,13 @@ import base64
 import logging
 import importlib
 
-import pydsdl
+import numpy
 
 from . import _serialized_representation
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pydsdl
+
 
 _logger = logging.getLogger(__name__)
 
@@ -26,11 +29,21 @@ class CompositeObject(abc.ABC):  # Members are surrounded with underscores to av
     """
 
     _MODEL_: pydsdl.CompositeType
-    """Type definition as provided by PyDSDL."""
+    """
+    Type definition as provided by PyDSDL.
+    In generated classes, it is restored from its serialized form lazily on first access to reduce the import time.
+    """
 
     _EXTENT_BYTES_: int
     """Defined in generated classes."""
 
+    _STATIC_PREFIX_FIELDS_: typing.Mapping[str, int] = {}
+    """
+    Maps the names of the fields whose offset does not depend on the values of the preceding fields
+    to their offset in bits. Defined in generated structure types; empty for unions.
+    See :class:`pyuavcan.dsdl.LazyView`.
+    """
+
     @abc.abstractmethod
     def _serialize_(self, _ser_: _serialized_representation.Serializer) -> None:
         """
@@ -51,6 +64,16 @@ class CompositeObject(abc.ABC):  # Members are surrounded with underscores to av
         """
         raise NotImplementedError
 
+    @staticmethod
+    def _deserialize_static_prefix_field_(_des_: _serialized_representation.Deserializer, _name_: str) -> typing.Any:
+        """
+        Auto-generated method that decodes the specified field of the static prefix only.
+        The Deserializer shall be positioned at the beginning of the object.
+        Raises a LookupError if there is no such field in the static prefix (see ``_STATIC_PREFIX_FIELDS_``).
+        This is not a part of the API.
+        """
+        raise LookupError(_name_)
+
     @staticmethod
     def _restore_constant_(encoded_string: str) -> object:
         """Recovers a pickled gzipped constant object from base85 string representation."""
@@ -58,11 +81,32 @@ class CompositeObject(abc.ABC):  # Members are surrounded with underscores to av
         assert isinstance(out, object)
         return out
 
+    @staticmethod
+    def _restore_constant_lazily_(encoded_string: str) -> typing.Any:
+        """
+        Like :meth:`_restore_constant_`, but the constant is restored on first access rather than immediately.
+        The returned object is a descriptor; it shall be assigned to a class attribute.
+        """
+        return _LazyConstant(encoded_string)
+
     # These typing hints are provided here for use in the generated classes. They are obviously not part of the API.
     _SerializerTypeVar_ = typing.TypeVar("_SerializerTypeVar_", bound=_serialized_representation.Serializer)
     _DeserializerTypeVar_ = typing.TypeVar("_DeserializerTypeVar_", bound=_serialized_representation.Deserializer)
 
 
+class _LazyConstant:
+    def __init__(self, encoded_string: str) -> None:
+        self._encoded_string: typing.Optional[str] = encoded_string
+        self._value: typing.Any = None
+
+    def __get__(self, instance: typing.Any, owner: typing.Any) -> typing.Any:
+        if self._encoded_string is not None:
+            # The value is assigned before the source is dropped, so a concurrent access cannot observe None.
+            self._value = CompositeObject._restore_constant_(self._encoded_string)
+            self._encoded_string = None
+        return self._value
+
+
 class ServiceObject(CompositeObject):
     """
     This is the base class for all Python classes generated from DSDL service type definitions.
@@ -98,6 +142,13 @@ class FixedPortObject(abc.ABC):
 
     _FIXED_PORT_ID_: int
 
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        port_id = cls.__dict__.get("_FIXED_PORT_ID_")
+        if port_id is not None:  # Intermediate base classes do not define the port-ID.
+            key = issubclass(cls, ServiceObject), int(port_id)
+            _fixed_port_registry.setdefault(key, []).append(cls)
+
 
 class FixedPortCompositeObject(CompositeObject, FixedPortObject):
     @abc.abstractmethod
@@ -116,6 +167,16 @@ class FixedPortServiceObject(ServiceObject, FixedPortObject):
 
 CompositeObjectTypeVar = typing.TypeVar("CompositeObjectTypeVar", bound=CompositeObject)
 
+_fixed_port_registry: typing.Dict[typing.Tuple[bool, int], typing.List[typing.Type[FixedPortObject]]] = {}
+"""Populated automatically when the generated classes are defined, i.e., when their modules are imported."""
+
+_class_cache: typing.Dict[
+    typing.Tuple[str, int, int], typing.Tuple[pydsdl.CompositeType, typing.Type[CompositeObject]]
+] = {}
+"""Maps the full name and version to the class that has been found for the specified model by :func:`get_class`."""
+
+_SERIALIZE_MANY_INITIAL_CAPACITY_BYTES = 64 * 1024
+
 
 def serialize(obj: CompositeObject) -> typing.Iterable[memoryview]:
     """
@@ -126,11 +187,14 @@ def serialize(obj: CompositeObject) -> typing.Iterable[memoryview]:
     The objective of this model is to avoid copying data into a temporary buffer when possible.
     Each yielded fragment is of type :class:`memoryview` pointing to raw unsigned bytes.
     It is guaranteed that at least one fragment is always returned (which may be empty).
+
+    Large byte-aligned arrays (e.g., file chunks or images) are not copied; instead, the corresponding fragments
+    refer to the memory of the arrays stored in the object directly.
+    Therefore, the object should not be mutated while the serialized representation is in use.
     """
-    # TODO: update the Serializer class to emit an iterable of fragments.
     ser = _serialized_representation.Serializer.new(obj._EXTENT_BYTES_)  # pylint: disable=protected-access
     obj._serialize_(ser)  # pylint: disable=protected-access
-    yield ser.buffer.data
+    yield from ser.fragmented_buffer
 
 
 def deserialize(
@@ -158,11 +222,167 @@ def deserialize(
         return None
 
 
+def serialize_many(objects: typing.Iterable[CompositeObject]) -> typing.List[memoryview]:
+    """
+    Like :func:`serialize`, but serializes a batch of objects (possibly of different types) into one contiguous
+    buffer. The result contains one fragment per object, in the same order; each fragment is a read-only
+    slice of the shared buffer, so the buffer is kept alive for as long as any of the fragments is referenced.
+
+    This is intended for bulk processing, such as log generation, where allocating a separate buffer per object
+    would dominate the cost.
+
+    >>> from pyuavcan.dsdl import serialize_many
+    >>> serialize_many([])
+    []
+    """
+    ser: typing.Optional[_serialized_representation.Serializer] = None
+    capacity = 0
+    offsets = [0]
+    for obj in objects:
+        extent = obj._EXTENT_BYTES_  # pylint: disable=protected-access
+        used = offsets[-1]
+        if ser is None or capacity - used < extent:
+            # The first allocation is sized for a few objects; afterwards, the capacity is doubled as needed.
+            capacity = max(capacity * 2, used + extent, _SERIALIZE_MANY_INITIAL_CAPACITY_BYTES)
+            new = _serialized_representation.Serializer.new(capacity)
+            if ser is not None:
+                new.add_aligned_bytes(ser.buffer)
+            ser = new
+        assert ser.current_bit_length == used * 8
+        nested = ser.fork_bytes(extent)
+        obj._serialize_(nested)  # pylint: disable=protected-access
+        assert nested.current_bit_length % 8 == 0
+        ser.skip_bits(nested.current_bit_length)
+        offsets.append(ser.current_bit_length // 8)
+    if ser is None:
+        return []
+    buf = ser.buffer.data
+    return [buf[a:b] for a, b in zip(offsets, offsets[1:])]
+
+
+def deserialize_many(
+    dtype: typing.Type[CompositeObjectTypeVar],
+    fragmented_serialized_representations: typing.Iterable[typing.Sequence[memoryview]],
+) -> typing.List[typing.Optional[CompositeObjectTypeVar]]:
+    """
+    Applies :func:`deserialize` to each of the serialized representations.
+    Invalid representations are represented by None in the output, the same as with :func:`deserialize`.
+    For types with a fixed layout, consider :func:`deserialize_columns` instead, which is much faster.
+    """
+    return [deserialize(dtype, x) for x in fragmented_serialized_representations]
+
+
+def serialize_columns(
+    dtype: typing.Type[CompositeObject],
+    columns: typing.Union[numpy.ndarray, typing.Mapping[str, typing.Any]],
+) -> numpy.ndarray:
+    """
+    Vectorized serialization of N instances of a fixed-layout type represented in the columnar form.
+    A type has a fixed layout if it is a structure that consists only of byte-aligned integer and floating point
+    fields of the standard bit length (8, 16, 32, or 64 bits) and, optionally, padding fields.
+    Such types are common for telemetry messages.
+
+    :param dtype: The generated class of the fixed-layout type.
+
+    :param columns: Either a NumPy structured array or a mapping where the keys are the field names
+        (as they are named in the generated class, i.e., stropped if necessary) and the values are one-dimensional
+        array-like objects of equal length. Fields that are not specified are zero-initialized.
+
+    :return: A two-dimensional array of bytes of shape ``(N, size)``, one serialized representation per row.
+        The rows can be used with :func:`deserialize_columns` directly.
+
+    :raises: :class:`TypeError` if the type does not have a fixed layout;
+        :class:`ValueError` if the columns are of invalid shape, names, or contain out-of-range values.
+    """
+    layout = _get_fixed_layout_dtype(dtype)
+    names = list(columns.dtype.names or []) if isinstance(columns, numpy.ndarray) else list(columns.keys())
+    unknown = set(names) - set(layout.names)
+    if unknown:
+        raise ValueError(f"{dtype.__name__} has no such fields: {sorted(unknown)}")
+    arrays = {n: numpy.asarray(columns[n]) for n in names}
+    lengths = {len(x) for x in arrays.values() if x.ndim == 1}
+    if len(lengths) != 1 or any(x.ndim != 1 for x in arrays.values()):
+        raise ValueError(f"Columns shall be one-dimensional arrays of equal length; got lengths {lengths}")
+    (count,) = lengths
+    out = numpy.zeros(count, dtype=layout)
+    for name, arr in arrays.items():
+        field_dtype = layout.fields[name][0]
+        with numpy.errstate(over="ignore", invalid="ignore"):
+            converted = arr.astype(field_dtype)
+        if field_dtype.kind in "iu" and not numpy.array_equal(converted, arr):
+            raise ValueError(f"{name}: some of the values are outside of the range of {field_dtype}")
+        if field_dtype.kind == "f" and not numpy.array_equal(numpy.isfinite(converted), numpy.isfinite(arr)):
+            # Finite values that overflow the floating point field would silently turn into infinities.
+            raise ValueError(f"{name}: some of the values are outside of the range of {field_dtype}")
+        out[name] = converted
+    return out.view(numpy.uint8).reshape(count, layout.itemsize)
+
+
+def deserialize_columns(
+    dtype: typing.Type[CompositeObject],
+    fragmented_serialized_representations: typing.Union[numpy.ndarray, typing.Iterable[typing.Sequence[memoryview]]],
+) -> numpy.ndarray:
+    """
+    The inverse of :func:`serialize_columns`: decodes a stack of serialized representations of a fixed-layout type
+    into a NumPy structured array, where each field is accessible as a column (e.g., ``out["health"]``).
+    The implicit truncation and the implicit zero extension rules are applied to each representation.
+    Serialized representations of fixed-layout types are always valid, so unlike :func:`deserialize`,
+    this function never reports a deserialization error.
+
+    :param dtype: The generated class of the fixed-layout type.
+
+    :param fragmented_serialized_representations: Either an iterable of fragmented serialized representations
+        (same as accepted by :func:`deserialize`) or a two-dimensional array of bytes,
+        one serialized representation per row.
+
+    :raises: :class:`TypeError` if the type does not have a fixed layout.
+
+    >>> import numpy
+    >>> from pyuavcan.dsdl import deserialize_columns
+    >>> deserialize_columns(CompositeObject, numpy.zeros((0, 0), numpy.uint8))
+    Traceback (most recent call last):
+    ...
+    TypeError: CompositeObject does not have a fixed layout
+    """
+    layout = _get_fixed_layout_dtype(dtype)
+    size = layout.itemsize
+    if isinstance(fragmented_serialized_representations, numpy.ndarray):
+        src = fragmented_serialized_representations
+        if src.ndim != 2:
+            raise ValueError(f"Expected a two-dimensional array of bytes, got shape {src.shape}")
+        buf = numpy.zeros((src.shape[0], size), dtype=numpy.uint8)
+        width = min(size, src.shape[1])
+        buf[:, :width] = src[:, :width]
+    else:
+        rows = list(fragmented_serialized_representations)
+        buf = numpy.zeros((len(rows), size), dtype=numpy.uint8)
+        for index, fragments in enumerate(rows):
+            offset = 0
+            for frag in fragments:
+                n = min(len(frag), size - offset)
+                if n <= 0:
+                    break  # Implicit truncation
+                buf[index, offset : offset + n] = numpy.frombuffer(frag, dtype=numpy.uint8, count=n)
+                offset += n
+    return buf.view(layout).reshape(len(buf))
+
+
+def _get_fixed_layout_dtype(dtype: typing.Type[CompositeObject]) -> numpy.dtype:
+    try:
+        out = dtype._FIXED_LAYOUT_DTYPE_  # type: ignore  # pylint: disable=protected-access
+    except AttributeError:
+        raise TypeError(f"{dtype.__name__} does not have a fixed layout") from None
+    assert isinstance(out, numpy.dtype)
+    return out
+
+
 def get_model(class_or_instance: typing.Union[typing.Type[CompositeObject], CompositeObject]) -> pydsdl.CompositeType:
     """
     Obtains a PyDSDL model of the supplied DSDL-generated class or its instance.
     This is the inverse of :func:`get_class`.
     """
+    import pydsdl
+
     out = class_or_instance._MODEL_  # pylint: disable=protected-access
     assert isinstance(out, pydsdl.CompositeType)
     return out
@@ -183,8 +403,24 @@ def get_class(model: pydsdl.CompositeType) -> typing.Type[CompositeObject]:
           This error may occur if the DSDL source has changed since the type was generated.
           To fix this, regenerate the package and make sure that all components of the application use identical
           or compatible DSDL source files.
+
+    The result is cached by the name and version of the type, so repeated invocations are cheap
+    even if the model is re-read from the DSDL source and is therefore a distinct but equal object.
     """
+    key = model.full_name, model.version.major, model.version.minor
+    try:
+        cached_model, out = _class_cache[key]
+    except LookupError:
+        pass
+    else:
+        if cached_model is model or cached_model == model:
+            return out
+    out = _find_class(model)
+    _class_cache[key] = model, out
+    return out
+
 
+def _find_class(model: pydsdl.CompositeType) -> typing.Type[CompositeObject]:
     def do_import(name_components: typing.List[str]) -> typing.Any:
         mod = None
         for comp in name_components:
@@ -219,6 +455,31 @@ def get_class(model: pydsdl.CompositeType) -> typing.Type[CompositeObject]:
     return out
 
 
+def find_classes_by_fixed_port_id(port_id: int, service: bool) -> typing.List[typing.Type[FixedPortObject]]:
+    """
+    Returns the generated classes that have the specified fixed port-ID
+    (if service is True, only service types are considered, otherwise only message types).
+    This is an O(1) dictionary lookup intended for generic tools like bus monitors that need to find
+    the data type of a transfer by its port-ID.
+
+    Only the classes whose modules have already been imported are known to this function;
+    if the result is empty, the application may need to import the relevant generated packages first.
+    There may be more than one result if several versions of a data type share the same fixed port-ID;
+    the result is ordered by the time of import.
+
+    >>> import tests; tests.dsdl.generate_packages()  # DSDL package generation not shown in this example.
+    [...]
+    >>> import uavcan.node
+    >>> [c.__name__ for c in find_classes_by_fixed_port_id(7509, service=False)]
+    ['Heartbeat_1_0']
+    >>> [c.__name__ for c in find_classes_by_fixed_port_id(430, service=True)]
+    ['GetInfo_1_0']
+    >>> find_classes_by_fixed_port_id(7509, service=True)
+    []
+    """
+    return list(_fixed_port_registry.get((bool(service), int(port_id)), []))
+
+
 def get_extent_bytes(class_or_instance: typing.Union[typing.Type[CompositeObject], CompositeObject]) -> int:
     return int(class_or_instance._EXTENT_BYTES_)  # pylint: disable=protected-access
 
@@ -0,0 +1,140 @@
+# Copyright (c) 2021 UAVCAN Consortium
+# This software is distributed under the terms of the MIT License.
+# Author: Pavel Kirienko <pavel@uavcan.org>
+
+from __future__ import annotations
+import typing
+import logging
+
+from . import _serialized_representation
+from ._composite_object import CompositeObjectTypeVar, deserialize
+
+
+_logger = logging.getLogger(__name__)
+
+
+class LazyView(typing.Generic[CompositeObjectTypeVar]):
+    """
+    A read-only view of a serialized representation that decodes the fields of the object on first access
+    rather than eagerly. This is useful for consumers that inspect only a few fields of each received object,
+    like bus monitors.
+
+    The fields of the static prefix (i.e., those whose offset does not depend on the values of the preceding
+    fields, see ``_STATIC_PREFIX_FIELDS_`` in the generated class) are decoded individually
+    at their precomputed offsets. An access to any other attribute deserializes the entire object once
+    (see :meth:`materialize`) and delegates the access to it. Decoded values are cached.
+
+    The view retains a reference to the serialized representation, so the latter shall not be mutated
+    while the view is in use. The validity of the serialized representation is not checked until
+    the entire object is deserialized; a field of the static prefix may be obtained successfully even if
+    the rest of the serialized representation is invalid. If the object cannot be deserialized,
+    an access to a field outside of the static prefix raises a :class:`ValueError`.
+    A field of the static prefix that is a nested composite may also raise
+    :class:`pyuavcan.dsdl.Deserializer.FormatError` if its serialized representation is invalid.
+    """
+
+    def __init__(
+        self,
+        dtype: typing.Type[CompositeObjectTypeVar],
+        fragmented_serialized_representation: typing.Sequence[memoryview],
+    ) -> None:
+        if len(fragmented_serialized_representation) == 1:
+            self._payload = list(fragmented_serialized_representation)
+        else:  # Concatenate once here rather than on every field access.
+            self._payload = [memoryview(bytearray().join(fragmented_serialized_representation))]
+        self._dtype = dtype
+        self._cache: typing.Dict[str, typing.Any] = {}
+        self._object: typing.Optional[CompositeObjectTypeVar] = None
+        self._materialized = False
+
+    @property
+    def dtype(self) -> typing.Type[CompositeObjectTypeVar]:
+        return self._dtype
+
+    def materialize(self) -> typing.Optional[CompositeObjectTypeVar]:
+        """
+        Deserializes the entire object (only once) and returns it.
+        Returns None if the serialized representation is invalid, like :func:`pyuavcan.dsdl.deserialize`.
+        """
+        if not self._materialized:
+            self._object = deserialize(self._dtype, self._payload)
+            self._materialized = True
+        return self._object
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name.startswith("_"):  # Never delegate private attributes; this also guards against infinite recursion.
+            raise AttributeError(name)
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+        if self._object is None and name in self._dtype._STATIC_PREFIX_FIELDS_:  # pylint: disable=protected-access
+            des = _serialized_representation.Deserializer.new(self._payload)
+            value = self._dtype._deserialize_static_prefix_field_(des, name)  # pylint: disable=protected-access
+        else:
+            obj = self.materialize()
+            if obj is None:
+                raise ValueError(f"{self} does not contain a valid serialized representation")
+            value = getattr(obj, name)
+        self._cache[name] = value
+        return value
+
+    def __repr__(self) -> str:
+        size = sum(map(len, self._payload))
+        return f"{type(self).__name__}({self._dtype.__name__}, {size}B)"
+
+
+def _unittest_lazy_view() -> None:
+    from pytest import raises
+    from ._composite_object import CompositeObject
+
+    class Pair(CompositeObject):
+        """
+        A manually written imitation of a generated structure type: uint16 followed by uint8.
+        Only the first field is declared to be in the static prefix to exercise the fallback.
+        """
+
+        _EXTENT_BYTES_ = 16
+        _STATIC_PREFIX_FIELDS_ = {"head": 0}
+        deserialized = 0
+
+        def __init__(self, head: int, tail: int) -> None:
+            self.head = head
+            self.tail = tail
+
+        def _serialize_(self, _ser_: _serialized_representation.Serializer) -> None:
+            _ser_.add_aligned_u16(self.head)
+            _ser_.add_aligned_u8(self.tail)
+
+        @staticmethod
+        def _deserialize_(_des_: _serialized_representation.Deserializer) -> CompositeObject:
+            Pair.deserialized += 1
+            return Pair(_des_.fetch_aligned_u16(), _des_.fetch_aligned_u8())
+
+        @staticmethod
+        def _deserialize_static_prefix_field_(_des_: _serialized_representation.Deserializer, _name_: str) -> int:
+            if _name_ == "head":
+                _des_.skip_bits(0)
+                return _des_.fetch_aligned_u16()
+            raise LookupError(_name_)
+
+    view = LazyView(Pair, [memoryview(b"\x01"), memoryview(b"\x02\x03")])
+    assert view.dtype is Pair
+    assert view.head == 0x0201
+    assert Pair.deserialized == 0  # The static prefix does not require full deserialization.
+    assert view.tail == 3
+    assert Pair.deserialized == 1
+    assert view.head == 0x0201
+    obj = view.materialize()
+    assert isinstance(obj, Pair) and obj.tail == 3
+    assert Pair.deserialized == 1
+    with raises(AttributeError):
+        print(view.nonexistent)
+    with raises(AttributeError):
+        print(view._private)  # pylint: disable=protected-access
+    print(view)
+
+    # Implicit zero extension applies.
+    view = LazyView(Pair, [memoryview(b"")])
+    assert view.head == 0
+    assert view.tail == 0
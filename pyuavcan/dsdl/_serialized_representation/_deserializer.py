@@ -139,6 +139,18 @@ class Deserializer(abc.ABC):
         assert len(out) == count
         return out
 
+    def fetch_aligned_struct(self, st: struct.Struct) -> typing.Tuple[typing.Any, ...]:
+        """
+        Unpacks a group of byte-aligned values at once using a precomputed little-endian :class:`struct.Struct`.
+        This is the counterpart of the corresponding serializer method.
+        The implicit zero extension rule applies. The current bit offset must be byte-aligned.
+        """
+        assert self._bit_offset % 8 == 0
+        bo = self._byte_offset
+        out = st.unpack_from(self._buf.get_unsigned_slice(bo, bo + st.size))
+        self._bit_offset += st.size * 8
+        return out
+
     def fetch_aligned_u8(self) -> int:
         assert self._bit_offset % 8 == 0
         out = self._buf.get_byte(self._byte_offset)
@@ -555,6 +567,16 @@ def _unittest_deserializer_aligned() -> None:
     print("repr(deserializer):", repr(des))
 
 
+def _unittest_deserializer_aligned_struct() -> None:
+    des = Deserializer.new([memoryview(bytes([0xAB, 0xFE, 0xFF, 0x7F, 0x00, 0x00, 0x00, 0x3C, 0xEF, 0xBE]))])
+    assert des.fetch_aligned_u8() == 0xAB
+    assert des.fetch_aligned_struct(struct.Struct("<hB2xe")) == (-2, 0x7F, 1.0)
+    assert des.consumed_bit_length == 8 * 8
+    # Implicit zero extension: only two bytes are left in the buffer.
+    assert des.fetch_aligned_struct(struct.Struct("<I")) == (0xBEEF,)
+    assert des.remaining_bit_length == -16
+
+
 def _unittest_deserializer_unaligned() -> None:
     from pytest import approx
 
@@ -21,6 +21,12 @@ We extend the requested buffer size by one because some of the non-byte-aligned
 require us to temporarily use one extra byte after the current byte.
 """
 
+_ZERO_COPY_THRESHOLD_BYTES = 1024
+"""
+Byte-aligned arrays of at least this size are not copied into the destination buffer but emitted as separate
+fragments referring to the memory of the source array. Smaller arrays are cheaper to copy than to keep separately.
+"""
+
 
 class Serializer(abc.ABC):
     """
@@ -30,12 +36,22 @@ class Serializer(abc.ABC):
     Methods that expect an unsigned integer will raise ValueError if the supplied integer is negative.
     """
 
-    def __init__(self, buffer: numpy.ndarray):
+    def __init__(
+        self,
+        buffer: numpy.ndarray,
+        origin: int = 0,
+        references: typing.Optional[typing.List[typing.Tuple[int, memoryview]]] = None,
+    ):
         """
         Do not call this directly. Use :meth:`new` to instantiate.
         """
         self._buf = buffer
         self._bit_offset = 0
+        # The origin is the offset of this buffer relative to the root buffer; it is non-zero for forked serializers.
+        # The list of references is shared with all forks; it contains external fragments added by reference
+        # along with their absolute offsets in the root buffer. The memory they occupy in the buffer is unused.
+        self._origin = origin
+        self._references: typing.List[typing.Tuple[int, memoryview]] = references if references is not None else []
 
     @staticmethod
     def new(buffer_size_in_bytes: int) -> Serializer:
@@ -43,13 +59,29 @@ class Serializer(abc.ABC):
         buf: numpy.ndarray = numpy.zeros(buffer_size_in_bytes, dtype=_Byte)
         return _PlatformSpecificSerializer(buf)
 
+    @staticmethod
+    def new_in_buffer(buffer: numpy.ndarray) -> Serializer:
+        """
+        Like :meth:`new`, but uses the supplied buffer instead of allocating a new one.
+        This is intended for buffer pooling. The buffer shall be a one-dimensional zero-filled array of bytes
+        that is at least one byte larger than the maximum size of the serialized representation.
+        """
+        if not isinstance(buffer, numpy.ndarray) or buffer.dtype != _Byte or buffer.ndim != 1:
+            raise ValueError(f"Invalid serialization buffer: {buffer!r}")
+        return _PlatformSpecificSerializer(buffer)
+
     @property
     def current_bit_length(self) -> int:
         return self._bit_offset
 
     @property
     def buffer(self) -> numpy.ndarray:
-        """Returns a properly sized read-only slice of the destination buffer zero-bit-padded to byte."""
+        """
+        Returns a properly sized read-only slice of the destination buffer zero-bit-padded to byte.
+        If there are fragments added by reference, they are copied into the buffer first,
+        which defeats the purpose; use :attr:`fragmented_buffer` to avoid that.
+        """
+        self._copy_references_into_buffer()
         out = self._buf[: (self._bit_offset + 7) // 8]
         out.flags.writeable = False
         # Here we used to check if out.base is self._buf to make sure we're not creating a copy because that might
@@ -58,6 +90,27 @@ class Serializer(abc.ABC):
         # interpreter. Very dangerous.
         return out
 
+    @property
+    def fragmented_buffer(self) -> typing.List[memoryview]:
+        """
+        Like :attr:`buffer`, but large byte-aligned arrays added by reference are returned as separate fragments
+        that refer to the memory of the source arrays instead of being copied.
+        The fragments shall be concatenated to obtain the final representation. There is always at least one fragment.
+        Mutating the source arrays while the fragments are in use will alter the serialized representation.
+        """
+        end = (self._bit_offset + 7) // 8
+        out: typing.List[memoryview] = []
+        cursor = 0
+        for offset, ref in sorted(self._own_references(), key=lambda x: x[0]):
+            offset -= self._origin
+            if offset > cursor:
+                out.append(self._read_only_slice(cursor, offset))
+            out.append(ref)
+            cursor = offset + len(ref)
+        if cursor < end or not out:
+            out.append(self._read_only_slice(cursor, end))
+        return out
+
     def skip_bits(self, bit_length: int) -> None:
         """This is used for padding bits and for skipping fragments written by forked serializers."""
         self._bit_offset += bit_length
@@ -96,7 +149,7 @@ class Serializer(abc.ABC):
             )
         forked_buffer = forked_buffer[:forked_buffer_size_in_bytes]
         assert len(forked_buffer) == forked_buffer_size_in_bytes
-        return _PlatformSpecificSerializer(forked_buffer)
+        return _PlatformSpecificSerializer(forked_buffer, self._origin + self._byte_offset, self._references)
 
     #
     # Fast methods optimized for aligned primitive fields.
@@ -130,6 +183,30 @@ class Serializer(abc.ABC):
         self._buf[self._byte_offset : self._byte_offset + len(x)] = x
         self._bit_offset += len(x) * 8
 
+    def add_aligned_struct(self, st: struct.Struct, *values: typing.Any) -> None:
+        """
+        Packs the values into the destination in one go using a precomputed little-endian :class:`struct.Struct`.
+        This is used by the generated code for groups of byte-aligned fields of standard bit length,
+        replacing a series of per-field calls. The values shall be in the valid range of the corresponding
+        struct format codes; no truncation is performed. The current bit offset must be byte-aligned.
+        """
+        assert self._bit_offset % 8 == 0
+        st.pack_into(self._buf, self._byte_offset, *values)
+        self._bit_offset += st.size * 8
+
+    def add_aligned_bytes_by_reference(self, x: numpy.ndarray) -> None:
+        """
+        Like :meth:`add_aligned_bytes`, but the data is not copied; instead, it will be emitted as a separate
+        fragment referring to the memory of the array (see :attr:`fragmented_buffer`).
+        The array shall be C-contiguous. The current bit offset must be byte-aligned.
+        """
+        assert self._bit_offset % 8 == 0
+        assert x.dtype == _Byte and x.flags.c_contiguous
+        if self._byte_offset + len(x) > len(self._buf):
+            raise ValueError(f"Buffer overflow: {len(x)} bytes at offset {self._byte_offset} exceed {len(self._buf)}")
+        self._references.append((self._origin + self._byte_offset, x.data))
+        self._bit_offset += len(x) * 8
+
     def add_aligned_u8(self, x: int) -> None:
         assert self._bit_offset % 8 == 0
         self._ensure_not_negative(x)
@@ -243,6 +320,25 @@ class Serializer(abc.ABC):
     #
     # Private methods.
     #
+    def _own_references(self) -> typing.List[typing.Tuple[int, memoryview]]:
+        """The references that fall into the buffer of this instance (forks share the list with the parent)."""
+        left, right = self._origin, self._origin + len(self._buf)
+        return [(o, r) for o, r in self._references if left <= o < right]
+
+    def _copy_references_into_buffer(self) -> None:
+        own = self._own_references()
+        for offset, ref in own:
+            offset -= self._origin
+            self._buf[offset : offset + len(ref)] = numpy.frombuffer(ref, dtype=_Byte)
+        if own:  # The memory is shared with the forks, so the references are no longer needed by anyone.
+            copied = {id(r) for _, r in own}
+            self._references[:] = [x for x in self._references if id(x[1]) not in copied]
+
+    def _read_only_slice(self, left: int, right: int) -> memoryview:
+        out = self._buf[left:right]
+        out.flags.writeable = False
+        return out.data
+
     @staticmethod
     def _unsigned_to_bytes(value: int, bit_length: int) -> numpy.ndarray:
         assert bit_length >= 1
@@ -294,7 +390,10 @@ class _LittleEndianSerializer(Serializer):
         # the generated serialized representation may be incorrect. NumPy seems to only support IEEE-754 compliant
         # platforms though so I don't expect any compatibility issues.
         assert x.dtype not in (numpy.bool, numpy.bool_, numpy.object)
-        self.add_aligned_bytes(x.view(_Byte))
+        if x.nbytes >= _ZERO_COPY_THRESHOLD_BYTES and x.flags.c_contiguous:
+            self.add_aligned_bytes_by_reference(x.view(_Byte))
+        else:
+            self.add_aligned_bytes(x.view(_Byte))
 
     def add_unaligned_array_of_standard_bit_length_primitives(self, x: numpy.ndarray) -> None:
         # This is much slower than the aligned version because we have to manually copy and shift each byte,
@@ -454,6 +553,51 @@ def _unittest_serializer_aligned() -> None:
         ser.buffer[0] = 123  # The buffer is read-only for safety reasons
 
 
+def _unittest_serializer_aligned_struct() -> None:
+    ser = Serializer.new(16)
+    ser.add_aligned_u8(0xAB)
+    ser.add_aligned_struct(struct.Struct("<hB2xe"), -2, 0x7F, 1.0)
+    assert ser.current_bit_length == 8 * 8
+    assert ser.buffer.tobytes() == bytes([0xAB, 0xFE, 0xFF, 0x7F, 0x00, 0x00, 0x00, 0x3C])
+
+    f = ser.fork_bytes(4)
+    f.add_aligned_struct(struct.Struct("<I"), 0xDEADBEEF)
+    ser.skip_bits(32)
+    assert ser.buffer.tobytes()[8:] == bytes([0xEF, 0xBE, 0xAD, 0xDE])
+
+
+def _unittest_serializer_zero_copy() -> None:
+    big = numpy.arange(1000, dtype=numpy.uint16)
+    small = numpy.array([1, 2], dtype=numpy.uint8)
+    ser = Serializer.new(6000)
+    ser.add_aligned_u8(0xAA)
+    ser.add_aligned_array_of_standard_bit_length_primitives(big)
+    ser.add_aligned_array_of_standard_bit_length_primitives(small)
+    ser.add_unaligned_bit(True)
+    frags = ser.fragmented_buffer
+    assert len(frags) == 3
+    assert bytes(frags[0]) == b"\xAA"
+    assert numpy.shares_memory(numpy.frombuffer(frags[1], numpy.uint8), big)
+    assert bytes(frags[2]) == b"\x01\x02\x01"
+    assert ser.current_bit_length == (1 + 2000 + 2) * 8 + 1
+
+    # Forked serializers share the references with the parent.
+    ser.pad_to_alignment(8)
+    f = ser.fork_bytes(2500)
+    f.add_aligned_bytes_by_reference(big.view(numpy.uint8))
+    ser.skip_bits(f.current_bit_length)
+    frags = ser.fragmented_buffer
+    assert [len(x) for x in frags] == [1, 2000, 3, 2000]
+    assert len(f.fragmented_buffer) == 1
+    reference = b"\xAA" + big.tobytes() + b"\x01\x02\x01" + big.tobytes()
+    assert b"".join(frags) == reference
+
+    # The contiguous buffer is still available; the references are copied into it.
+    assert ser.buffer.tobytes() == reference
+    assert len(ser.fragmented_buffer) == 1
+    assert Serializer.new(0).fragmented_buffer[0].nbytes == 0
+
+
 def _unittest_serializer_unaligned() -> None:  # Tricky cases with unaligned fields (very tricky)
     ser = Serializer.new(40)
 
@@ -143,6 +143,8 @@ from ._presentation import Presentation as Presentation
 
 from ._port import Publisher as Publisher
 from ._port import Subscriber as Subscriber
+from ._port import LazySubscriber as LazySubscriber
+from ._port import SubscriberBase as SubscriberBase
 from ._port import Client as Client
 from ._port import Server as Server
 
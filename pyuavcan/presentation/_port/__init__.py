@@ -15,6 +15,8 @@ from ._publisher import Publisher as Publisher
 from ._publisher import PublisherImpl as PublisherImpl
 
 from ._subscriber import Subscriber as Subscriber
+from ._subscriber import LazySubscriber as LazySubscriber
+from ._subscriber import SubscriberBase as SubscriberBase
 from ._subscriber import SubscriberImpl as SubscriberImpl
 from ._subscriber import SubscriberStatistics as SubscriberStatistics
 
@@ -3,6 +3,7 @@
 # Author: Pavel Kirienko <pavel@uavcan.org>
 
 from __future__ import annotations
+import bisect
 import typing
 import asyncio
 import logging
@@ -17,6 +18,8 @@ from ._error import PortClosedError, RequestTransferIDVariabilityExhaustedError
 # Shouldn't be too large as this value defines how quickly the task will detect that the underlying transport is closed.
 _RECEIVE_TIMEOUT = 1
 
+_DEFAULT_MAX_IN_FLIGHT = 16
+
 
 _logger = logging.getLogger(__name__)
 
@@ -34,6 +37,15 @@ class ClientStatistics:
     deserialization_failures: int  #: Response transfers that could not be deserialized into a response object.
     unexpected_responses: int  #: Response transfers that could not be matched with a request state.
 
+    response_latency_histogram: typing.Dict[float, int] = dataclasses.field(default_factory=dict)
+    """
+    The number of received responses per latency bin, where the latency is the time from the moment
+    the request is handed over to the transport until the response is received.
+    The key is the upper bound of the bin in seconds as defined in :attr:`RESPONSE_LATENCY_BINS`.
+    """
+
+    RESPONSE_LATENCY_BINS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0, float("inf"))
+
 
 class Client(ServicePort[ServiceClass]):
     """
@@ -90,6 +102,33 @@ class Client(ServicePort[ServiceClass]):
             request=request, priority=self._priority, response_timeout=self._response_timeout
         )
 
+    async def call_many(
+        self, requests: typing.Iterable[pyuavcan.dsdl.CompositeObject], max_in_flight: int = _DEFAULT_MAX_IN_FLIGHT
+    ) -> typing.List[typing.Optional[typing.Tuple[pyuavcan.dsdl.CompositeObject, pyuavcan.transport.TransferFrom]]]:
+        """
+        Sends the requests to the remote server in a pipelined manner: the next request is emitted
+        without waiting for the responses to the previous ones as long as there are fewer than ``max_in_flight``
+        requests pending. This is much faster than invoking :meth:`call` in a loop when there are many requests
+        to the same server (e.g., when reading all registers of a node).
+
+        Returns the outcomes in the order of the requests; the outcome of each request is the same as
+        :meth:`call` would return. The pre-configured priority and response timeout parameters apply to
+        every request individually.
+
+        Transfer-ID values that are still used by pending requests (e.g., issued by other tasks) are skipped,
+        so :class:`pyuavcan.presentation.RequestTransferIDVariabilityExhaustedError` is not raised unless every
+        transfer-ID value is taken. The maximum number of requests in flight shall be less than the transfer-ID
+        modulo of the transport (e.g., 32 for CAN); otherwise, :class:`ValueError` is raised.
+        """
+        if self._maybe_impl is None:
+            raise PortClosedError(repr(self))
+        return await self._maybe_impl.call_many(
+            requests=requests,
+            priority=self._priority,
+            response_timeout=self._response_timeout,
+            max_in_flight=max_in_flight,
+        )
+
     @property
     def response_timeout(self) -> float:
         """
@@ -163,6 +202,7 @@ class Client(ServicePort[ServiceClass]):
             sent_requests=self._maybe_impl.sent_request_count,
             deserialization_failures=self._maybe_impl.deserialization_failure_count,
             unexpected_responses=self._maybe_impl.unexpected_response_count,
+            response_latency_histogram=dict(self._maybe_impl.response_latency_histogram),
         )
 
     def close(self) -> None:
@@ -208,6 +248,7 @@ class ClientImpl(Closable, typing.Generic[ServiceClass]):
         self.unsent_request_count = 0
         self.deserialization_failure_count = 0
         self.unexpected_response_count = 0
+        self.response_latency_histogram = dict.fromkeys(ClientStatistics.RESPONSE_LATENCY_BINS, 0)
 
         self.transfer_id_counter = transfer_id_counter
         # The transfer ID modulo may change if the transport is reconfigured at runtime. This is certainly not a
@@ -230,31 +271,51 @@ class ClientImpl(Closable, typing.Generic[ServiceClass]):
         return self._maybe_finalizer is None
 
     async def call(
-        self, request: pyuavcan.dsdl.CompositeObject, priority: pyuavcan.transport.Priority, response_timeout: float
+        self,
+        request: pyuavcan.dsdl.CompositeObject,
+        priority: pyuavcan.transport.Priority,
+        response_timeout: float,
+        skip_busy_transfer_ids: bool = False,
     ) -> typing.Optional[typing.Tuple[pyuavcan.dsdl.CompositeObject, pyuavcan.transport.TransferFrom]]:
-        async with self._lock:
-            if self.is_closed:
-                raise PortClosedError(repr(self))
+        if self.is_closed:
+            raise PortClosedError(repr(self))
+        if not isinstance(request, self.dtype.Request):
+            raise TypeError(
+                f"Invalid request object: expected an instance of {self.dtype.Request}, "
+                f"got {type(request)} instead."
+            )
+        # Serialization does not require access to the transport, so it is done before the lock is taken.
+        fragmented_payload = list(pyuavcan.dsdl.serialize(request))
 
-            # We have to compute the modulus here manually instead of just letting the transport do that because
-            # the response will use the modulus instead of the full TID and we have to match it with the request.
-            transfer_id = self.transfer_id_counter.get_then_increment() % self._transfer_id_modulo_factory()
-            if transfer_id in self._response_futures_by_transfer_id:
-                raise RequestTransferIDVariabilityExhaustedError(repr(self))
+        # We have to compute the modulus here manually instead of just letting the transport do that because
+        # the response will use the modulus instead of the full TID and we have to match it with the request.
+        # There are no suspension points until the lock is requested, and the lock is fair, so the requests are
+        # emitted in the order of their transfer-ID values.
+        modulo = self._transfer_id_modulo_factory()
+        for _ in range(modulo if skip_busy_transfer_ids else 1):
+            transfer_id = self.transfer_id_counter.get_then_increment() % modulo
+            if transfer_id not in self._response_futures_by_transfer_id:
+                break
+        else:
+            raise RequestTransferIDVariabilityExhaustedError(repr(self))
 
-            try:
-                future = self._loop.create_future()
-                self._response_futures_by_transfer_id[transfer_id] = future
-                # The lock is still taken, this is intentional. Serialize access to the transport.
-                send_result = await self._do_send(
-                    request=request,
-                    transfer_id=transfer_id,
+        future = self._loop.create_future()
+        self._response_futures_by_transfer_id[transfer_id] = future
+        try:
+            async with self._lock:  # Serialize access to the transport.
+                if self.is_closed:
+                    raise PortClosedError(repr(self))
+                sent_at = self._loop.time()
+                transfer = pyuavcan.transport.Transfer(
+                    timestamp=pyuavcan.transport.Timestamp.now(),
                     priority=priority,
-                    monotonic_deadline=self._loop.time() + response_timeout,
+                    transfer_id=transfer_id,
+                    fragmented_payload=fragmented_payload,
                 )
-            except BaseException:
-                self._forget_future(transfer_id)
-                raise
+                send_result = await self.output_transport_session.send(transfer, sent_at + response_timeout)
+        except BaseException:
+            self._forget_future(transfer_id)
+            raise
 
         # Wait for the response with the lock released.
         # We have to make sure that no matter what happens, we remove the future from the table upon exit;
@@ -263,10 +324,11 @@ class ClientImpl(Closable, typing.Generic[ServiceClass]):
         try:
             if send_result:
                 self.sent_request_count += 1
-                response, transfer = await asyncio.wait_for(future, timeout=response_timeout)
+                response, transfer_from = await asyncio.wait_for(future, timeout=response_timeout)
                 assert isinstance(response, self.dtype.Response)
-                assert isinstance(transfer, pyuavcan.transport.TransferFrom)
-                return response, transfer
+                assert isinstance(transfer_from, pyuavcan.transport.TransferFrom)
+                self._register_response_latency(self._loop.time() - sent_at)
+                return response, transfer_from
             self.unsent_request_count += 1
             return None
         except asyncio.TimeoutError:
@@ -274,6 +336,36 @@ class ClientImpl(Closable, typing.Generic[ServiceClass]):
         finally:
             self._forget_future(transfer_id)
 
+    async def call_many(
+        self,
+        requests: typing.Iterable[pyuavcan.dsdl.CompositeObject],
+        priority: pyuavcan.transport.Priority,
+        response_timeout: float,
+        max_in_flight: int,
+    ) -> typing.List[typing.Optional[typing.Tuple[pyuavcan.dsdl.CompositeObject, pyuavcan.transport.TransferFrom]]]:
+        max_in_flight = int(max_in_flight)
+        if not (1 <= max_in_flight < self._transfer_id_modulo_factory()):
+            raise ValueError(f"Invalid maximum number of requests in flight: {max_in_flight}")
+        requests = list(requests)
+        results: typing.List[
+            typing.Optional[typing.Tuple[pyuavcan.dsdl.CompositeObject, pyuavcan.transport.TransferFrom]]
+        ] = [None] * len(requests)
+        indexes = iter(range(len(requests)))  # Shared by the workers; each request is taken by exactly one.
+
+        async def worker() -> None:
+            for index in indexes:
+                results[index] = await self.call(
+                    requests[index], priority, response_timeout, skip_busy_transfer_ids=True
+                )
+
+        workers = [self._loop.create_task(worker()) for _ in range(min(max_in_flight, len(requests)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for w in workers:
+                w.cancel()
+        return results
+
     def register_proxy(self) -> None:  # Proxy (de-)registration is always possible even if closed.
         assert not self.is_closed, "Internal logic error: cannot register a new proxy on a closed instance"
         assert self._proxy_count >= 0
@@ -300,25 +392,9 @@ class ClientImpl(Closable, typing.Generic[ServiceClass]):
             _logger.debug("Could not cancel the task %r: %s", self._task, ex, exc_info=True)
         self._finalize()
 
-    async def _do_send(
-        self,
-        request: pyuavcan.dsdl.CompositeObject,
-        transfer_id: int,
-        priority: pyuavcan.transport.Priority,
-        monotonic_deadline: float,
-    ) -> bool:
-        if not isinstance(request, self.dtype.Request):
-            raise TypeError(
-                f"Invalid request object: expected an instance of {self.dtype.Request}, "
-                f"got {type(request)} instead."
-            )
-
-        timestamp = pyuavcan.transport.Timestamp.now()
-        fragmented_payload = list(pyuavcan.dsdl.serialize(request))
-        transfer = pyuavcan.transport.Transfer(
-            timestamp=timestamp, priority=priority, transfer_id=transfer_id, fragmented_payload=fragmented_payload
-        )
-        return await self.output_transport_session.send(transfer, monotonic_deadline)
+    def _register_response_latency(self, latency: float) -> None:
+        bins = ClientStatistics.RESPONSE_LATENCY_BINS
+        self.response_latency_histogram[bins[bisect.bisect_left(bins, latency)]] += 1
 
     async def _task_function(self) -> None:
         exception: typing.Optional[Exception] = None
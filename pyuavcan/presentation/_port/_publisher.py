@@ -112,6 +112,23 @@ class Publisher(MessagePort[MessageClass]):
             raise PortClosedError(repr(self))
         return await self._maybe_impl.publish(message, self._priority, self._loop.time() + self._send_timeout)
 
+    async def publish_many(self, messages: typing.Iterable[MessageClass]) -> int:
+        """
+        Serializes and publishes the message objects in the specified order at the priority level selected earlier.
+        The messages are submitted to the transport as one batch, which is much more efficient than invoking
+        :meth:`publish` for each message at high rates, especially if the transport can emit multiple transfers at once
+        (see :meth:`pyuavcan.transport.OutputSession.send_many`).
+        The :attr:`send_timeout` applies to the whole batch.
+        Should not be used simultaneously with :meth:`publish_soon` because that makes the message ordering undefined.
+        Returns the number of messages published, which is less than the number of messages if the publication
+        could not be completed in :attr:`send_timeout`.
+        """
+        if self._maybe_impl is None:
+            raise PortClosedError(repr(self))
+        return await self._maybe_impl.publish_many(
+            list(messages), self._priority, self._loop.time() + self._send_timeout
+        )
+
     def publish_soon(self, message: MessageClass) -> None:
         """
         Serializes and publishes the message object at the priority level selected earlier.
@@ -167,6 +184,7 @@ class PublisherImpl(Closable, typing.Generic[MessageClass]):
         self._loop = loop
         self._lock = asyncio.Lock()
         self._proxy_count = 0
+        self._buffer_pool = pyuavcan.dsdl.SerializationBufferPool()
 
     async def publish(
         self, message: MessageClass, priority: pyuavcan.transport.Priority, monotonic_deadline: float
@@ -178,14 +196,52 @@ class PublisherImpl(Closable, typing.Generic[MessageClass]):
             if self._is_closed:
                 raise PortClosedError(repr(self))
             timestamp = pyuavcan.transport.Timestamp.now()
-            fragmented_payload = list(pyuavcan.dsdl.serialize(message))
-            transfer = pyuavcan.transport.Transfer(
-                timestamp=timestamp,
-                priority=priority,
-                transfer_id=self.transfer_id_counter.get_then_increment(),
-                fragmented_payload=fragmented_payload,
-            )
-            return await self.transport_session.send(transfer, monotonic_deadline)
+            lease = self._buffer_pool.serialize(message)
+            try:
+                return await self.transport_session.send(
+                    pyuavcan.transport.Transfer(
+                        timestamp=timestamp,
+                        priority=priority,
+                        transfer_id=self.transfer_id_counter.get_then_increment(),
+                        fragmented_payload=lease.fragmented_payload,
+                    ),
+                    monotonic_deadline,
+                )
+            finally:
+                # The buffer is recycled only if the transport did not retain any references to the payload.
+                self._buffer_pool.release(lease)
+
+    async def publish_many(
+        self,
+        messages: typing.Sequence[MessageClass],
+        priority: pyuavcan.transport.Priority,
+        monotonic_deadline: float,
+    ) -> int:
+        for message in messages:
+            if not isinstance(message, self.dtype):
+                raise TypeError(f"Expected a message object of type {self.dtype}, found this: {message}")
+
+        async with self._lock:
+            if self._is_closed:
+                raise PortClosedError(repr(self))
+            timestamp = pyuavcan.transport.Timestamp.now()
+            leases = [self._buffer_pool.serialize(x) for x in messages]
+            try:
+                return await self.transport_session.send_many(
+                    [
+                        pyuavcan.transport.Transfer(
+                            timestamp=timestamp,
+                            priority=priority,
+                            transfer_id=self.transfer_id_counter.get_then_increment(),
+                            fragmented_payload=lease.fragmented_payload,
+                        )
+                        for lease in leases
+                    ],
+                    monotonic_deadline,
+                )
+            finally:
+                for lease in leases:
+                    self._buffer_pool.release(lease)
 
     def register_proxy(self) -> None:
         self._proxy_count += 1
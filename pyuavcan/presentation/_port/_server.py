@@ -5,8 +5,11 @@
 from __future__ import annotations
 import typing
 import asyncio
+import inspect
 import logging
 import dataclasses
+import collections
+import concurrent.futures
 import pyuavcan.dsdl
 import pyuavcan.transport
 import pyuavcan.util
@@ -18,6 +21,10 @@ from ._error import PortClosedError
 # transport is closed.
 _LISTEN_FOREVER_TIMEOUT = 1
 
+# In the concurrent mode, this many requests per task may be waiting for a free task before the server stops receiving.
+# The queue should be deep enough to let requests from different clients reach the round-robin dispatcher.
+_JOB_QUEUE_CAPACITY_PER_WORKER = 4
+
 
 OutputTransportSessionFactory = typing.Callable[[int], pyuavcan.transport.OutputSession]
 ServiceRequestClass = typing.TypeVar("ServiceRequestClass", bound=pyuavcan.dsdl.CompositeObject)
@@ -71,9 +78,20 @@ class ServiceRequestMetadata:
 
 
 ServiceRequestHandler = typing.Callable[
-    [ServiceRequestClass, ServiceRequestMetadata], typing.Awaitable[typing.Optional[ServiceResponseClass]]
+    [ServiceRequestClass, ServiceRequestMetadata],
+    typing.Union[typing.Awaitable[typing.Optional[ServiceResponseClass]], typing.Optional[ServiceResponseClass]],
 ]
-"""Type of the async request handler callable."""
+"""
+Type of the request handler callable. Normally it is async; a regular (synchronous) function is also accepted,
+which is useful in conjunction with :attr:`Server.executor`.
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class _Job:
+    handler: ServiceRequestHandler[typing.Any, typing.Any]
+    request: pyuavcan.dsdl.CompositeObject
+    metadata: ServiceRequestMetadata
 
 
 class Server(ServicePort[ServiceClass]):
@@ -115,6 +133,14 @@ class Server(ServicePort[ServiceClass]):
         self._deserialization_failure_count = 0
         self._malformed_request_count = 0
 
+        self._concurrency = 1
+        self._executor: typing.Optional[concurrent.futures.Executor] = None
+        # Requests that await a free worker are queued per client; the order of the keys defines the round-robin.
+        self._job_queues: typing.Dict[int, typing.Deque[_Job]] = {}
+        self._num_queued_jobs = 0
+        self._job_queue_space = asyncio.Event()
+        self._workers: typing.Set[asyncio.Task[None]] = set()
+
     # ----------------------------------------  MAIN API  ----------------------------------------
 
     async def serve(
@@ -131,6 +157,9 @@ class Server(ServicePort[ServiceClass]):
         # it might be that the transfer ID that we obtained from the request may be invalid for some of the transports.
         # This is why we can't reliably aggregate redundant transports with different transfer-ID overflow parameters.
         while not self._closed:
+            if self._concurrency > 1 and not await self._wait_for_job_queue_space(monotonic_deadline):
+                break  # Timed out or closed.
+
             out: typing.Optional[typing.Tuple[pyuavcan.dsdl.CompositeObject, ServiceRequestMetadata]]
             if monotonic_deadline is None:
                 out = await self._receive(self._loop.time() + _LISTEN_FOREVER_TIMEOUT)
@@ -143,28 +172,11 @@ class Server(ServicePort[ServiceClass]):
 
             self._served_request_count += 1
             request, meta = out
-            response: typing.Optional[ServiceResponseClass] = None  # Fallback state
             assert isinstance(request, self._dtype.Request), "Internal protocol violation"
-            try:
-                response = await handler(request, meta)  # type: ignore
-                if response is not None and not isinstance(response, self._dtype.Response):
-                    raise TypeError(
-                        f"The application request handler has returned an invalid response: "
-                        f"expected an instance of {self._dtype.Response} or None, "
-                        f"found {type(response)} instead. "
-                        f"The corresponding request was {request} with metadata {meta}."
-                    )
-            except Exception as ex:
-                if isinstance(ex, asyncio.CancelledError):
-                    raise
-                _logger.exception("%s unhandled exception in the handler: %s", self, ex)
-
-            response_transport_session = self._get_output_transport_session(meta.client_node_id)
-
-            # Send the response unless the application has opted out, in which case do nothing.
-            if response is not None:
-                # TODO: make the send timeout configurable.
-                await self._do_send(response, meta, response_transport_session, self._loop.time() + self._send_timeout)
+            if self._concurrency > 1:
+                self._enqueue_job(_Job(handler, request, meta))
+            else:
+                await self._handle_request(handler, request, meta)
 
     async def serve_for(
         self, handler: ServiceRequestHandler[ServiceRequestClass, ServiceResponseClass], timeout: float
@@ -176,6 +188,9 @@ class Server(ServicePort[ServiceClass]):
         and the associated metadata object (which contains auxiliary information such as the client's node-ID).
         The handler shall return the response or None. If None is returned, the server will not send any response back
         (this practice is discouraged). If the handler throws an exception, it will be suppressed and logged.
+
+        If :attr:`concurrency` is greater than one, this method does not wait for the dispatched requests
+        to be handled before returning; they are completed in the background unless the instance is closed.
         """
         return await self.serve(handler, monotonic_deadline=self._loop.time() + timeout)
 
@@ -232,6 +247,49 @@ class Server(ServicePort[ServiceClass]):
         else:
             raise ValueError(f"Invalid send timeout value: {value}")
 
+    @property
+    def concurrency(self) -> int:
+        """
+        The maximum number of requests that are handled concurrently.
+        The default is one, meaning that every request is handled to completion before the next one is received.
+
+        If greater than one, the received requests are dispatched to background tasks instead of being handled
+        inline, so that one slow handler does not stall the other clients of the service.
+        When all tasks are busy, up to four times this many requests are kept waiting in per-client queues
+        that are served round-robin, so that a single client issuing many requests cannot starve the others.
+        When the queues are full, the server stops receiving new requests until a task becomes available
+        (meanwhile the requests are accumulated by the underlying transport session).
+        The response is sent by the task that has handled the request via the output session of its client.
+        """
+        return self._concurrency
+
+    @concurrency.setter
+    def concurrency(self, value: int) -> None:
+        value = int(value)
+        if value >= 1:
+            self._concurrency = value
+            self._dispatch_jobs()
+        else:
+            raise ValueError(f"Invalid concurrency value: {value}")
+
+    @property
+    def executor(self) -> typing.Optional[concurrent.futures.Executor]:
+        """
+        If set, synchronous request handlers (those that are not coroutine functions) are invoked in this executor
+        rather than in the event loop thread, which is the recommended way of serving requests that involve
+        blocking operations (file or database access, heavy computation).
+        If the executor is a process pool, the handler, the request, and the response shall be picklable.
+        Normally this is used together with :attr:`concurrency`. The default is None.
+        """
+        return self._executor
+
+    @executor.setter
+    def executor(self, value: typing.Optional[concurrent.futures.Executor]) -> None:
+        if value is None or isinstance(value, concurrent.futures.Executor):
+            self._executor = value
+        else:
+            raise TypeError(f"Invalid executor: {value!r}")
+
     def sample_statistics(self) -> ServerStatistics:
         """
         Returns the statistical counters of this server instance,
@@ -265,8 +323,97 @@ class Server(ServicePort[ServiceClass]):
                     _logger.exception("%s task could not be cancelled: %s", self, ex)
                 self._maybe_task = None
 
+            for task in self._workers:
+                task.cancel()
+            self._workers.clear()
+            self._job_queues.clear()
+            self._num_queued_jobs = 0
+            self._job_queue_space.set()  # Unblock the serving task if it is waiting.
+
             self._finalizer((self._input_transport_session, *self._output_transport_sessions.values()))
 
+    async def _handle_request(
+        self,
+        handler: ServiceRequestHandler[ServiceRequestClass, ServiceResponseClass],
+        request: ServiceRequestClass,
+        meta: ServiceRequestMetadata,
+    ) -> None:
+        response: typing.Optional[ServiceResponseClass] = None  # Fallback state
+        try:
+            if self._executor is not None and not asyncio.iscoroutinefunction(handler):
+                result = await self._loop.run_in_executor(self._executor, handler, request, meta)
+            else:
+                result = handler(request, meta)
+            response = await result if inspect.isawaitable(result) else result  # type: ignore
+            if response is not None and not isinstance(response, self._dtype.Response):
+                raise TypeError(
+                    f"The application request handler has returned an invalid response: "
+                    f"expected an instance of {self._dtype.Response} or None, "
+                    f"found {type(response)} instead. "
+                    f"The corresponding request was {request} with metadata {meta}."
+                )
+        except Exception as ex:
+            if isinstance(ex, asyncio.CancelledError):
+                raise
+            _logger.exception("%s unhandled exception in the handler: %s", self, ex)
+
+        response_transport_session = self._get_output_transport_session(meta.client_node_id)
+
+        # Send the response unless the application has opted out, in which case do nothing.
+        if response is not None:
+            # TODO: make the send timeout configurable.
+            await self._do_send(response, meta, response_transport_session, self._loop.time() + self._send_timeout)
+
+    async def _wait_for_job_queue_space(self, monotonic_deadline: typing.Optional[float]) -> bool:
+        """
+        :returns: False if the deadline has been reached or the instance is closed before space became available.
+        """
+        while self._num_queued_jobs >= self._concurrency * _JOB_QUEUE_CAPACITY_PER_WORKER and not self._closed:
+            if monotonic_deadline is None:
+                timeout = float(_LISTEN_FOREVER_TIMEOUT)
+            else:
+                timeout = monotonic_deadline - self._loop.time()
+                if timeout <= 0:
+                    return False
+            self._job_queue_space.clear()
+            try:
+                await asyncio.wait_for(self._job_queue_space.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return not self._closed
+
+    def _enqueue_job(self, job: _Job) -> None:
+        try:
+            self._job_queues[job.metadata.client_node_id].append(job)
+        except LookupError:
+            self._job_queues[job.metadata.client_node_id] = collections.deque([job])
+        self._num_queued_jobs += 1
+        self._dispatch_jobs()
+
+    def _dispatch_jobs(self) -> None:
+        while len(self._workers) < self._concurrency and self._job_queues and not self._closed:
+            client_node_id = next(iter(self._job_queues))
+            queue = self._job_queues.pop(client_node_id)
+            job = queue.popleft()
+            if queue:
+                self._job_queues[client_node_id] = queue  # Re-insertion moves the client to the end of the line.
+            self._num_queued_jobs -= 1
+            self._job_queue_space.set()
+            task = self._loop.create_task(self._handle_request(job.handler, job.request, job.metadata))
+            self._workers.add(task)
+            task.add_done_callback(self._on_worker_done)
+
+    def _on_worker_done(self, task: asyncio.Task[None]) -> None:
+        self._workers.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if isinstance(exc, pyuavcan.transport.ResourceClosedError):
+            _logger.debug("%s worker got a resource closed error: %s", self, exc)
+        elif exc is not None:
+            _logger.error("%s worker failure: %s", self, exc, exc_info=exc)
+        self._dispatch_jobs()
+
     async def _receive(
         self, monotonic_deadline: float
     ) -> typing.Optional[typing.Tuple[ServiceRequestClass, ServiceRequestMetadata]]:
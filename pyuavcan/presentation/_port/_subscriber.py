@@ -21,8 +21,13 @@ _RECEIVE_TIMEOUT = 1
 _logger = logging.getLogger(__name__)
 
 
+#: The type of the items delivered by a subscriber: either the message class or :class:`pyuavcan.dsdl.LazyView` of it.
+ReceivedClass = typing.TypeVar("ReceivedClass")
+
 #: Type of the async received message handler callable.
-ReceivedMessageHandler = typing.Callable[[MessageClass, pyuavcan.transport.TransferFrom], typing.Awaitable[None]]
+ReceivedMessageHandler = typing.Callable[[ReceivedClass, pyuavcan.transport.TransferFrom], typing.Awaitable[None]]
+
+_ReceivedItem = typing.Union[MessageClass, pyuavcan.dsdl.LazyView[MessageClass]]
 
 
 @dataclasses.dataclass
@@ -31,34 +36,22 @@ class SubscriberStatistics:
     messages: int  #: Number of received messages, individual per subscriber.
     overruns: int  #: Number of messages lost to queue overruns; individual per subscriber.
     deserialization_failures: int  #: Number of messages lost to deserialization errors; shared per session specifier.
+    skipped: int = 0  #: Number of messages discarded by the sampling mode; individual per subscriber.
 
 
-class Subscriber(MessagePort[MessageClass]):
+class SubscriberBase(MessagePort[MessageClass], typing.Generic[MessageClass, ReceivedClass]):
     """
-    A task should request its own independent subscriber instance from the presentation layer controller.
-    Do not share the same subscriber instance across different tasks. This class implements the RAII pattern.
-
-    Whenever a message is received from a subject, it is deserialized once and the resulting object is
-    passed by reference into each subscriber instance. If there is more than one subscriber instance for
-    a subject, accidental mutation of the object by one consumer may affect other consumers. To avoid this,
-    the application should either avoid mutating received message objects or clone them beforehand.
-
-    This class implements the async iterator protocol yielding received messages.
-    Iteration stops shortly after the subscriber is closed.
-    It can be used as follows::
-
-        async for message, transfer in subscriber:
-            ...  # Handle the message.
-        # The loop will be stopped shortly after the subscriber is closed.
-
-    Implementation info: all subscribers sharing the same session specifier also share the same
-    underlying implementation object containing the transport session which is reference counted and destroyed
-    automatically when the last subscriber with that session specifier is closed;
-    the user code cannot access it and generally shouldn't care.
+    The common implementation of :class:`Subscriber` and :class:`LazySubscriber`,
+    which differ only in the type of the received items.
     """
 
+    _LAZY = False
+
     def __init__(
-        self, impl: SubscriberImpl[MessageClass], loop: asyncio.AbstractEventLoop, queue_capacity: typing.Optional[int]
+        self,
+        impl: SubscriberImpl[MessageClass],
+        loop: asyncio.AbstractEventLoop,
+        queue_capacity: typing.Optional[int],
     ):
         """
         Do not call this directly! Use :meth:`Presentation.make_subscriber`.
@@ -75,12 +68,12 @@ class Subscriber(MessagePort[MessageClass]):
         self._impl = impl
         self._loop = loop
         self._maybe_task: typing.Optional[asyncio.Task[None]] = None
-        self._rx: _Listener[MessageClass] = _Listener(asyncio.Queue(maxsize=queue_capacity))
+        self._rx: _Listener[MessageClass] = _Listener(asyncio.Queue(maxsize=queue_capacity), lazy=self._LAZY)
         impl.add_listener(self._rx)
 
     # ----------------------------------------  HANDLER-BASED API  ----------------------------------------
 
-    def receive_in_background(self, handler: ReceivedMessageHandler[MessageClass]) -> None:
+    def receive_in_background(self, handler: ReceivedMessageHandler[ReceivedClass], direct: bool = False) -> None:
         """
         Configures the subscriber to invoke the specified handler whenever a message is received.
         The handler is an async callable or returns an awaitable.
@@ -89,16 +82,22 @@ class Subscriber(MessagePort[MessageClass]):
         only the last configured handler will be active (the old ones will be forgotten).
         If the handler throws an exception, it will be suppressed and logged.
 
-        This method internally starts a new task. If the subscriber is closed while the task is running,
+        By default, the messages are buffered in the queue of this subscriber (see the queue capacity parameter
+        of :meth:`Presentation.make_subscriber`) and the handler is invoked from a dedicated task.
+        If the subscriber is closed while the task is running,
         the task will be silently cancelled automatically; the application need not get involved.
 
+        If ``direct`` is True, the handler is invoked directly from the task that receives and deserializes messages
+        from the subject, which is shared by all subscribers with the same session specifier.
+        This avoids the overhead of the queue and of the context switching, but the handlers of the subject
+        are invoked one after another, so a handler that does not return quickly delays the delivery of messages
+        to the other subscribers of the subject. Direct handlers should therefore not block.
+
         This method of handling messages should not be used with the plain async receive API;
         an attempt to do so may lead to unpredictable message distribution between consumers.
         """
 
         async def task_function() -> None:
-            # This could be an interesting opportunity for optimization: instead of using the queue, just let the
-            # implementation class invoke the handler from its own receive task directly. Eliminates extra indirection.
             while not self._closed:
                 try:
                     async for message, transfer in self:
@@ -117,14 +116,19 @@ class Subscriber(MessagePort[MessageClass]):
 
         if self._maybe_task is not None:
             self._maybe_task.cancel()
+            self._maybe_task = None
 
-        self._maybe_task = self._loop.create_task(task_function())
+        if direct:
+            self._rx.handler = handler
+        else:
+            self._rx.handler = None
+            self._maybe_task = self._loop.create_task(task_function())
 
     # ----------------------------------------  DIRECT RECEIVE  ----------------------------------------
 
     async def receive(
         self, monotonic_deadline: float
-    ) -> typing.Optional[typing.Tuple[MessageClass, pyuavcan.transport.TransferFrom]]:
+    ) -> typing.Optional[typing.Tuple[ReceivedClass, pyuavcan.transport.TransferFrom]]:
         """
         Blocks until either a valid message is received,
         in which case it is returned along with the transfer which delivered it;
@@ -144,34 +148,42 @@ class Subscriber(MessagePort[MessageClass]):
 
     async def receive_for(
         self, timeout: float
-    ) -> typing.Optional[typing.Tuple[MessageClass, pyuavcan.transport.TransferFrom]]:
+    ) -> typing.Optional[typing.Tuple[ReceivedClass, pyuavcan.transport.TransferFrom]]:
         """
         This is like :meth:`receive` but with a relative timeout instead of an absolute deadline.
         """
         self._raise_if_closed_or_failed()
-        try:
-            if timeout > 0:
-                message, transfer = await asyncio.wait_for(self._rx.queue.get(), timeout)
-            else:
-                message, transfer = self._rx.queue.get_nowait()
-        except asyncio.QueueEmpty:
-            return None
-        except asyncio.TimeoutError:
-            return None
-        else:
-            assert isinstance(message, self._impl.dtype), "Internal protocol violation"
+        deadline = self._loop.time() + timeout
+        while True:
+            try:
+                if timeout > 0:
+                    message, transfer = await asyncio.wait_for(self._rx.queue.get(), timeout)
+                else:
+                    message, transfer = self._rx.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return None
+            except asyncio.TimeoutError:
+                return None
+            if message is None:  # The deserialization is postponed until the message is read; see latest_only.
+                message = self._impl.deserialize(transfer, self._LAZY)
+                if message is None:
+                    timeout = deadline - self._loop.time()
+                    continue
+                self._rx.push_count += 1  # Counted once delivered because the replaced items are only skipped.
+            expected_type = pyuavcan.dsdl.LazyView if self._LAZY else self._impl.dtype
+            assert isinstance(message, expected_type), "Internal protocol violation"
             assert isinstance(transfer, pyuavcan.transport.TransferFrom), "Internal protocol violation"
-            return message, transfer
+            return typing.cast(ReceivedClass, message), transfer
 
     # ----------------------------------------  ITERATOR API  ----------------------------------------
 
-    def __aiter__(self) -> Subscriber[MessageClass]:
+    def __aiter__(self) -> SubscriberBase[MessageClass, ReceivedClass]:
         """
         Iterator API support. Returns self unchanged.
         """
         return self
 
-    async def __anext__(self) -> typing.Tuple[MessageClass, pyuavcan.transport.TransferFrom]:
+    async def __anext__(self) -> typing.Tuple[ReceivedClass, pyuavcan.transport.TransferFrom]:
         """
         This is like :meth:`receive` with an infinite timeout, so it cannot return None.
         """
@@ -184,6 +196,63 @@ class Subscriber(MessagePort[MessageClass]):
             pass
         raise StopAsyncIteration
 
+    # ----------------------------------------  SAMPLING  ----------------------------------------
+
+    @property
+    def decimation(self) -> int:
+        """
+        Only every N-th message received from the subject is delivered to this subscriber, starting from the next one.
+        The default is 1, meaning that every message is delivered. Raises :class:`ValueError` if the value is not
+        a positive integer.
+        """
+        return self._rx.decimation
+
+    @decimation.setter
+    def decimation(self, value: int) -> None:
+        value = int(value)
+        if value < 1:
+            raise ValueError(f"Invalid decimation factor: {value}")
+        self._rx.decimation = value
+        self._rx.decimation_phase = 0
+
+    @property
+    def max_rate(self) -> typing.Optional[float]:
+        """
+        If set, the messages are delivered to this subscriber at the specified rate [hertz] at most;
+        the messages received sooner than one period after the last delivered one (according to the transfer
+        timestamps) are discarded. The default is None, meaning that the rate is not limited.
+        Raises :class:`ValueError` if the value is not positive.
+        """
+        return self._rx.max_rate
+
+    @max_rate.setter
+    def max_rate(self, value: typing.Optional[float]) -> None:
+        if value is not None:
+            value = float(value)
+            if not value > 0:
+                raise ValueError(f"Invalid rate limit: {value}")
+        self._rx.max_rate = value
+        self._rx.next_sample_time = 0.0
+
+    @property
+    def latest_only(self) -> bool:
+        """
+        If True, only the latest received message is kept for the consumer of this subscriber:
+        a newly received message replaces the one that has not been read yet instead of being queued after it.
+        The replaced messages are never deserialized because the deserialization is postponed until the message
+        is read. The replaced messages are counted as skipped and the kept one is counted as received once it is read.
+        This mode does not affect a direct handler configured via :meth:`receive_in_background`,
+        because a direct handler consumes every message immediately.
+        The default is False.
+        """
+        return self._rx.latest_only
+
+    @latest_only.setter
+    def latest_only(self, value: bool) -> None:
+        self._rx.latest_only = bool(value)
+        if self._rx.latest_only:
+            self._rx.discard_stale()
+
     # ----------------------------------------  AUXILIARY  ----------------------------------------
 
     @property
@@ -204,11 +273,13 @@ class Subscriber(MessagePort[MessageClass]):
             messages=self._rx.push_count,
             deserialization_failures=self._impl.deserialization_failure_count,
             overruns=self._rx.overrun_count,
+            skipped=self._rx.skip_count,
         )
 
     def close(self) -> None:
         if not self._closed:
             self._closed = True
+            self._rx.handler = None
             self._impl.remove_listener(self._rx)
             if self._maybe_task is not None:  # The task may be holding the lock.
                 try:
@@ -239,27 +310,122 @@ class Subscriber(MessagePort[MessageClass]):
             self._impl.remove_listener(self._rx)
 
 
+class Subscriber(SubscriberBase[MessageClass, MessageClass]):
+    """
+    A task should request its own independent subscriber instance from the presentation layer controller.
+    Do not share the same subscriber instance across different tasks. This class implements the RAII pattern.
+
+    Whenever a message is received from a subject, it is deserialized once and the resulting object is
+    passed by reference into each subscriber instance. If there is more than one subscriber instance for
+    a subject, accidental mutation of the object by one consumer may affect other consumers. To avoid this,
+    the application should either avoid mutating received message objects or clone them beforehand.
+
+    This class implements the async iterator protocol yielding received messages.
+    Iteration stops shortly after the subscriber is closed.
+    It can be used as follows::
+
+        async for message, transfer in subscriber:
+            ...  # Handle the message.
+        # The loop will be stopped shortly after the subscriber is closed.
+
+    Implementation info: all subscribers sharing the same session specifier also share the same
+    underlying implementation object containing the transport session which is reference counted and destroyed
+    automatically when the last subscriber with that session specifier is closed;
+    the user code cannot access it and generally shouldn't care.
+
+    A subscriber that does not need every message of a high-rate subject can reduce the processing load
+    by configuring the sampling mode: see :attr:`decimation`, :attr:`max_rate`, and :attr:`latest_only`.
+    The transfers discarded by the sampling mode are not deserialized unless other subscribers of the subject need them.
+    """
+
+
+class LazySubscriber(SubscriberBase[MessageClass, pyuavcan.dsdl.LazyView[MessageClass]]):
+    """
+    A lazy subscriber receives instances of :class:`pyuavcan.dsdl.LazyView` instead of fully deserialized
+    message objects. The fields of the view are decoded on first access, so consumers that inspect only a few fields
+    of each message (like bus monitors) do not pay for the deserialization of the rest.
+    The validity of the received serialized representation is not checked until the entire view is materialized;
+    hence, messages delivered to lazy subscribers are not accounted for in the deserialization failure counter
+    unless there is also a non-lazy subscriber on the same subject.
+
+    Aside from the type of the received items, a lazy subscriber behaves exactly like :class:`Subscriber`.
+    """
+
+    _LAZY = True
+
+
 @dataclasses.dataclass
 class _Listener(typing.Generic[MessageClass]):
     """
-    The queue-induced extra level of indirection adds processing overhead and latency. In the future we may need to
-    consider an optimization where the subscriber would automatically detect whether the underlying implementation
-    is shared among many subscribers or not. If not, it should bypass the queue and read from the transport directly
-    instead. This would avoid the unnecessary overheads and at the same time would be transparent for the user.
+    The queue-induced extra level of indirection adds processing overhead and latency.
+    If the handler is set, the queue is bypassed: the implementation invokes the handler directly from its task.
+    In the latest-only mode, the queue contains at most one item, whose message is None because
+    the deserialization is postponed until the item is read.
     """
 
-    queue: asyncio.Queue[typing.Tuple[MessageClass, pyuavcan.transport.TransferFrom]]
+    queue: asyncio.Queue[typing.Tuple[typing.Optional[_ReceivedItem[MessageClass]], pyuavcan.transport.TransferFrom]]
+    lazy: bool = False
+    handler: typing.Optional[ReceivedMessageHandler[typing.Any]] = None
+    decimation: int = 1
+    decimation_phase: int = 0
+    max_rate: typing.Optional[float] = None
+    next_sample_time: float = 0.0
+    latest_only: bool = False
     push_count: int = 0
     overrun_count: int = 0
+    skip_count: int = 0
     exception: typing.Optional[Exception] = None
 
-    def push(self, message: MessageClass, transfer: pyuavcan.transport.TransferFrom) -> None:
+    @property
+    def deferred(self) -> bool:
+        return self.latest_only and self.handler is None
+
+    def sample(self, transfer: pyuavcan.transport.TransferFrom) -> bool:
+        """
+        Returns False if the transfer shall be skipped according to the sampling mode.
+        """
+        if self.decimation > 1:
+            phase = self.decimation_phase
+            self.decimation_phase = (phase + 1) % self.decimation
+            if phase != 0:
+                self.skip_count += 1
+                return False
+        if self.max_rate is not None:
+            ts = float(transfer.timestamp.monotonic)
+            if ts < self.next_sample_time:
+                self.skip_count += 1
+                return False
+            self.next_sample_time = ts + 1.0 / self.max_rate
+        return True
+
+    def push_latest(self, transfer: pyuavcan.transport.TransferFrom) -> None:
+        self.discard_stale(keep=0)
+        self.queue.put_nowait((None, transfer))
+
+    def discard_stale(self, keep: int = 1) -> None:
+        while self.queue.qsize() > keep:
+            self.queue.get_nowait()
+            self.skip_count += 1
+
+    def push(self, message: _ReceivedItem[MessageClass], transfer: pyuavcan.transport.TransferFrom) -> None:
         try:
             self.queue.put_nowait((message, transfer))
             self.push_count += 1
         except asyncio.QueueFull:
             self.overrun_count += 1
 
+    async def invoke(self, message: _ReceivedItem[MessageClass], transfer: pyuavcan.transport.TransferFrom) -> None:
+        handler = self.handler
+        if handler is None:  # Unset or closed while the preceding handlers were running.
+            return
+        self.push_count += 1
+        try:
+            await handler(message, transfer)
+        except Exception as ex:
+            if isinstance(ex, asyncio.CancelledError):
+                raise
+            _logger.exception("%r got an unhandled exception in the message handler: %s", self, ex)
+
     def __repr__(self) -> str:
         """
         Overriding repr() is necessary to avoid the contents of the queue from being printed.
@@ -269,8 +435,14 @@ class _Listener(typing.Generic[MessageClass]):
         return pyuavcan.util.repr_attributes_noexcept(
             self,
             queue_length=self.queue.qsize(),
+            lazy=self.lazy,
+            handler=self.handler,
+            decimation=self.decimation,
+            max_rate=self.max_rate,
+            latest_only=self.latest_only,
             push_count=self.push_count,
             overrun_count=self.overrun_count,
+            skip_count=self.skip_count,
             exception=self.exception,
         )
 
@@ -308,12 +480,7 @@ class SubscriberImpl(Closable, typing.Generic[MessageClass]):
             while not self.is_closed:
                 transfer = await self.transport_session.receive(self._loop.time() + _RECEIVE_TIMEOUT)
                 if transfer is not None:
-                    message = pyuavcan.dsdl.deserialize(self.dtype, transfer.fragmented_payload)
-                    if message is not None:
-                        for rx in self._listeners:
-                            rx.push(message, transfer)
-                    else:
-                        self.deserialization_failure_count += 1
+                    await self._deliver(transfer)
         except asyncio.CancelledError:
             _logger.debug("Cancelling the subscriber task of %s", self)
         except Exception as ex:
@@ -323,6 +490,51 @@ class SubscriberImpl(Closable, typing.Generic[MessageClass]):
         finally:
             self._finalize(exception)
 
+    def deserialize(
+        self, transfer: pyuavcan.transport.TransferFrom, lazy: bool
+    ) -> typing.Optional[_ReceivedItem[MessageClass]]:
+        """
+        Used by the subscribers that postpone the deserialization until the message is read.
+        """
+        if lazy:
+            return pyuavcan.dsdl.LazyView(self.dtype, transfer.fragmented_payload)
+        message = pyuavcan.dsdl.deserialize(self.dtype, transfer.fragmented_payload)
+        if message is None:
+            self.deserialization_failure_count += 1
+        return message
+
+    async def _deliver(self, transfer: pyuavcan.transport.TransferFrom) -> None:
+        # The sampling is done before deserialization so that the skipped transfers are not deserialized at all.
+        # The handlers may add or remove listeners while we are iterating, hence the copy.
+        listeners = [rx for rx in self._listeners if rx.sample(transfer)]
+        message: typing.Optional[MessageClass] = None
+        if any(not rx.lazy and not rx.deferred for rx in listeners):
+            message = pyuavcan.dsdl.deserialize(self.dtype, transfer.fragmented_payload)
+            if message is None:
+                self.deserialization_failure_count += 1
+                return
+        view: typing.Optional[pyuavcan.dsdl.LazyView[MessageClass]] = None
+        direct: typing.List[typing.Tuple[_Listener[MessageClass], _ReceivedItem[MessageClass]]] = []
+        item: _ReceivedItem[MessageClass]
+        for rx in listeners:
+            if rx.deferred:
+                rx.push_latest(transfer)
+                continue
+            if rx.lazy:
+                if view is None:  # The view is shared between the lazy listeners, like the deserialized object.
+                    view = pyuavcan.dsdl.LazyView(self.dtype, transfer.fragmented_payload)
+                item = view
+            else:
+                assert message is not None
+                item = message
+            if rx.handler is None:
+                rx.push(item, transfer)
+            else:
+                direct.append((rx, item))
+        # The queues are populated first so that the queued consumers are not delayed by the direct handlers.
+        for rx, item in direct:
+            await rx.invoke(item, transfer)
+
     def _finalize(self, exception: typing.Optional[Exception] = None) -> None:
         exception = exception if exception is not None else PortClosedError(repr(self))
         try:
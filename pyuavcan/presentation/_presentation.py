@@ -9,9 +9,13 @@ import asyncio
 import pyuavcan.util
 import pyuavcan.dsdl
 import pyuavcan.transport
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from typing_extensions import Literal  # Not available in the standard library before Python 3.8.
+
 from ._port import OutgoingTransferIDCounter, PortFinalizer, Closable, Port
 from ._port import Publisher, PublisherImpl
-from ._port import Subscriber, SubscriberImpl
+from ._port import Subscriber, LazySubscriber, SubscriberImpl
 from ._port import Client, ClientImpl
 from ._port import Server
 
@@ -141,9 +145,44 @@ class Presentation:
         assert isinstance(impl, PublisherImpl)
         return Publisher(impl, self.loop)
 
+    @typing.overload
     def make_subscriber(
-        self, dtype: typing.Type[MessageClass], subject_id: int, queue_capacity: typing.Optional[int] = None
+        self,
+        dtype: typing.Type[MessageClass],
+        subject_id: int,
+        queue_capacity: typing.Optional[int] = None,
+        lazy: Literal[False] = False,
     ) -> Subscriber[MessageClass]:
+        ...
+
+    @typing.overload
+    def make_subscriber(
+        self,
+        dtype: typing.Type[MessageClass],
+        subject_id: int,
+        queue_capacity: typing.Optional[int] = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazySubscriber[MessageClass]:
+        ...
+
+    @typing.overload
+    def make_subscriber(
+        self,
+        dtype: typing.Type[MessageClass],
+        subject_id: int,
+        queue_capacity: typing.Optional[int] = None,
+        lazy: bool = False,
+    ) -> typing.Union[Subscriber[MessageClass], LazySubscriber[MessageClass]]:
+        ...
+
+    def make_subscriber(
+        self,
+        dtype: typing.Type[MessageClass],
+        subject_id: int,
+        queue_capacity: typing.Optional[int] = None,
+        lazy: bool = False,
+    ) -> typing.Union[Subscriber[MessageClass], LazySubscriber[MessageClass]]:
         """
         Creates a new subscriber instance for the specified subject-ID. All subscribers created for a specific
         subject share the same underlying implementation object which is hidden from the user; the implementation
@@ -158,6 +197,9 @@ class Presentation:
         the queue may become full in which case newer messages will be dropped and the overrun counter
         will be incremented once per dropped message.
 
+        If lazy is True, a :class:`LazySubscriber` is returned instead, which receives :class:`pyuavcan.dsdl.LazyView`
+        instances that decode the fields of the message on first access instead of fully deserialized objects.
+
         See :class:`Subscriber` for further information about subscribers.
         """
         if issubclass(dtype, pyuavcan.dsdl.ServiceObject):
@@ -188,6 +230,8 @@ class Presentation:
             self._registry[Subscriber, session_specifier] = impl
 
         assert isinstance(impl, SubscriberImpl)
+        if lazy:
+            return LazySubscriber(impl=impl, loop=self.loop, queue_capacity=queue_capacity)
         return Subscriber(impl=impl, loop=self.loop, queue_capacity=queue_capacity)
 
     def make_client(
@@ -324,15 +368,46 @@ class Presentation:
         """
         return self.make_publisher(dtype=dtype, subject_id=self._get_fixed_port_id(dtype))
 
+    @typing.overload
     def make_subscriber_with_fixed_subject_id(
-        self, dtype: typing.Type[FixedPortMessageClass], queue_capacity: typing.Optional[int] = None
+        self,
+        dtype: typing.Type[FixedPortMessageClass],
+        queue_capacity: typing.Optional[int] = None,
+        lazy: Literal[False] = False,
     ) -> Subscriber[FixedPortMessageClass]:
+        ...
+
+    @typing.overload
+    def make_subscriber_with_fixed_subject_id(
+        self,
+        dtype: typing.Type[FixedPortMessageClass],
+        queue_capacity: typing.Optional[int] = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazySubscriber[FixedPortMessageClass]:
+        ...
+
+    @typing.overload
+    def make_subscriber_with_fixed_subject_id(
+        self,
+        dtype: typing.Type[FixedPortMessageClass],
+        queue_capacity: typing.Optional[int] = None,
+        lazy: bool = False,
+    ) -> typing.Union[Subscriber[FixedPortMessageClass], LazySubscriber[FixedPortMessageClass]]:
+        ...
+
+    def make_subscriber_with_fixed_subject_id(
+        self,
+        dtype: typing.Type[FixedPortMessageClass],
+        queue_capacity: typing.Optional[int] = None,
+        lazy: bool = False,
+    ) -> typing.Union[Subscriber[FixedPortMessageClass], LazySubscriber[FixedPortMessageClass]]:
         """
         A wrapper for :meth:`make_subscriber` that uses the fixed subject-ID associated with this type.
         Raises a TypeError if the type has no fixed subject-ID.
         """
         return self.make_subscriber(
-            dtype=dtype, subject_id=self._get_fixed_port_id(dtype), queue_capacity=queue_capacity
+            dtype=dtype, subject_id=self._get_fixed_port_id(dtype), queue_capacity=queue_capacity, lazy=lazy
         )
 
     def make_client_with_fixed_service_id(
@@ -315,6 +315,23 @@ class OutputSession(Session):
         """
         raise NotImplementedError
 
+    async def send_many(self, transfers: typing.Sequence[Transfer], monotonic_deadline: float) -> int:
+        """
+        Sends the transfers in the specified order; blocks if necessary until the specified deadline [second].
+        Returns the number of transfers from the beginning of the sequence that have been sent;
+        the number is less than the number of transfers if the deadline is reached.
+        Otherwise, the behavior is identical to invoking :meth:`send` for each transfer one after another.
+
+        Transports that are able to emit multiple transfers at once (e.g., using one system call per batch)
+        override this method. The default implementation simply invokes :meth:`send` for each transfer.
+        """
+        count = 0
+        for tr in transfers:
+            if not await self.send(tr, monotonic_deadline):
+                break
+            count += 1
+        return count
+
     @abc.abstractmethod
     def enable_feedback(self, handler: typing.Callable[[Feedback], None]) -> None:
         """
@@ -14,7 +14,7 @@ from .media import Media, Envelope, optimize_filter_configurations, FilterConfig
 from ._session import CANInputSession, CANOutputSession, SendTransaction
 from ._session import BroadcastCANOutputSession, UnicastCANOutputSession
 from ._frame import UAVCANFrame, TRANSFER_ID_MODULO
-from ._identifier import CANID, generate_filter_configurations
+from ._identifier import CANID, generate_session_filter_configurations
 from ._input_dispatch_table import InputDispatchTable
 from ._tracer import CANTracer, CANCapture
 
@@ -37,6 +37,7 @@ class CANTransportStatistics(pyuavcan.transport.TransportStatistics):
     in_frames_uavcan_accepted: int = 0  #: Subset of the above that are useful for the local application.
     in_frames_loopback: int = 0  #: Number of loopback frames received from the media instance (not bus).
     in_frames_errored: int = 0  #: How many frames of any kind could not be successfully processed.
+    in_frames_rejected_by_media: int = 0  #: Frames discarded by the media acceptance filters, if reported by media.
 
     out_frames: int = 0  #: Number of frames sent to the media instance successfully.
     out_frames_timeout: int = 0  #: Number of frames that were supposed to be sent but timed out.
@@ -52,6 +53,14 @@ class CANTransportStatistics(pyuavcan.transport.TransportStatistics):
         """
         return (self.in_frames_uavcan_accepted / self.in_frames) if self.in_frames > 0 else 1.0
 
+    @property
+    def in_frames_rejected_by_transport(self) -> int:
+        """
+        The number of frames that passed the media acceptance filters but were discarded by the transport.
+        Unlike :attr:`in_frames_rejected_by_media`, each of these has cost some CPU time in the user space.
+        """
+        return self.in_frames - self.in_frames_uavcan_accepted
+
     @property
     def lost_loopback_frames(self) -> int:
         """
@@ -162,7 +171,10 @@ class CANTransport(pyuavcan.transport.Transport):
             media.close()
 
     def sample_statistics(self) -> CANTransportStatistics:
-        return copy.copy(self._frame_stats)
+        out = copy.copy(self._frame_stats)
+        if self._maybe_media is not None:
+            out.in_frames_rejected_by_media = self._maybe_media.number_of_frames_rejected_by_acceptance_filters or 0
+        return out
 
     def get_input_session(
         self, specifier: pyuavcan.transport.InputSessionSpecifier, payload_metadata: pyuavcan.transport.PayloadMetadata
@@ -296,11 +308,12 @@ class CANTransport(pyuavcan.transport.Transport):
                 f"Anonymous nodes cannot emit multi-frame transfers. Spoof metadata: {transfer.metadata}"
             )
         transaction = SendTransaction(frames, loopback_first=False, monotonic_deadline=monotonic_deadline)
-        return await self._do_send(transaction)
+        return await self._do_send(transaction) == len(frames)
 
-    async def _do_send(self, t: SendTransaction) -> bool:
+    async def _do_send(self, t: SendTransaction) -> int:
         """
         All frames shall share the same CAN ID value.
+        :returns: The number of frames sent; all of them have been sent if it equals the number of frames.
         """
         force_loopback = bool(self._capture_handlers)
         async with self._media_lock:
@@ -347,7 +360,7 @@ class CANTransport(pyuavcan.transport.Transport):
                 can_id_int,
             )
 
-        return not unsent_frames
+        return num_sent
 
     def _on_frames_received(self, frames: typing.Sequence[typing.Tuple[Timestamp, Envelope]]) -> None:
         if _logger.isEnabledFor(logging.DEBUG):
@@ -414,13 +427,11 @@ class CANTransport(pyuavcan.transport.Transport):
 
     def _reconfigure_acceptance_filters(self) -> None:
         if not self._capture_handlers:
-            subject_ids = set(
-                ds.subject_id
-                for ds in (x.specifier.data_specifier for x in self._input_dispatch_table.items)
-                if isinstance(ds, pyuavcan.transport.MessageDataSpecifier)
+            # The configuration is exact per session; if the media has fewer filters, it is optimized below.
+            fcs = generate_session_filter_configurations(
+                (x.specifier for x in self._input_dispatch_table.items), self._local_node_id
             )
-            fcs = generate_filter_configurations(subject_ids, self._local_node_id)
-            assert len(fcs) > len(subject_ids)
+            assert len(fcs) > 0
         else:
             fcs = [
                 FilterConfiguration.new_promiscuous(FrameFormat.BASE),
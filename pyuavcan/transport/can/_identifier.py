@@ -200,6 +200,57 @@ def generate_filter_configurations(
     return full
 
 
+def generate_session_filter_configurations(
+    specifiers: typing.Iterable[pyuavcan.transport.InputSessionSpecifier], local_node_id: typing.Optional[int]
+) -> typing.Sequence[pyuavcan.transport.can.media.FilterConfiguration]:
+    """
+    Unlike :func:`generate_filter_configurations`, this function generates an exact filter configuration per
+    input session: service transfers are filtered by the service-ID and role, and transfers from a specific
+    source are filtered by the source node-ID unless there is a promiscuous session for the same data specifier.
+    This is intended for media with a large number of acceptance filters, such as SocketCAN;
+    for other media, the result is reduced by :func:`pyuavcan.transport.can.media.optimize_filter_configurations`.
+    """
+    from .media import FrameFormat, FilterConfiguration
+
+    def ext(idn: int, msk: int) -> FilterConfiguration:
+        assert idn <= _CANID_EXT_MASK and msk <= _CANID_EXT_MASK
+        return FilterConfiguration(identifier=idn, mask=msk, format=FrameFormat.EXTENDED)
+
+    # Promiscuous sessions subsume the selective ones with the same data specifier.
+    sources: typing.Dict[pyuavcan.transport.DataSpecifier, typing.Set[typing.Optional[int]]] = {}
+    for spec in specifiers:
+        sources.setdefault(spec.data_specifier, set()).add(spec.remote_node_id)
+
+    full: typing.List[FilterConfiguration] = []
+    if local_node_id is not None:
+        assert local_node_id <= CANID.NODE_ID_MASK
+        full.append(ext(idn=int(local_node_id), msk=_BIT_R23 | CANID.NODE_ID_MASK))  # Loopback frames.
+    else:
+        full.append(ext(idn=_BIT_MSG_ANON, msk=_BIT_SRV_NOT_MSG | _BIT_MSG_ANON | _BIT_R23 | _BIT_MSG_R7))
+
+    for ds, nodes in sorted(sources.items(), key=lambda x: str(x[0])):  # Sorted for testability.
+        if isinstance(ds, pyuavcan.transport.MessageDataSpecifier):
+            idn = int(ds.subject_id) << 8
+            msk = _BIT_SRV_NOT_MSG | _BIT_R23 | (ds.SUBJECT_ID_MASK << 8) | _BIT_MSG_R7
+        elif isinstance(ds, pyuavcan.transport.ServiceDataSpecifier):
+            if local_node_id is None:
+                continue  # Anonymous nodes cannot receive service transfers.
+            idn = _BIT_SRV_NOT_MSG | (int(ds.service_id) << 14) | (int(local_node_id) << 7)
+            idn |= _BIT_SRV_REQ if ds.role == ds.Role.REQUEST else 0
+            msk = _BIT_SRV_NOT_MSG | _BIT_SRV_REQ | _BIT_R23 | (ds.SERVICE_ID_MASK << 14) | (CANID.NODE_ID_MASK << 7)
+        else:  # pragma: no cover
+            assert False
+        if None in nodes:
+            full.append(ext(idn=idn, msk=msk))
+        else:
+            msk |= CANID.NODE_ID_MASK
+            if isinstance(ds, pyuavcan.transport.MessageDataSpecifier):
+                msk |= _BIT_MSG_ANON  # The source node-ID of anonymous transfers is not valid.
+            full.extend(ext(idn=idn | int(nid), msk=msk) for nid in sorted(typing.cast(typing.Set[int], nodes)))
+
+    return full
+
+
 def _unittest_can_filter_configuration() -> None:
     from .media import FilterConfiguration, optimize_filter_configurations, FrameFormat
 
@@ -289,6 +340,43 @@ def _unittest_can_filter_configuration() -> None:
     print([str(r) for r in reduced])
 
 
+def _unittest_can_session_filter_configuration() -> None:
+    from pyuavcan.transport import InputSessionSpecifier, MessageDataSpecifier, ServiceDataSpecifier, Priority
+    from .media import FilterConfiguration, FrameFormat
+
+    def accepted(fcs: typing.Sequence[FilterConfiguration], identifier: int) -> bool:
+        assert all(f.format == FrameFormat.EXTENDED for f in fcs)
+        return any((identifier & f.mask) == (f.identifier & f.mask) for f in fcs)
+
+    specifiers = [
+        InputSessionSpecifier(MessageDataSpecifier(1234), None),
+        InputSessionSpecifier(MessageDataSpecifier(1234), 42),  # Subsumed by the promiscuous one.
+        InputSessionSpecifier(MessageDataSpecifier(555), 42),
+        InputSessionSpecifier(ServiceDataSpecifier(300, ServiceDataSpecifier.Role.REQUEST), None),
+        InputSessionSpecifier(ServiceDataSpecifier(301, ServiceDataSpecifier.Role.RESPONSE), 42),
+    ]
+    fcs = generate_session_filter_configurations(specifiers, 10)
+    assert len(fcs) == 5  # Loopback plus one per data specifier.
+    assert accepted(fcs, MessageCANID(Priority.LOW, 99, 1234).compile([]))
+    assert accepted(fcs, MessageCANID(Priority.LOW, None, 1234).compile([memoryview(b"x")]))
+    assert accepted(fcs, MessageCANID(Priority.LOW, 42, 555).compile([]))
+    assert not accepted(fcs, MessageCANID(Priority.LOW, 43, 555).compile([]))
+    assert not accepted(fcs, MessageCANID(Priority.LOW, None, 555).compile([memoryview(b"*")]))
+    assert not accepted(fcs, MessageCANID(Priority.LOW, 99, 1235).compile([]))
+    assert accepted(fcs, ServiceCANID(Priority.LOW, 99, 10, 300, True).compile([]))
+    assert not accepted(fcs, ServiceCANID(Priority.LOW, 99, 10, 300, False).compile([]))
+    assert not accepted(fcs, ServiceCANID(Priority.LOW, 99, 11, 300, True).compile([]))
+    assert not accepted(fcs, ServiceCANID(Priority.LOW, 99, 10, 299, True).compile([]))
+    assert accepted(fcs, ServiceCANID(Priority.LOW, 42, 10, 301, False).compile([]))
+    assert not accepted(fcs, ServiceCANID(Priority.LOW, 41, 10, 301, False).compile([]))
+    assert accepted(fcs, ServiceCANID(Priority.LOW, 10, 99, 1, True).compile([]))  # Loopback.
+
+    fcs = generate_session_filter_configurations(specifiers, None)
+    assert len(fcs) == 3  # Service sessions are ignored.
+    assert accepted(fcs, MessageCANID(Priority.LOW, None, 2000).compile([memoryview(b"x")]))  # Loopback.
+    assert not accepted(fcs, ServiceCANID(Priority.LOW, 42, 10, 301, False).compile([]))
+
+
 def _unittest_can_identifier_parse() -> None:
     from pytest import raises
     from pyuavcan.transport import Priority, MessageDataSpecifier, ServiceDataSpecifier
@@ -9,10 +9,16 @@ from ._session import CANInputSession
 from ._identifier import CANID
 
 
+_Row = typing.List[typing.Optional[CANInputSession]]
+
+
 class InputDispatchTable:
     """
-    Time-memory trade-off: the input dispatch table is tens of megabytes large, but the lookup is very fast and O(1).
-    This is necessary to ensure scalability for high-load applications such as real-time network monitoring.
+    A two-level lookup table: the first level is indexed by the data specifier (subject-ID or service-ID and role),
+    the second level is indexed by the source node-ID. The second-level rows are allocated only for the data
+    specifiers that have input sessions, so the memory footprint is proportional to the number of sessions
+    while the lookup is O(1). This is necessary to ensure scalability for high-load applications such as
+    real-time network monitoring.
     """
 
     _NUM_SUBJECTS = MessageDataSpecifier.SUBJECT_ID_MASK + 1
@@ -20,12 +26,13 @@ class InputDispatchTable:
     _NUM_NODE_IDS = CANID.NODE_ID_MASK + 1
 
     # Services multiplied by two to account for requests and responses.
+    _NUM_ROWS = _NUM_SUBJECTS + _NUM_SERVICES * 2
     # One added to nodes to allow promiscuous inputs which don't care about source node ID.
-    _TABLE_SIZE = (_NUM_SUBJECTS + _NUM_SERVICES * 2) * (_NUM_NODE_IDS + 1)
+    _ROW_SIZE = _NUM_NODE_IDS + 1
 
     def __init__(self) -> None:
         # This method of construction is an order of magnitude faster than range-based. It matters here. A lot.
-        self._table: typing.List[typing.Optional[CANInputSession]] = [None] * (self._TABLE_SIZE + 1)
+        self._rows: typing.List[typing.Optional[_Row]] = [None] * self._NUM_ROWS
 
         # A parallel dict is necessary for constant-complexity element listing. Traversing the table takes forever.
         self._dict: typing.Dict[InputSessionSpecifier, CANInputSession] = {}
@@ -39,24 +46,36 @@ class InputDispatchTable:
         This method is used only when a new input session is created; performance is not a priority.
         """
         key = session.specifier
-        self._table[self._compute_index(key)] = session
+        row_index, column_index = self._compute_index(key)
+        row = self._rows[row_index]
+        if row is None:
+            row = [None] * self._ROW_SIZE
+            self._rows[row_index] = row
+        row[column_index] = session
         self._dict[key] = session
 
     def get(self, specifier: InputSessionSpecifier) -> typing.Optional[CANInputSession]:
         """
         Constant-time lookup. Invoked for every received frame.
         """
-        return self._table[self._compute_index(specifier)]
+        row_index, column_index = self._compute_index(specifier)
+        row = self._rows[row_index]
+        return row[column_index] if row is not None else None
 
     def remove(self, specifier: InputSessionSpecifier) -> None:
         """
         This method is used only when an input session is destroyed; performance is not a priority.
         """
-        self._table[self._compute_index(specifier)] = None
         del self._dict[specifier]
+        row_index, column_index = self._compute_index(specifier)
+        row = self._rows[row_index]
+        assert row is not None
+        row[column_index] = None
+        if not any(row):
+            self._rows[row_index] = None  # Release the memory when the last session of the row is removed.
 
     @staticmethod
-    def _compute_index(specifier: InputSessionSpecifier) -> int:
+    def _compute_index(specifier: InputSessionSpecifier) -> typing.Tuple[int, int]:
         ds, nid = specifier.data_specifier, specifier.remote_node_id
         if isinstance(ds, MessageDataSpecifier):
             dim1 = ds.subject_id
@@ -70,13 +89,11 @@ class InputDispatchTable:
         else:
             assert False
 
-        dim2_cardinality = InputDispatchTable._NUM_NODE_IDS + 1
         dim2 = nid if nid is not None else InputDispatchTable._NUM_NODE_IDS
 
-        point = dim1 * dim2_cardinality + dim2
-
-        assert 0 <= point < InputDispatchTable._TABLE_SIZE
-        return point
+        assert 0 <= dim1 < InputDispatchTable._NUM_ROWS
+        assert 0 <= dim2 < InputDispatchTable._ROW_SIZE
+        return dim1, dim2
 
 
 def _unittest_input_dispatch_table() -> None:
@@ -100,13 +117,16 @@ def _unittest_input_dispatch_table() -> None:
     t.add(a)
     assert list(t.items) == [a]
     assert t.get(InputSessionSpecifier(MessageDataSpecifier(1234), None)) == a
+    assert t.get(InputSessionSpecifier(MessageDataSpecifier(1234), 123)) is None
+    assert sum(1 for x in t._rows if x is not None) == 1  # pylint: disable=protected-access
     t.remove(InputSessionSpecifier(MessageDataSpecifier(1234), None))
     assert len(list(t.items)) == 0
+    assert all(x is None for x in t._rows)  # pylint: disable=protected-access
 
 
 def _unittest_slow_input_dispatch_table_index() -> None:
-    table_size = InputDispatchTable._TABLE_SIZE  # pylint: disable=protected-access
-    values: typing.Set[int] = set()
+    table_size = InputDispatchTable._NUM_ROWS * InputDispatchTable._ROW_SIZE  # pylint: disable=protected-access
+    values: typing.Set[typing.Tuple[int, int]] = set()
     for node_id in (*range(InputDispatchTable._NUM_NODE_IDS), None):  # pylint: disable=protected-access
         for subj in range(InputDispatchTable._NUM_SUBJECTS):  # pylint: disable=protected-access
             out = InputDispatchTable._compute_index(  # pylint: disable=protected-access
@@ -114,7 +134,6 @@ def _unittest_slow_input_dispatch_table_index() -> None:
             )
             assert out not in values
             values.add(out)
-            assert out < table_size
 
         for serv in range(InputDispatchTable._NUM_SERVICES):  # pylint: disable=protected-access
             for role in ServiceDataSpecifier.Role:
@@ -123,6 +142,5 @@ def _unittest_slow_input_dispatch_table_index() -> None:
                 )
                 assert out not in values
                 values.add(out)
-                assert out < table_size
 
     assert len(values) == table_size
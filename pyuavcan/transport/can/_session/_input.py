@@ -4,8 +4,10 @@
 
 from __future__ import annotations
 import copy
+import enum
 import typing
 import asyncio
+import collections
 import logging
 import dataclasses
 import pyuavcan.util
@@ -26,13 +28,45 @@ class CANInputSessionStatistics(pyuavcan.transport.SessionStatistics):
         default_factory=lambda: {e: 0 for e in TransferReassemblyErrorID}
     )
 
+    queue_high_water_mark: int = 0
+    """
+    The maximum number of completed transfers observed in the transfer queue;
+    see :attr:`CANInputSession.transfer_queue_capacity`. Zero unless the transfer queue is enabled.
+    """
+
 
 class CANInputSession(CANSession, pyuavcan.transport.InputSession):
+    """
+    By default, received frames are queued as-is and the transfers are reassembled when the application invokes
+    :meth:`receive`. Alternatively, the transfers can be reassembled as soon as the frames are received,
+    in which case only completed transfers are queued in a fixed-capacity ring buffer;
+    see :attr:`transfer_queue_capacity`. This bounds the memory consumption if the application is slow
+    and reduces the per-frame overhead.
+    """
+
     DEFAULT_TRANSFER_ID_TIMEOUT = 2
     """
     Per the UAVCAN specification. Units are seconds. Can be overridden after instantiation if needed.
     """
 
+    class OverflowPolicy(enum.Enum):
+        """
+        Defines which transfer is discarded when a new transfer is received while the transfer queue is full.
+        Each discarded transfer is counted as one drop in the session statistics.
+        """
+
+        DROP_OLDEST = enum.auto()
+        """The oldest queued transfer is discarded. This is the default."""
+
+        DROP_NEWEST = enum.auto()
+        """The new transfer is discarded."""
+
+        DROP_LOWEST_PRIORITY = enum.auto()
+        """
+        The newest transfer among those with the lowest priority (including the new one) is discarded.
+        The complexity is linear of the queue capacity.
+        """
+
     _QueueItem = typing.Tuple[Timestamp, CANID, UAVCANFrame]
 
     def __init__(
@@ -49,6 +83,12 @@ class CANInputSession(CANSession, pyuavcan.transport.InputSession):
         self._queue: asyncio.Queue[CANInputSession._QueueItem] = asyncio.Queue()
         assert loop is not None
         self._loop = loop
+
+        # Used only if the eager reassembly is enabled, otherwise (or until then) it stays empty.
+        self._transfer_queue: typing.Deque[pyuavcan.transport.TransferFrom] = collections.deque()
+        self._transfer_queue_capacity: typing.Optional[int] = None
+        self._transfer_queue_nonempty = asyncio.Event()
+        self._overflow_policy = CANInputSession.OverflowPolicy.DROP_OLDEST
         self._transfer_id_timeout_ns = int(CANInputSession.DEFAULT_TRANSFER_ID_TIMEOUT / _NANO)
 
         self._receivers = [TransferReassembler(nid, payload_metadata.extent_bytes) for nid in _node_id_range()]
@@ -63,6 +103,11 @@ class CANInputSession(CANSession, pyuavcan.transport.InputSession):
         visibility handling capabilities are limited. I guess we could define a private abstract base to
         handle this but it feels like too much work. Why can't we have protected visibility in Python?
         """
+        if self._transfer_queue_capacity is not None:
+            transfer = self._process_frame(timestamp, can_id, frame)
+            if transfer is not None:
+                self._push_transfer(transfer)
+            return
         try:
             self._queue.put_nowait((timestamp, can_id, frame))
         except asyncio.QueueFull:
@@ -101,6 +146,52 @@ class CANInputSession(CANSession, pyuavcan.transport.InputSession):
         except asyncio.QueueEmpty:
             pass
 
+    @property
+    def transfer_queue_capacity(self) -> typing.Optional[int]:
+        """
+        If not None, the frames are reassembled into transfers eagerly upon reception, and only completed
+        transfers are queued in a ring buffer of this capacity, managed according to :attr:`overflow_policy`.
+        None means that the eager reassembly is disabled, which is the default;
+        in this case, :attr:`frame_queue_capacity` applies instead.
+
+        When the eager reassembly is enabled, the frames that are currently in the frame queue are reassembled
+        immediately. When it is disabled, the transfers that are currently queued are still delivered first.
+        If the capacity is reduced below the number of queued transfers, the excess is discarded
+        according to the overflow policy.
+        If the value is not None, it must be a positive integer, otherwise you get a :class:`ValueError`.
+        """
+        return self._transfer_queue_capacity
+
+    @transfer_queue_capacity.setter
+    def transfer_queue_capacity(self, value: typing.Optional[int]) -> None:
+        if value is not None and not value > 0:
+            raise ValueError(f"Invalid value for queue capacity: {value}")
+        self._transfer_queue_capacity = int(value) if value is not None else None
+        if self._transfer_queue_capacity is not None:
+            pending = list(self._transfer_queue)
+            self._transfer_queue.clear()
+            for tr in pending:
+                self._push_transfer(tr)
+            try:
+                while True:
+                    self._push_frame(*self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                pass
+
+    @property
+    def overflow_policy(self) -> CANInputSession.OverflowPolicy:
+        """
+        The overflow policy of the transfer queue; see :attr:`transfer_queue_capacity`.
+        Does not affect the frame queue.
+        """
+        return self._overflow_policy
+
+    @overflow_policy.setter
+    def overflow_policy(self, value: CANInputSession.OverflowPolicy) -> None:
+        if not isinstance(value, CANInputSession.OverflowPolicy):
+            raise ValueError(f"Invalid overflow policy: {value!r}")
+        self._overflow_policy = value
+
     @property
     def specifier(self) -> pyuavcan.transport.InputSessionSpecifier:
         return self._specifier
@@ -134,6 +225,9 @@ class CANInputSession(CANSession, pyuavcan.transport.InputSession):
         super().close()
 
     async def _do_receive(self, monotonic_deadline: float) -> typing.Optional[pyuavcan.transport.TransferFrom]:
+        if self._transfer_queue or self._transfer_queue_capacity is not None:
+            # Transfers queued before the eager reassembly was disabled are delivered first.
+            return await self._receive_transfer(monotonic_deadline)
         while True:
             try:
                 # Continue reading past the deadline until the queue is empty or a transfer is received.
@@ -150,54 +244,107 @@ class CANInputSession(CANSession, pyuavcan.transport.InputSession):
                 self._raise_if_closed()
                 return None
 
-            self._statistics.frames += 1
-
-            if isinstance(canid, MessageCANID):
-                assert isinstance(self._specifier.data_specifier, pyuavcan.transport.MessageDataSpecifier)
-                assert self._specifier.data_specifier.subject_id == canid.subject_id
-                source_node_id = canid.source_node_id
-                if source_node_id is None:
-                    # Anonymous transfer - no reconstruction needed
-                    self._statistics.transfers += 1
-                    self._statistics.payload_bytes += len(frame.padded_payload)
-                    out = pyuavcan.transport.TransferFrom(
-                        timestamp=timestamp,
-                        priority=canid.priority,
-                        transfer_id=frame.transfer_id,
-                        fragmented_payload=[frame.padded_payload],
-                        source_node_id=None,
-                    )
-                    _logger.debug("%s: Received anonymous transfer: %s; current stats: %s", self, out, self._statistics)
-                    return out
-
-            elif isinstance(canid, ServiceCANID):
-                assert isinstance(self._specifier.data_specifier, pyuavcan.transport.ServiceDataSpecifier)
-                assert self._specifier.data_specifier.service_id == canid.service_id
-                assert (
-                    self._specifier.data_specifier.role == pyuavcan.transport.ServiceDataSpecifier.Role.REQUEST
-                ) == canid.request_not_response
-                source_node_id = canid.source_node_id
-
-            else:
-                assert False
-
-            receiver = self._receivers[source_node_id]
-            result = receiver.process_frame(timestamp, canid.priority, frame, self._transfer_id_timeout_ns)
-            if isinstance(result, TransferReassemblyErrorID):
-                self._statistics.errors += 1
-                self._statistics.reception_error_counters[result] += 1
-                _logger.debug(
-                    "%s: Rejecting CAN frame %s because %s; current stats: %s", self, frame, result, self._statistics
-                )
-            elif isinstance(result, pyuavcan.transport.TransferFrom):
-                self._statistics.transfers += 1
-                self._statistics.payload_bytes += sum(map(len, result.fragmented_payload))
-                _logger.debug("%s: Received transfer: %s; current stats: %s", self, result, self._statistics)
+            result = self._process_frame(timestamp, canid, frame)
+            if result is not None:
                 return result
-            elif result is None:
-                pass  # Nothing to do - expecting more frames
-            else:
-                assert False
+
+    async def _receive_transfer(self, monotonic_deadline: float) -> typing.Optional[pyuavcan.transport.TransferFrom]:
+        while not self._transfer_queue:
+            timeout = monotonic_deadline - self._loop.time()
+            if timeout <= 0:
+                self._raise_if_closed()
+                return None
+            try:
+                await asyncio.wait_for(self._transfer_queue_nonempty.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        out = self._transfer_queue.popleft()
+        if not self._transfer_queue:
+            self._transfer_queue_nonempty.clear()
+        return out
+
+    def _push_transfer(self, transfer: pyuavcan.transport.TransferFrom) -> None:
+        capacity = self._transfer_queue_capacity
+        queue = self._transfer_queue
+        if capacity is not None and len(queue) >= capacity:
+            policy = self._overflow_policy
+            while len(queue) >= capacity:
+                if policy == CANInputSession.OverflowPolicy.DROP_OLDEST:
+                    dropped = queue.popleft()
+                elif policy == CANInputSession.OverflowPolicy.DROP_NEWEST:
+                    dropped = transfer
+                elif policy == CANInputSession.OverflowPolicy.DROP_LOWEST_PRIORITY:
+                    # Greater numerical value stands for lower priority.
+                    index = max(range(len(queue)), key=lambda i: (queue[i].priority, i))
+                    if transfer.priority >= queue[index].priority:
+                        dropped = transfer
+                    else:
+                        dropped = queue[index]
+                        del queue[index]
+                else:  # pragma: no cover
+                    assert False
+                self._statistics.drops += 1
+                _logger.info("%s: Transfer queue overflow; transfer %s is dropped", self, dropped)
+                if dropped is transfer:
+                    return
+        queue.append(transfer)
+        self._statistics.queue_high_water_mark = max(self._statistics.queue_high_water_mark, len(queue))
+        self._transfer_queue_nonempty.set()
+
+    def _process_frame(
+        self, timestamp: Timestamp, canid: CANID, frame: UAVCANFrame
+    ) -> typing.Optional[pyuavcan.transport.TransferFrom]:
+        """
+        Returns the transfer if the frame completes one.
+        """
+        self._statistics.frames += 1
+        if isinstance(canid, MessageCANID):
+            assert isinstance(self._specifier.data_specifier, pyuavcan.transport.MessageDataSpecifier)
+            assert self._specifier.data_specifier.subject_id == canid.subject_id
+            source_node_id = canid.source_node_id
+            if source_node_id is None:
+                # Anonymous transfer - no reconstruction needed
+                self._statistics.transfers += 1
+                self._statistics.payload_bytes += len(frame.padded_payload)
+                out = pyuavcan.transport.TransferFrom(
+                    timestamp=timestamp,
+                    priority=canid.priority,
+                    transfer_id=frame.transfer_id,
+                    fragmented_payload=[frame.padded_payload],
+                    source_node_id=None,
+                )
+                _logger.debug("%s: Received anonymous transfer: %s; current stats: %s", self, out, self._statistics)
+                return out
+
+        elif isinstance(canid, ServiceCANID):
+            assert isinstance(self._specifier.data_specifier, pyuavcan.transport.ServiceDataSpecifier)
+            assert self._specifier.data_specifier.service_id == canid.service_id
+            assert (
+                self._specifier.data_specifier.role == pyuavcan.transport.ServiceDataSpecifier.Role.REQUEST
+            ) == canid.request_not_response
+            source_node_id = canid.source_node_id
+
+        else:
+            assert False
+
+        receiver = self._receivers[source_node_id]
+        result = receiver.process_frame(timestamp, canid.priority, frame, self._transfer_id_timeout_ns)
+        if isinstance(result, TransferReassemblyErrorID):
+            self._statistics.errors += 1
+            self._statistics.reception_error_counters[result] += 1
+            _logger.debug(
+                "%s: Rejecting CAN frame %s because %s; current stats: %s", self, frame, result, self._statistics
+            )
+        elif isinstance(result, pyuavcan.transport.TransferFrom):
+            self._statistics.transfers += 1
+            self._statistics.payload_bytes += sum(map(len, result.fragmented_payload))
+            _logger.debug("%s: Received transfer: %s; current stats: %s", self, result, self._statistics)
+            return result
+        elif result is None:
+            pass  # Nothing to do - expecting more frames
+        else:
+            assert False
+        return None
 
 
 def _node_id_range() -> typing.Iterable[int]:
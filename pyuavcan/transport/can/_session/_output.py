@@ -3,7 +3,9 @@
 # Author: Pavel Kirienko <pavel@uavcan.org>
 
 from __future__ import annotations
+import abc
 import copy
+import bisect
 import typing
 import logging
 import dataclasses
@@ -22,7 +24,8 @@ class SendTransaction:
     monotonic_deadline: float
 
 
-SendHandler = typing.Callable[[SendTransaction], typing.Awaitable[bool]]
+SendHandler = typing.Callable[[SendTransaction], typing.Awaitable[int]]
+"""Returns the number of frames of the transaction that have been sent."""
 
 _logger = logging.getLogger(__name__)
 
@@ -121,30 +124,14 @@ class CANOutputSession(CANSession, pyuavcan.transport.OutputSession):
     def close(self) -> None:  # pylint: disable=useless-super-delegation
         super().close()
 
-    async def _do_send(self, can_id: CANID, transfer: pyuavcan.transport.Transfer, monotonic_deadline: float) -> bool:
+    async def send(self, transfer: pyuavcan.transport.Transfer, monotonic_deadline: float) -> bool:
         self._raise_if_closed()
-
-        # Decompose the outgoing transfer into individual CAN frames.
-        compiled_identifier = can_id.compile(transfer.fragmented_payload)
-        tid_mod = transfer.transfer_id % TRANSFER_ID_MODULO  # https://github.com/UAVCAN/pyuavcan/issues/120
-        frames = list(
-            serialize_transfer(
-                compiled_identifier=compiled_identifier,
-                transfer_id=tid_mod,
-                fragmented_payload=transfer.fragmented_payload,
-                max_frame_payload_bytes=self._transport.protocol_parameters.mtu,
-            )
-        )
-
-        # Ensure we're not trying to emit a multi-frame anonymous transfer - that's illegal.
-        if can_id.source_node_id is None and len(frames) > 1:
-            raise pyuavcan.transport.OperationNotDefinedForAnonymousNodeError(
-                f"Anonymous nodes cannot emit multi-frame transfers. CANID: {can_id}, transfer: {transfer}"
-            )
+        compiled_identifier, frames = self._serialize(transfer)
 
         # If a loopback was requested, register it in the pending loopback registry.
         loopback_first_frame = self._feedback_handler is not None
         if loopback_first_frame:
+            tid_mod = frames[0].transfer_id
             key = _PendingFeedbackKey(compiled_identifier=compiled_identifier, transfer_id_modulus=tid_mod)
             try:
                 old = self._pending_feedback[key]
@@ -160,7 +147,7 @@ class CANOutputSession(CANSession, pyuavcan.transport.OutputSession):
             transaction = SendTransaction(
                 frames=frames, loopback_first=loopback_first_frame, monotonic_deadline=monotonic_deadline
             )
-            if await self._send_handler(transaction):
+            if await self._send_handler(transaction) == len(frames):
                 self._statistics.transfers += 1
                 self._statistics.frames += len(frames)
                 self._statistics.payload_bytes += sum(map(len, transfer.fragmented_payload))  # Session level
@@ -171,6 +158,78 @@ class CANOutputSession(CANSession, pyuavcan.transport.OutputSession):
             self._statistics.errors += 1
             raise
 
+    async def send_many(
+        self, transfers: typing.Sequence[pyuavcan.transport.Transfer], monotonic_deadline: float
+    ) -> int:
+        """
+        Consecutive transfers that share the same CAN ID are emitted using one call to the media layer.
+        If the feedback is enabled, the transfers are sent one by one because the loopback is requested
+        only for the first frame of a transaction.
+        """
+        if self._feedback_handler is not None:
+            return await super().send_many(transfers, monotonic_deadline)
+        self._raise_if_closed()
+        serialized = [self._serialize(tr) for tr in transfers]  # Fail early if any of the transfers is invalid.
+        index = 0
+        while index < len(transfers):
+            # Collect the longest run of transfers sharing the same CAN ID into one transaction.
+            compiled_identifier = serialized[index][0]
+            frames: typing.List[UAVCANFrame] = []
+            ends: typing.List[int] = []  # The number of frames up to and including the transfer.
+            for identifier, transfer_frames in serialized[index:]:
+                if identifier != compiled_identifier:
+                    break
+                frames += transfer_frames
+                ends.append(len(frames))
+
+            transaction = SendTransaction(frames=frames, loopback_first=False, monotonic_deadline=monotonic_deadline)
+            try:
+                num_sent = await self._send_handler(transaction)
+            except Exception:
+                self._statistics.errors += 1
+                raise
+
+            num_transfers_sent = bisect.bisect_right(ends, num_sent)
+            num_frames_sent = ends[num_transfers_sent - 1] if num_transfers_sent > 0 else 0
+            self._statistics.transfers += num_transfers_sent
+            self._statistics.frames += num_frames_sent
+            self._statistics.payload_bytes += sum(
+                sum(map(len, tr.fragmented_payload)) for tr in transfers[index : index + num_transfers_sent]
+            )
+            index += num_transfers_sent
+            if num_transfers_sent < len(ends):
+                self._statistics.drops += len(frames) - num_frames_sent
+                break
+        return index
+
+    @abc.abstractmethod
+    def _make_can_id(self, priority: pyuavcan.transport.Priority) -> CANID:
+        raise NotImplementedError
+
+    def _serialize(self, transfer: pyuavcan.transport.Transfer) -> typing.Tuple[int, typing.List[UAVCANFrame]]:
+        """
+        Decomposes the outgoing transfer into individual CAN frames.
+        :returns: The compiled CAN ID and the frames.
+        """
+        can_id = self._make_can_id(transfer.priority)
+        compiled_identifier = can_id.compile(transfer.fragmented_payload)
+        tid_mod = transfer.transfer_id % TRANSFER_ID_MODULO  # https://github.com/UAVCAN/pyuavcan/issues/120
+        frames = list(
+            serialize_transfer(
+                compiled_identifier=compiled_identifier,
+                transfer_id=tid_mod,
+                fragmented_payload=transfer.fragmented_payload,
+                max_frame_payload_bytes=self._transport.protocol_parameters.mtu,
+            )
+        )
+
+        # Ensure we're not trying to emit a multi-frame anonymous transfer - that's illegal.
+        if can_id.source_node_id is None and len(frames) > 1:
+            raise pyuavcan.transport.OperationNotDefinedForAnonymousNodeError(
+                f"Anonymous nodes cannot emit multi-frame transfers. CANID: {can_id}, transfer: {transfer}"
+            )
+        return compiled_identifier, frames
+
 
 class BroadcastCANOutputSession(CANOutputSession):
     def __init__(
@@ -197,13 +256,12 @@ class BroadcastCANOutputSession(CANOutputSession):
             finalizer=finalizer,
         )
 
-    async def send(self, transfer: pyuavcan.transport.Transfer, monotonic_deadline: float) -> bool:
-        can_id = MessageCANID(
-            priority=transfer.priority,
+    def _make_can_id(self, priority: pyuavcan.transport.Priority) -> CANID:
+        return MessageCANID(
+            priority=priority,
             subject_id=self._subject_id,
             source_node_id=self._transport.local_node_id,  # May be anonymous
         )
-        return await self._do_send(can_id, transfer, monotonic_deadline)
 
 
 class UnicastCANOutputSession(CANOutputSession):
@@ -239,14 +297,13 @@ class UnicastCANOutputSession(CANOutputSession):
             finalizer=finalizer,
         )
 
-    async def send(self, transfer: pyuavcan.transport.Transfer, monotonic_deadline: float) -> bool:
+    def _make_can_id(self, priority: pyuavcan.transport.Priority) -> CANID:
         source_node_id = self._transport.local_node_id
         assert source_node_id is not None, "Internal logic error"
-        can_id = ServiceCANID(
-            priority=transfer.priority,
+        return ServiceCANID(
+            priority=priority,
             service_id=self._service_id,
             request_not_response=self._request_not_response,
             source_node_id=source_node_id,
             destination_node_id=self._destination_node_id,
         )
-        return await self._do_send(can_id, transfer, monotonic_deadline)
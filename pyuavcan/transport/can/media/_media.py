@@ -117,6 +117,15 @@ class Media(abc.ABC):
         """
         raise NotImplementedError
 
+    @property
+    def number_of_frames_rejected_by_acceptance_filters(self) -> typing.Optional[int]:
+        """
+        The number of frames received from the bus that were discarded by the acceptance filters
+        (e.g., by the CAN controller or by the OS kernel) without being passed over to the transport.
+        None if the media implementation cannot obtain this information, which is the default.
+        """
+        return None
+
     @abc.abstractmethod
     async def send(self, frames: typing.Iterable[Envelope], monotonic_deadline: float) -> int:
         """
@@ -0,0 +1,75 @@
+# Copyright (c) 2021 UAVCAN Consortium
+# This software is distributed under the terms of the MIT License.
+# Author: Pavel Kirienko <pavel@uavcan.org>
+
+"""
+Bindings for the GNU/Linux system calls ``sendmmsg(2)`` and ``recvmmsg(2)``, which transmit or receive
+multiple messages via a socket at once. The standard library does not expose them, so ctypes is used.
+The functions are None if not available on the current platform.
+"""
+
+import os
+import sys
+import ctypes
+import typing
+import logging
+
+
+_logger = logging.getLogger(__name__)
+
+
+class IOVec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", MsgHdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+def check_result(result: int) -> int:
+    """
+    Raises :class:`OSError` constructed from errno if the result of a system call is negative.
+    The constructor of OSError picks the appropriate subclass by errno (e.g., :class:`BlockingIOError`).
+    """
+    if result < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return int(result)
+
+
+def _load(name: str, argtypes: typing.List[typing.Any]) -> typing.Optional[typing.Callable[..., int]]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        fun = getattr(ctypes.CDLL(None, use_errno=True), name)
+    except (OSError, AttributeError) as ex:  # pragma: no cover
+        _logger.info("%s() is not available: %r", name, ex)
+        return None
+    fun.argtypes = argtypes
+    fun.restype = ctypes.c_int
+    return typing.cast(typing.Callable[..., int], fun)
+
+
+sendmmsg = _load("sendmmsg", [ctypes.c_int, ctypes.POINTER(MMsgHdr), ctypes.c_uint, ctypes.c_int])
+"""``int sendmmsg(int sockfd, struct mmsghdr *msgvec, unsigned int vlen, int flags)``"""
+
+recvmmsg = _load("recvmmsg", [ctypes.c_int, ctypes.POINTER(MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p])
+"""``int recvmmsg(int sockfd, struct mmsghdr *msgvec, unsigned int vlen, int flags, struct timespec *timeout)``"""
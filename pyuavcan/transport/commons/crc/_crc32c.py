@@ -4,6 +4,7 @@
 
 import typing
 from ._base import CRCAlgorithm
+from ._slicing import SlicingEngine
 
 
 class CRC32C(CRCAlgorithm):
@@ -36,17 +37,19 @@ class CRC32C(CRCAlgorithm):
     True
     >>> CRC32C.new(b'123', b'', b'456789').value
     3808858755
+
+    If a native CRC-32C implementation is importable (the package ``crc32c`` or ``google-crc32c``),
+    it is used automatically; otherwise, the computation is vectorized using NumPy (slicing-by-N).
     """
 
     def __init__(self) -> None:
-        assert len(self._TABLE) == 256
         self._value = 0xFFFFFFFF
 
     def add(self, data: typing.Union[bytes, bytearray, memoryview]) -> None:
-        val = self._value
-        for x in data:
-            val = (val >> 8) ^ self._TABLE[x ^ (val & 0xFF)]
-        self._value = val
+        if _accelerator is not None:
+            self._value = _accelerator(self._value ^ 0xFFFFFFFF, data) ^ 0xFFFFFFFF
+        else:
+            self._value = _engine.update(self._value, data)
 
     def check_residue(self) -> bool:
         return self._value == 0xB798B438  # Checked before the output XOR is applied.
@@ -96,3 +99,44 @@ class CRC32C(CRCAlgorithm):
         0x79B737BA, 0x8BDCB4B9, 0x988C474D, 0x6AE7C44E, 0xBE2DA0A5, 0x4C4623A6, 0x5F16D052, 0xAD7D5351,
     ]
     # fmt: on
+
+
+_engine = SlicingEngine(CRC32C._TABLE, 4, reflected=True)  # pylint: disable=protected-access
+
+
+def _find_accelerator() -> typing.Optional[typing.Callable[[int, typing.Union[bytes, bytearray, memoryview]], int]]:
+    """
+    Returns a function that updates the CRC value (with the output XOR applied) using a native implementation,
+    or None if none is available.
+    """
+    try:
+        import crc32c  # type: ignore
+    except ImportError:
+        pass
+    else:
+        return lambda crc, data: int(crc32c.crc32c(data, crc))
+    try:
+        import google_crc32c  # type: ignore
+    except ImportError:
+        pass
+    else:
+        if google_crc32c.implementation == "c":  # The pure-Python fallback is slower than ours.
+            return lambda crc, data: int(google_crc32c.extend(crc, bytes(data)))
+    return None
+
+
+_accelerator = _find_accelerator()
+
+
+def _unittest_crc32c_backends() -> None:
+    import random
+
+    data = bytes(random.getrandbits(8) for _ in range(10_000))
+    reference = 0xFFFFFFFF
+    for x in data:
+        reference = (reference >> 8) ^ CRC32C._TABLE[x ^ (reference & 0xFF)]  # pylint: disable=protected-access
+    assert _engine.update(0xFFFFFFFF, data) == reference
+    if _accelerator is not None:
+        assert _accelerator(0, data) ^ 0xFFFFFFFF == reference
+    fragmented = CRC32C.new(data[:1], memoryview(data)[1:333], bytearray(data[333:]))
+    assert fragmented.value == reference ^ 0xFFFFFFFF
@@ -4,6 +4,7 @@
 
 import typing
 from ._base import CRCAlgorithm
+from ._slicing import SlicingEngine
 
 
 class CRC64WE(CRCAlgorithm):
@@ -36,14 +37,10 @@ class CRC64WE(CRCAlgorithm):
     """
 
     def __init__(self) -> None:
-        assert len(self._TABLE) == 256
         self._value = self._MASK
 
     def add(self, data: typing.Union[bytes, bytearray, memoryview]) -> None:
-        val = self._value
-        table = self._TABLE
-        for b in data:
-            val = (table[b ^ (val >> 56)] ^ (val << 8)) & self._MASK
+        val = _engine.update(self._value, data)
         assert 0 <= val < 2 ** 64
         self._value = val
 
@@ -127,3 +124,6 @@ class CRC64WE(CRCAlgorithm):
         0x5DEDC41A34BBEEB2, 0x1F1D25F19D51D821, 0xD80C07CD676F8394, 0x9AFCE626CE85B507,
     ]
     # fmt: on
+
+
+_engine = SlicingEngine(CRC64WE._TABLE, 8, reflected=False)  # pylint: disable=protected-access
@@ -0,0 +1,122 @@
+# Copyright (c) 2021 UAVCAN Consortium
+# This software is distributed under the terms of the MIT License.
+# Author: Pavel Kirienko <pavel@uavcan.org>
+
+from __future__ import annotations
+import typing
+import numpy
+
+
+class SlicingEngine:
+    """
+    A table-driven CRC engine that processes the data in blocks of :attr:`BLOCK_SIZE` bytes
+    using the slicing-by-N technique: the contribution of every byte of a block to the CRC register
+    is looked up in a dedicated table that accounts for the number of bytes that follow it in the block.
+    Only the leading bytes of the block that overlap with the register depend on the current CRC value;
+    the lookups of the remaining bytes are independent of it, so they are performed for all blocks at once
+    using NumPy. This reduces the number of interpreted iterations per block from the block size to the
+    register size (e.g., by the factor of 16 for a 32-bit CRC).
+
+    Short inputs are processed byte-by-byte because the NumPy overhead would dominate there.
+    The value of the CRC register is passed in and out as is, without the input or output XOR.
+    """
+
+    BLOCK_SIZE = 64
+    MIN_VECTORIZED_SIZE = 256
+    _SEGMENT_SIZE = BLOCK_SIZE * 1024  # Limits the size of the intermediate arrays.
+
+    def __init__(self, table: typing.Sequence[int], register_size: int, reflected: bool) -> None:
+        """
+        :param table: The conventional byte-wise lookup table of the algorithm.
+        :param register_size: The width of the CRC register in bytes.
+        :param reflected: True if the data is processed LSB-first.
+        """
+        assert len(table) == 256
+        assert 0 < register_size <= 8
+        self._table = list(table)
+        self._register_size = int(register_size)
+        self._reflected = bool(reflected)
+        # The lookup tables for slicing are not needed unless long inputs are encountered; build them lazily.
+        self._tables: typing.Optional[numpy.ndarray] = None
+        self._head_lookups: typing.List[typing.Tuple[typing.List[int], int]] = []
+
+    def update(self, value: int, data: typing.Union[bytes, bytearray, memoryview]) -> int:
+        size = len(data)
+        if size < self.MIN_VECTORIZED_SIZE:
+            return self._update_bytewise(value, data)
+        if self._tables is None:
+            self._build_tables()
+        assert self._tables is not None
+        block_size, register_size = self.BLOCK_SIZE, self._register_size
+        head_dtype = numpy.dtype(f"{'<' if self._reflected else '>'}u{register_size}")
+        tail_rows = numpy.arange(block_size - register_size - 1, -1, -1)
+        buffer = numpy.frombuffer(data, dtype=numpy.uint8)
+        sliced = size - size % block_size
+        for offset in range(0, sliced, self._SEGMENT_SIZE):
+            blocks = buffer[offset : min(offset + self._SEGMENT_SIZE, sliced)].reshape(-1, block_size)
+            tails = numpy.bitwise_xor.reduce(self._tables[tail_rows, blocks[:, register_size:]], axis=1).tolist()
+            heads = blocks[:, :register_size].copy().view(head_dtype).ravel().tolist()
+            for head, acc in zip(heads, tails):
+                value ^= head
+                for lookup, shift in self._head_lookups:
+                    acc ^= lookup[(value >> shift) & 0xFF]
+                value = acc
+        return self._update_bytewise(value, buffer[sliced:].tobytes())
+
+    def _update_bytewise(self, value: int, data: typing.Union[bytes, bytearray, memoryview]) -> int:
+        table = self._table
+        if self._reflected:
+            for x in data:
+                value = (value >> 8) ^ table[(value ^ x) & 0xFF]
+        else:
+            shift = self._register_size * 8 - 8
+            mask = (1 << (self._register_size * 8)) - 1
+            for x in data:
+                value = (table[(value >> shift) ^ x] ^ (value << 8)) & mask
+        return value
+
+    def _build_tables(self) -> None:
+        # Row K contains the contributions of the byte followed by K zero bytes.
+        shift = self._register_size * 8 - 8
+        mask = (1 << (self._register_size * 8)) - 1
+        first = self._table
+        rows = [first]
+        for _ in range(self.BLOCK_SIZE - 1):
+            if self._reflected:
+                rows.append([(x >> 8) ^ first[x & 0xFF] for x in rows[-1]])
+            else:
+                rows.append([((x << 8) & mask) ^ first[x >> shift] for x in rows[-1]])
+        # Byte J of a block is followed by (BLOCK_SIZE - J - 1) bytes. The leading bytes overlap with the register.
+        self._head_lookups = [
+            (rows[self.BLOCK_SIZE - j - 1], 8 * j if self._reflected else shift - 8 * j)
+            for j in range(self._register_size)
+        ]
+        self._tables = numpy.array(rows, dtype=numpy.uint64)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(register_size={self._register_size}, reflected={self._reflected}, "
+            f"block_size={self.BLOCK_SIZE})"
+        )
+
+
+def _unittest_slicing_engine() -> None:
+    import random
+    from ._crc32c import CRC32C
+    from ._crc64we import CRC64WE
+
+    def reference(table: typing.Sequence[int], register_size: int, reflected: bool, value: int, data: bytes) -> int:
+        return SlicingEngine(table, register_size, reflected)._update_bytewise(value, data)  # type: ignore
+
+    for table, register_size, reflected in [
+        (CRC32C._TABLE, 4, True),  # pylint: disable=protected-access
+        (CRC64WE._TABLE, 8, False),  # pylint: disable=protected-access
+    ]:
+        eng = SlicingEngine(table, register_size, reflected)
+        print(eng)
+        for size in [0, 1, 255, 256, 257, 1000, 4096, 4097, SlicingEngine._SEGMENT_SIZE * 2 + 13]:
+            data = bytes(random.getrandbits(8) for _ in range(size))
+            initial = random.getrandbits(register_size * 8)
+            expected = reference(table, register_size, reflected, initial, data)
+            assert eng.update(initial, data) == expected
+            assert eng.update(initial, memoryview(bytearray(data))) == expected
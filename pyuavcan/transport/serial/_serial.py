@@ -36,6 +36,13 @@ class SerialTransportStatistics(pyuavcan.transport.TransportStatistics):
     out_incomplete: int = 0
 
 
+@dataclasses.dataclass(frozen=True)
+class _PendingTransfer:
+    frames: typing.List[SerialFrame]
+    monotonic_deadline: float
+    future: "asyncio.Future[typing.Optional[Timestamp]]"
+
+
 class SerialTransport(pyuavcan.transport.Transport):
     """
     The UAVCAN/Serial transport is designed for OSI L1 byte-level serial links and tunnels,
@@ -129,10 +136,16 @@ class SerialTransport(pyuavcan.transport.Transport):
         # For serial port write serialization. Read operations are performed concurrently (no sync) in separate thread.
         self._port_lock = asyncio.Lock()
 
+        # Outgoing transfers are queued here while the port is busy. The transmission task emits all queued transfers
+        # at once with a single write call. The task is not bound to any of the senders, so that the cancellation
+        # of a sender does not affect the transfers of the others. The task is started on demand.
+        self._tx_queue: typing.List[_PendingTransfer] = []
+        self._maybe_tx_task: typing.Optional[asyncio.Task[None]] = None
+
         # The serialization buffer is re-used for performance reasons; it is needed to store frame contents before
         # they are emitted into the serial port. It may grow as necessary at runtime; the initial size is a guess.
         # Access must be protected with the port lock!
-        self._serialization_buffer = bytearray(b"\x00" * (1024 * 1024))
+        self._serialization_buffer = bytearray(1024 * 1024)
 
         self._input_registry: typing.Dict[pyuavcan.transport.InputSessionSpecifier, SerialInputSession] = {}
         self._output_registry: typing.Dict[pyuavcan.transport.OutputSessionSpecifier, SerialOutputSession] = {}
@@ -353,55 +366,36 @@ class SerialTransport(pyuavcan.transport.Transport):
         self, frames: typing.List[SerialFrame], monotonic_deadline: float
     ) -> typing.Optional[Timestamp]:
         """
-        Emits the frames belonging to the same transfer, returns the first frame transmission timestamp.
+        Emits the frames belonging to the same transfer, returns the transmission timestamp.
         The returned timestamp can be used for transfer feedback implementation.
         Aborts if the frames cannot be emitted before the deadline or if a write call fails.
-        :returns: The first frame transmission timestamp if all frames are sent successfully.
+
+        If the port is busy, the transfer is queued; the queued transfers are then emitted together
+        with a single write call by the transmission task.
+        If the caller is cancelled, its transfer is withdrawn unless it is already being written.
+        The call returns by the deadline even if the write call that carries the transfer is still in progress,
+        in which case the transfer is reported as timed out.
+
+        :returns: The transmission timestamp if all frames are sent successfully.
             None on timeout or on write failure.
         """
-        tx_ts: typing.Optional[Timestamp] = None
         self._ensure_not_closed()
-        try:  # Jeez this is getting complex
-            num_sent = 0
-            for fr in frames:
-                async with self._port_lock:  # TODO: the lock acquisition should be prioritized by frame priority!
-                    min_buffer_size = len(fr.payload) * 3
-                    if len(self._serialization_buffer) < min_buffer_size:
-                        _logger.debug(
-                            "%s: The serialization buffer is being enlarged from %d to %d bytes",
-                            self,
-                            len(self._serialization_buffer),
-                            min_buffer_size,
-                        )
-                        self._serialization_buffer = bytearray(0 for _ in range(min_buffer_size))
-                    compiled = fr.compile_into(self._serialization_buffer)
-                    timeout = monotonic_deadline - self._loop.time()
-                    if timeout > 0:
-                        self._serial_port.write_timeout = timeout
-                        try:
-                            num_written = await self._loop.run_in_executor(
-                                self._background_executor, self._serial_port.write, compiled
-                            )
-                            tx_ts = tx_ts or Timestamp.now()
-                        except serial.SerialTimeoutException:
-                            num_written = 0
-                            _logger.info("%s: Port write timed out in %.3fs on frame %r", self, timeout, fr)
-                        else:
-                            if self._capture_handlers:  # Create a copy to decouple data from the serialization buffer!
-                                cap = SerialCapture(tx_ts, memoryview(bytes(compiled)), own=True)
-                                pyuavcan.util.broadcast(self._capture_handlers)(cap)
-                        self._statistics.out_bytes += num_written or 0
-                    else:
-                        tx_ts = None  # Timed out
-                        break
-
-                num_written = len(compiled) if num_written is None else num_written
-                if num_written < len(compiled):
-                    tx_ts = None  # Write failed
-                    break
-                num_sent += 1
-
-            self._statistics.out_frames += num_sent
+        pending = _PendingTransfer(frames, monotonic_deadline, self._loop.create_future())
+        self._tx_queue.append(pending)
+        if self._maybe_tx_task is None or self._maybe_tx_task.done():
+            self._maybe_tx_task = self._loop.create_task(self._tx_task_function())
+        try:
+            timeout = monotonic_deadline - self._loop.time()
+            tx_ts = await asyncio.wait_for(asyncio.shield(pending.future), timeout=timeout)
+        except asyncio.TimeoutError:
+            if pending in self._tx_queue:  # Not emitted yet, so it is not too late to abort.
+                self._tx_queue.remove(pending)
+            self._statistics.out_incomplete += 1
+            return None
+        except asyncio.CancelledError:
+            if pending in self._tx_queue:  # Not emitted yet, so it is not too late to abort.
+                self._tx_queue.remove(pending)
+            raise
         except Exception as ex:
             if self._closed:
                 raise pyuavcan.transport.ResourceClosedError(f"{self} is closed, transmission aborted.") from ex
@@ -413,6 +407,97 @@ class SerialTransport(pyuavcan.transport.Transport):
                 self._statistics.out_incomplete += 1
             return tx_ts
 
+    async def _tx_task_function(self) -> None:
+        async with self._port_lock:  # TODO: the lock acquisition should be prioritized by frame priority!
+            while self._tx_queue:
+                await self._flush_tx_queue()
+
+    async def _flush_tx_queue(self) -> None:
+        """
+        Compiles all queued transfers into the serialization buffer back-to-back and emits them with one write call.
+        The write timeout is defined by the latest deadline among the queued transfers, so that a transfer with
+        a short deadline does not cause the failure of the others; once the write is completed, each transfer is
+        checked against its own deadline. Transfers whose deadline has already expired are dropped unwritten.
+        Every dequeued transfer is resolved even if the write call fails or the task is cancelled.
+        Must be invoked with the port lock held.
+        """
+        batch, self._tx_queue = self._tx_queue, []
+        try:
+            now = self._loop.time()
+            for pending in batch:
+                if pending.monotonic_deadline <= now:
+                    pending.future.set_result(None)  # Timed out
+            batch = [x for x in batch if not x.future.done()]
+            if not batch:
+                return
+
+            max_size = sum(
+                SerialFrame.calc_cobs_size(
+                    len(fr.payload) + SerialFrame.NUM_OVERHEAD_BYTES_EXCEPT_DELIMITERS_AND_ESCAPING
+                )
+                + 2
+                for pending in batch
+                for fr in pending.frames
+            )
+            if len(self._serialization_buffer) < max_size:
+                _logger.debug(
+                    "%s: The serialization buffer is being enlarged from %d to %d bytes",
+                    self,
+                    len(self._serialization_buffer),
+                    max_size,
+                )
+                self._serialization_buffer = bytearray(max_size)
+
+            # Frame boundaries are retained to report captures per frame and to tell which transfers got through.
+            buffer = memoryview(self._serialization_buffer)
+            frame_ends: typing.List[typing.List[int]] = []
+            offset = 0
+            for pending in batch:
+                ends: typing.List[int] = []
+                for fr in pending.frames:
+                    offset += len(fr.compile_into(buffer[offset:]))
+                    ends.append(offset)
+                frame_ends.append(ends)
+            compiled = buffer[:offset]
+
+            timeout = max(x.monotonic_deadline for x in batch) - now
+            self._serial_port.write_timeout = timeout
+            tx_ts: typing.Optional[Timestamp] = None
+            done_at = float("inf")
+            try:
+                num_written = await self._loop.run_in_executor(
+                    self._background_executor, self._serial_port.write, compiled
+                )
+                tx_ts = Timestamp.now()
+                done_at = self._loop.time()
+            except serial.SerialTimeoutException:
+                num_written = 0
+                _logger.info("%s: Port write timed out in %.3fs on %d transfers", self, timeout, len(batch))
+            num_written = len(compiled) if num_written is None else num_written
+            self._statistics.out_bytes += num_written
+
+            begin = 0
+            for pending, ends in zip(batch, frame_ends):
+                num_sent = sum(1 for x in ends if x <= num_written)
+                self._statistics.out_frames += num_sent
+                if tx_ts is not None and self._capture_handlers:
+                    for end in ends[:num_sent]:  # Create a copy to decouple data from the serialization buffer!
+                        cap = SerialCapture(tx_ts, memoryview(bytes(compiled[begin:end])), own=True)
+                        pyuavcan.util.broadcast(self._capture_handlers)(cap)
+                        begin = end
+                success = num_sent == len(ends) and done_at <= pending.monotonic_deadline
+                if not pending.future.done():
+                    pending.future.set_result(tx_ts if success else None)
+        except Exception as ex:
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(ex)
+        except BaseException:  # Cancellation: the state of the port is unknown, so the transfers are incomplete.
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_result(None)
+            raise
+
     def _reader_thread_func(self) -> None:
         in_bytes_count = 0
 
@@ -48,14 +48,24 @@ class StreamParser:
         self._timestamp: typing.Optional[Timestamp] = None
 
     def process_next_chunk(self, chunk: typing.Union[bytes, bytearray, memoryview], timestamp: Timestamp) -> None:
-        # TODO: PERFORMANCE WARNING: DECODE COBS ON THE FLY TO AVOID EXTRA COPYING
-        for b in chunk:
-            self._buffer.append(b)
-            if b == SerialFrame.FRAME_DELIMITER_BYTE:
-                self._finalize(known_invalid=self._outside_frame)
-            else:
+        # The chunk is processed segment-by-segment rather than byte-by-byte: the delimiters are located using
+        # the native search and the bytes in between are appended in bulk. At high baud rates this is the
+        # difference between keeping up with the stream and not.
+        data = chunk if isinstance(chunk, (bytes, bytearray)) else bytes(chunk)
+        view = memoryview(data)
+        position = 0
+        while True:
+            delimiter_index = data.find(SerialFrame.FRAME_DELIMITER_BYTE, position)
+            end = delimiter_index if delimiter_index >= 0 else len(data)
+            if end > position:
+                self._buffer += view[position:end]
                 if self._timestamp is None:
                     self._timestamp = timestamp  # https://github.com/UAVCAN/pyuavcan/issues/112
+            if delimiter_index < 0:
+                break
+            self._buffer.append(SerialFrame.FRAME_DELIMITER_BYTE)
+            self._finalize(known_invalid=self._outside_frame)
+            position = delimiter_index + 1
 
         if self._outside_frame or (len(self._buffer) > self._max_frame_size_bytes):
             self._finalize(known_invalid=True)
@@ -158,3 +168,14 @@ def _unittest_stream_parser() -> None:
     assert tsb == ts
     assert a is None
     assert isinstance(b, SerialFrame)
+
+    # Many frames interleaved with OOB data in one chunk; the same stream fed byte-by-byte yields the same output.
+    stream = b"".join(
+        [f1.compile_into(bytearray(200)), b"hello\x00", b"\x00\x00", f2.compile_into(bytearray(200)), b"tail"]
+    )
+    bulk = [(bytes(buf), fr) for _, buf, fr in proc(stream)]
+    assert bytes(proc(memoryview(b"\x00"))[0][1]) == b"tail\x00"
+    bytewise = [(bytes(buf), fr) for i in range(len(stream)) for _, buf, fr in proc(stream[i : i + 1])]
+    assert bulk == bytewise
+    assert [x is not None for _, x in bulk] == [True, False, False, True]
+    assert bulk[1][0] == b"hello\x00"
@@ -77,7 +77,7 @@ class UDPFrame(pyuavcan.transport.commons.high_overhead_transport.Frame):
             version, int_priority, frame_index_eot, transfer_id = UDPFrame._HEADER_FORMAT.unpack_from(image)
         except struct.error:
             return None
-        if version == UDPFrame._VERSION:
+        if version == UDPFrame._VERSION and int_priority <= max(pyuavcan.transport.Priority):
             # noinspection PyArgumentList
             return UDPFrame(
                 priority=pyuavcan.transport.Priority(int_priority),
@@ -235,3 +235,12 @@ def _unittest_udp_frame_parse() -> None:
             b"\x00\x00\x00\x00\x00\x00\x00\x00"
         ),
     )
+    # Bad priority.
+    assert None is UDPFrame.parse(
+        memoryview(
+            b"\x00\x08\x00\x00"
+            b"\r\xf0\xdd\x80"
+            b"\xee\xff\xc0\xef\xbe\xad\xde\x00"
+            b"\x00\x00\x00\x00\x00\x00\x00\x00"
+        ),
+    )
@@ -39,7 +39,8 @@ class UDPInputSession(pyuavcan.transport.InputSession):
     CRC checking for us (thank you), so we get our stuff sorted up to the OSI layer 4 inclusive.
     The processing pipeline per datagram is as follows:
 
-    - The socket reader obtains the datagram from the socket using ``recvfrom()``.
+    - The socket reader obtains the datagram from the socket along with all other pending datagrams
+      (using ``recvmmsg()`` on GNU/Linux, ``recvfrom()`` elsewhere).
       The source IP address is mapped to a node-ID and the contents are parsed into a UAVCAN UDP frame instance.
       If anything goes wrong here (like if the source IP address belongs to a wrong subnet or the datagram
       does not contain a valid UAVCAN frame or whatever), the datagram is dropped and the appropriate statistical
@@ -4,6 +4,7 @@
 
 import sys
 import copy
+import bisect
 import socket as socket_
 import typing
 import asyncio
@@ -11,6 +12,8 @@ import logging
 import pyuavcan
 from pyuavcan.transport import Timestamp, ServiceDataSpecifier
 from .._frame import UDPFrame
+from .._vectored_io import send_datagrams
+from .._timestamping import TransmitTimestamper, make_timestamp
 
 
 _IGNORE_OS_ERROR_ON_SEND = sys.platform.startswith("win")
@@ -32,6 +35,12 @@ Here is an example::
     # OSError: [WinError 1231] The network location cannot be reached
 """
 
+_TX_TIMESTAMP_TIMEOUT = 0.1
+"""
+How long to wait for the kernel to report the transmission timestamp of the first frame of a transfer
+before falling back to the user-space timestamp. The timestamp is normally available immediately.
+"""
+
 _logger = logging.getLogger(__name__)
 
 
@@ -53,9 +62,11 @@ class UDPOutputSession(pyuavcan.transport.OutputSession):
     """
     The output session logic is extremely simple because most of the work is handled by the UDP/IP
     stack of the operating system.
-    Here we just split the transfer into frames, encode the frames, and write them into the socket one by one.
+    Here we just split the transfer into frames, encode the frames, and write them into the socket.
     If the transfer multiplier is greater than one (for unreliable networks),
     we repeat that the required number of times.
+    Where supported, all frames of the transfer including the redundant copies are transmitted using one system call
+    without copying the payload.
     """
 
     def __init__(
@@ -81,6 +92,9 @@ class UDPOutputSession(pyuavcan.transport.OutputSession):
         self._loop = loop
         self._finalizer = finalizer
         self._feedback_handler: typing.Optional[typing.Callable[[pyuavcan.transport.Feedback], None]] = None
+        self._tx_timestamper = TransmitTimestamper(sock)
+        self._tx_timestamp_waiters: typing.List[asyncio.Future[None]] = []
+        self._tx_timestamps_unavailable = False
         self._statistics = pyuavcan.transport.SessionStatistics()
         if self._multiplier < 1:  # pragma: no cover
             raise ValueError(f"Invalid transfer multiplier: {self._multiplier}")
@@ -98,34 +112,17 @@ class UDPOutputSession(pyuavcan.transport.OutputSession):
         if self._closed:
             raise pyuavcan.transport.ResourceClosedError(f"{self} is closed")
 
-        def construct_frame(index: int, end_of_transfer: bool, payload: memoryview) -> UDPFrame:
-            return UDPFrame(
-                priority=transfer.priority,
-                transfer_id=transfer.transfer_id,
-                index=index,
-                end_of_transfer=end_of_transfer,
-                payload=payload,
-            )
-
-        frames = [
-            fr.compile_header_and_payload()
-            for fr in pyuavcan.transport.commons.high_overhead_transport.serialize_transfer(
-                transfer.fragmented_payload, self._mtu, construct_frame
-            )
-        ]
+        frames = self._serialize(transfer)
         _logger.debug("%s: Sending transfer: %s; current stats: %s", self, transfer, self._statistics)
-        tx_timestamp = await self._emit(frames, monotonic_deadline)
-        if tx_timestamp is None:
+        first_frame_id = self._tx_timestamper.next_id
+        tx_timestamp, num_sent = await self._emit(frames * self._multiplier, monotonic_deadline)
+        if tx_timestamp is None or num_sent < len(frames):
             return False
+        if self._tx_timestamper.enabled:
+            tx_timestamp = await self._fetch_tx_timestamp(first_frame_id) or tx_timestamp
 
         self._statistics.transfers += 1
 
-        # Once we have transmitted at least one copy of a multiplied transfer, it's a success.
-        # We don't care if redundant copies fail.
-        for _ in range(self._multiplier - 1):
-            if not await self._emit(frames, monotonic_deadline):
-                break
-
         if self._feedback_handler is not None:
             try:
                 self._feedback_handler(
@@ -140,11 +137,37 @@ class UDPOutputSession(pyuavcan.transport.OutputSession):
 
         return True
 
+    async def send_many(
+        self, transfers: typing.Sequence[pyuavcan.transport.Transfer], monotonic_deadline: float
+    ) -> int:
+        """
+        The frames of all transfers (including the redundant copies) are handed over to the OS at once.
+        If the feedback is enabled, the transfers are sent one by one to obtain the transmission timestamps.
+        """
+        if self._feedback_handler is not None:
+            return await super().send_many(transfers, monotonic_deadline)
+        if self._closed:
+            raise pyuavcan.transport.ResourceClosedError(f"{self} is closed")
+        datagrams: typing.List[typing.Tuple[memoryview, memoryview]] = []
+        ends: typing.List[int] = []  # A transfer is sent once its first copy is sent.
+        for tr in transfers:
+            frames = self._serialize(tr)
+            ends.append(len(datagrams) + len(frames))
+            datagrams += frames * self._multiplier
+        _, num_sent = await self._emit(datagrams, monotonic_deadline)
+        count = bisect.bisect_right(ends, num_sent)
+        self._statistics.transfers += count
+        return count
+
     def enable_feedback(self, handler: typing.Callable[[pyuavcan.transport.Feedback], None]) -> None:
         self._feedback_handler = handler
+        # The transmission timestamps are only needed for the feedback, so we don't request them unless necessary.
+        self._tx_timestamper.enable()
+        self._tx_timestamps_unavailable = False
 
     def disable_feedback(self) -> None:
         self._feedback_handler = None
+        self._tx_timestamper.disable()
 
     @property
     def specifier(self) -> pyuavcan.transport.OutputSessionSpecifier:
@@ -160,6 +183,8 @@ class UDPOutputSession(pyuavcan.transport.OutputSession):
     def close(self) -> None:
         if not self._closed:
             self._closed = True
+            if self._tx_timestamp_waiters:  # The reader shall be removed before the socket is closed.
+                self._on_tx_error_queue_readable()
             try:
                 self._sock.close()
             finally:
@@ -172,31 +197,55 @@ class UDPOutputSession(pyuavcan.transport.OutputSession):
         """
         return self._sock
 
+    def _serialize(self, transfer: pyuavcan.transport.Transfer) -> typing.List[typing.Tuple[memoryview, memoryview]]:
+        def construct_frame(index: int, end_of_transfer: bool, payload: memoryview) -> UDPFrame:
+            return UDPFrame(
+                priority=transfer.priority,
+                transfer_id=transfer.transfer_id,
+                index=index,
+                end_of_transfer=end_of_transfer,
+                payload=payload,
+            )
+
+        return [
+            fr.compile_header_and_payload()
+            for fr in pyuavcan.transport.commons.high_overhead_transport.serialize_transfer(
+                transfer.fragmented_payload, self._mtu, construct_frame
+            )
+        ]
+
     async def _emit(
-        self, header_payload_pairs: typing.Sequence[typing.Tuple[memoryview, memoryview]], monotonic_deadline: float
-    ) -> typing.Optional[Timestamp]:
+        self, datagrams: typing.Sequence[typing.Tuple[memoryview, memoryview]], monotonic_deadline: float
+    ) -> typing.Tuple[typing.Optional[Timestamp], int]:
         """
-        Returns the transmission timestamp of the first frame (which is the transfer timestamp) on success.
-        Returns None if at least one frame could not be transmitted.
+        Transmits the frames in the specified order; the redundant copies, if any, are supplied by the caller.
+        All frames are handed over to the OS at once using vectorized IO (see :func:`send_datagrams`);
+        we wait only if the socket is not writeable.
+        Returns the transmission timestamp of the first frame (which is the transfer timestamp),
+        or None if nothing could be transmitted, and the number of frames transmitted.
+        Once we have transmitted at least one copy of a multiplied transfer, it's a success.
+        We don't care if redundant copies fail.
         """
         ts: typing.Optional[Timestamp] = None
-        for index, (header, payload) in enumerate(header_payload_pairs):
+        index = 0
+        while index < len(datagrams):
+            if self._loop.time() >= monotonic_deadline:
+                self._statistics.drops += len(datagrams) - index
+                break
             try:
-                # TODO: concatenation is inefficient. Use vectorized IO via sendmsg() instead!
-                await asyncio.wait_for(
-                    self._loop.sock_sendall(self._sock, b"".join((header, payload))),
-                    timeout=monotonic_deadline - self._loop.time(),
-                )
-
-                # TODO: use socket timestamping when running on Linux (Windows does not support timestamping).
-                # Depending on the chosen approach, timestamping on Linux may require us to launch a new thread
-                # reading from the socket's error message queue and then matching the returned frames with a
-                # pending loopback registry, kind of like it's done with CAN.
-                ts = ts or Timestamp.now()
-
-            except (asyncio.TimeoutError, asyncio.CancelledError):
-                self._statistics.drops += len(header_payload_pairs) - index
-                return None
+                count = send_datagrams(self._sock, datagrams[index:])
+            except BlockingIOError:
+                # The socket is not writeable. This is unlikely with UDP so we don't bother with batching here.
+                try:
+                    header, payload = datagrams[index]
+                    await asyncio.wait_for(
+                        self._loop.sock_sendall(self._sock, b"".join((header, payload))),
+                        timeout=monotonic_deadline - self._loop.time(),
+                    )
+                    count = 1
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    self._statistics.drops += len(datagrams) - index
+                    break
             except Exception as ex:
                 if _IGNORE_OS_ERROR_ON_SEND and isinstance(ex, OSError) and self._sock.fileno() >= 0:
                     # Windows compatibility workaround -- if there are no registered multicast receivers on the
@@ -209,15 +258,67 @@ class UDPOutputSession(pyuavcan.transport.OutputSession):
                     )
                     # To suppress the error properly, we have to pretend that the data was actually transmitted,
                     # so we populate the timestamp with a phony value anyway.
-                    ts = ts or Timestamp.now()
+                    count = 1
                 else:
                     self._statistics.errors += 1
                     raise
 
-            self._statistics.frames += 1
-            self._statistics.payload_bytes += len(payload)
+            # This timestamp is replaced with the kernel timestamp later, if available.
+            ts = ts or Timestamp.now()
+            self._tx_timestamper.count_transmitted(count)
+            for _, payload in datagrams[index : index + count]:
+                self._statistics.frames += 1
+                self._statistics.payload_bytes += len(payload)
+            index += count
 
-        return ts
+        return ts, index
+
+    async def _fetch_tx_timestamp(self, frame_id: int) -> typing.Optional[Timestamp]:
+        """
+        Waits for the kernel timestamp until it is available or the timeout has expired.
+        If the kernel has never delivered any timestamps to this socket (the driver does not support this),
+        the waiting is disabled after the first timeout, so only the first transfer is delayed.
+        """
+        deadline = self._loop.time() + _TX_TIMESTAMP_TIMEOUT
+        while True:
+            system_ns = self._tx_timestamper.fetch(frame_id)
+            if system_ns is not None:
+                return make_timestamp(system_ns, Timestamp.now())
+            timeout = deadline - self._loop.time()
+            if self._tx_timestamps_unavailable or timeout <= 0:
+                if not self._tx_timestamper.confirmed and not self._tx_timestamps_unavailable:
+                    _logger.info("%s: Kernel transmission timestamps are not supported, not waiting anymore", self)
+                    self._tx_timestamps_unavailable = True
+                _logger.debug("%s: Kernel transmission timestamp of frame #%d is not available", self, frame_id)
+                return None
+            await self._wait_tx_error_queue(timeout)
+
+    async def _wait_tx_error_queue(self, timeout: float) -> None:
+        # A non-empty error queue is reported by the OS as an error condition on the socket,
+        # which the event loop treats as readability, so polling is unnecessary.
+        # The reader is shared by concurrent waiters because there can be at most one reader per socket.
+        fut = self._loop.create_future()
+        if not self._tx_timestamp_waiters:
+            self._loop.add_reader(self._sock.fileno(), self._on_tx_error_queue_readable)
+        self._tx_timestamp_waiters.append(fut)
+        try:
+            await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            try:
+                self._tx_timestamp_waiters.remove(fut)
+            except ValueError:
+                pass  # Removed by the callback.
+            if not self._tx_timestamp_waiters and self._sock.fileno() >= 0:
+                self._loop.remove_reader(self._sock.fileno())
+
+    def _on_tx_error_queue_readable(self) -> None:
+        waiters, self._tx_timestamp_waiters = self._tx_timestamp_waiters, []
+        self._loop.remove_reader(self._sock.fileno())
+        for fut in waiters:
+            if not fut.done():
+                fut.set_result(None)
 
 
 def _unittest_output_session() -> None:
@@ -320,6 +421,19 @@ def _unittest_output_session() -> None:
 
     assert sos.sample_statistics() == SessionStatistics(transfers=2, frames=2, payload_bytes=11, errors=0, drops=0)
 
+    # Batched transmission; the second transfer takes three frames including the transfer CRC.
+    batch = [
+        Transfer(timestamp=ts, priority=Priority.NOMINAL, transfer_id=1, fragmented_payload=[memoryview(b"a")]),
+        Transfer(timestamp=ts, priority=Priority.NOMINAL, transfer_id=2, fragmented_payload=[memoryview(b"b" * 20)]),
+    ]
+    assert 2 == run_until_complete(sos.send_many(batch, loop.time() + 10.0))
+    rx_payloads = [sock_rx.recvfrom(1000)[0][24:] for _ in range(4)]
+    assert rx_payloads[0] == b"a"
+    assert b"".join(rx_payloads[1:])[:20] == b"b" * 20
+    with raises(socket_.timeout):
+        sock_rx.recvfrom(1000)
+    assert sos.sample_statistics() == SessionStatistics(transfers=4, frames=6, payload_bytes=36, errors=0, drops=0)
+
     assert sos.socket.fileno() >= 0
     assert not finalized
     sos.close()
@@ -17,10 +17,17 @@ import pyuavcan
 from pyuavcan.transport import Timestamp
 from ._frame import UDPFrame
 from ._ip import unicast_ip_to_node_id
+from ._vectored_io import DatagramReceiver
+from ._timestamping import enable_receive_timestamping, make_timestamp
 
 
 _READ_SIZE = 0xFFFF  # Per libpcap documentation, this is to be sufficient always.
 _READ_TIMEOUT = 1.0
+_MAX_BATCH_SIZE = 1024
+"""
+The maximum number of datagrams the worker thread receives and parses before handing them over to the event loop.
+Larger batches reduce the number of the event loop wakeups but increase the latency.
+"""
 
 _logger = logging.getLogger(__name__)
 
@@ -62,6 +69,13 @@ class SocketReader:
 
     The UDP transport is unable to detect a node-ID conflict because it has to discard traffic generated
     by itself in user space. To this transport, its own traffic and a node-ID conflict would look identical.
+
+    By default, each instance runs a dedicated worker thread that reads the socket and hands the received frames
+    over to the event loop. In the reactor mode, the socket is registered with the event loop instead
+    (which uses epoll on GNU/Linux), so that the number of threads does not grow with the number of sockets;
+    the datagrams are then read and parsed in the event loop thread.
+    The reactor mode requires the event loop to support :meth:`asyncio.AbstractEventLoop.add_reader`
+    (e.g., the proactor event loop on Windows does not); otherwise, the worker thread is used.
     """
 
     Listener = typing.Callable[[Timestamp, int, typing.Optional[UDPFrame]], None]
@@ -79,6 +93,7 @@ class SocketReader:
         anonymous: bool,
         statistics: SocketReaderStatistics,
         loop: asyncio.AbstractEventLoop,
+        reactor: bool = False,
     ):
         """
         :param sock: The instance takes ownership of the socket; it will be closed when the instance is closed.
@@ -86,9 +101,13 @@ class SocketReader:
         :param anonymous: If True, then packets originating from the local IP address will not be discarded.
         :param statistics: A reference to the external statistics object that will be updated by the instance.
         :param loop: The event loop. You know the drill.
+        :param reactor: Read the socket from the event loop instead of a dedicated worker thread, if supported.
         """
         self._sock = sock
         self._sock.setblocking(False)
+        # If supported, the kernel timestamps are used instead of sampling the time in the worker thread,
+        # which may be delayed by the scheduling jitter of the thread and by the batching.
+        self._kernel_timestamping = enable_receive_timestamping(self._sock)
         self._original_file_desc = self._sock.fileno()  # This is needed for repr() only.
         self._local_ip_address = local_ip_address
         self._anonymous = anonymous
@@ -101,6 +120,14 @@ class SocketReader:
         assert isinstance(self._loop, asyncio.AbstractEventLoop)
 
         self._listeners: typing.Dict[typing.Optional[int], SocketReader.Listener] = {}
+        self._thread: typing.Optional[threading.Thread] = None
+        if reactor:
+            try:
+                self._loop.add_reader(self._original_file_desc, self._on_readable, DatagramReceiver())
+            except NotImplementedError:
+                _logger.info("%r: The event loop does not support readers, falling back to the worker thread", self)
+            else:
+                return
         self._ctl_worker, self._ctl_main = socket.socketpair()  # For communicating with the worker thread.
         self._thread = threading.Thread(
             target=self._thread_entry_point, name=f"socket_reader_fd_{self._original_file_desc}", daemon=True
@@ -119,7 +146,7 @@ class SocketReader:
             If a frame is received that cannot be parsed, the callable will be invoked with None
             in order to let it update its error statistics.
         """
-        if not self._thread.is_alive():
+        if not self._is_operational:
             raise pyuavcan.transport.ResourceClosedError(f"{self} is no longer operational")
 
         if source_node_id in self._listeners:
@@ -171,6 +198,12 @@ class SocketReader:
             raise RuntimeError("Refusing to close socket reader with active listeners. Call remove_listener first.")
         if self._sock.fileno() < 0:  # Ensure idempotency.
             return
+        if self._thread is None:
+            # In the reactor mode, the socket is read only from the event loop, so it is safe to close it right away.
+            self._loop.remove_reader(self._original_file_desc)
+            self._sock.close()
+            _logger.debug("%r: Closed", self)
+            return
         started_at = time.monotonic()
         try:
             _logger.debug("%r: Stopping the thread before closing the socket to avoid accidental fd reuse...", self)
@@ -223,31 +256,59 @@ class SocketReader:
             except LookupError:
                 self._statistics.accepted_datagrams[source_node_id] = 1
 
+    @property
+    def _is_operational(self) -> bool:
+        if self._thread is not None:
+            return self._thread.is_alive()
+        return self._sock.fileno() >= 0
+
+    def _receive_batch(
+        self, receiver: DatagramReceiver
+    ) -> typing.List[typing.Tuple[Timestamp, _IPAddress, typing.Optional[UDPFrame]]]:
+        """
+        Receives and parses all datagrams that are pending in the socket.
+        """
+        datagrams = receiver.receive(self._sock, _MAX_BATCH_SIZE)
+        ts = pyuavcan.transport.Timestamp.now()
+        batch = [
+            (
+                make_timestamp(dgr.system_timestamp_ns, ts) if dgr.system_timestamp_ns is not None else ts,
+                _parse_address(dgr.source_ip_address),
+                UDPFrame.parse(memoryview(dgr.data)),
+            )
+            for dgr in datagrams
+        ]
+        _logger.debug("%r: Received a batch of %d UDP packets", self, len(batch))
+        return batch
+
+    def _on_readable(self, receiver: DatagramReceiver) -> None:
+        """Invoked by the event loop in the reactor mode."""
+        try:
+            batch = self._receive_batch(receiver)
+        except Exception as ex:  # pragma: no cover
+            _logger.exception("%r: Reactor read error: %s", self, ex)
+            if self._sock.fileno() < 0:
+                self._loop.remove_reader(self._original_file_desc)
+        else:
+            self._dispatch_batch(batch)
+
+    def _dispatch_batch(
+        self, batch: typing.Sequence[typing.Tuple[Timestamp, _IPAddress, typing.Optional[UDPFrame]]]
+    ) -> None:
+        for timestamp, source_ip_address, frame in batch:
+            self._dispatch_frame(timestamp, source_ip_address, frame)
+
     def _thread_entry_point(self) -> None:
+        receiver = DatagramReceiver()
         while self._sock.fileno() >= 0:
             try:
                 read_ready, _, _ = select.select([self._ctl_worker, self._sock], [], [], _READ_TIMEOUT)
                 if self._sock in read_ready:
-                    # TODO: use socket timestamping when running on GNU/Linux (Windows does not support timestamping).
-                    ts = pyuavcan.transport.Timestamp.now()
-
-                    # Notice that we MUST create a new buffer for each received datagram to avoid race conditions.
-                    # Buffer memory cannot be shared because the rest of the stack is completely zero-copy;
-                    # meaning that the data we allocate here, at the very bottom of the protocol stack,
-                    # is likely to be carried all the way up to the application layer without being copied.
-                    data, endpoint = self._sock.recvfrom(_READ_SIZE)
-                    assert len(data) < _READ_SIZE, "Datagram might have been truncated"
-                    source_ip = _parse_address(endpoint[0])
-
-                    frame = UDPFrame.parse(memoryview(data))
-                    _logger.debug(
-                        "%r: Received UDP packet of %d bytes from %s containing frame: %s",
-                        self,
-                        len(data),
-                        endpoint,
-                        frame,
-                    )
-                    self._loop.call_soon_threadsafe(self._dispatch_frame, ts, source_ip, frame)
+                    # All pending datagrams are received and parsed at once here in the worker thread,
+                    # and then handed over to the event loop in one batch to minimize the number of wakeups.
+                    batch = self._receive_batch(receiver)
+                    if batch:
+                        self._loop.call_soon_threadsafe(self._dispatch_batch, batch)
 
                 if self._ctl_worker in read_ready:
                     cmd = self._ctl_worker.recv(_READ_SIZE)
@@ -272,6 +333,8 @@ class SocketReader:
             original_fd=self._original_file_desc,
             socket=self._sock,
             remote_node_ids=list(self._listeners.keys()),
+            kernel_timestamping=self._kernel_timestamping,
+            reactor=self._thread is None,
         )
 
 
@@ -505,7 +568,7 @@ def _unittest_socket_reader(caplog: typing.Any) -> None:
         )
         srd._sock.close()  # pylint: disable=protected-access
         run_until_complete(asyncio.sleep(_READ_TIMEOUT * 2))  # Wait for the reader thread to notice the problem.
-        assert not srd._thread.is_alive()  # pylint: disable=protected-access
+        assert srd._thread is not None and not srd._thread.is_alive()  # pylint: disable=protected-access
         srd._ctl_main.close()  # pylint: disable=protected-access
         srd._ctl_worker.close()  # pylint: disable=protected-access
 
@@ -612,3 +675,120 @@ def _unittest_socket_reader_endpoint_reuse() -> None:
     srd_c.remove_listener(listener_node_id)
     srd_c.close()
     sock_tx.close()
+
+
+def _unittest_socket_reader_malformed_datagram_in_batch() -> None:
+    """
+    A malformed datagram shall not cause the loss of the other datagrams received in the same batch.
+    """
+    from ipaddress import ip_address
+    from pyuavcan.transport import Priority
+
+    loop = asyncio.get_event_loop()
+    run_until_complete = loop.run_until_complete
+
+    sock_rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock_rx.bind(("127.100.0.100", 0))
+    sock_tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock_tx.bind(("127.100.0.5", 0))
+    sock_tx.connect(sock_rx.getsockname())
+
+    # The datagrams are sent before the reader is started, so that they are all received in one batch.
+    images = [
+        b"".join(
+            UDPFrame(
+                priority=Priority.HIGH,
+                transfer_id=index,
+                index=0,
+                end_of_transfer=True,
+                payload=memoryview(b"HARDBASS"),
+            ).compile_header_and_payload()
+        )
+        for index in range(10)
+    ]
+    bad_priority = bytearray(images[0])
+    bad_priority[1] = 9
+    images.insert(5, bytes(bad_priority))
+    for img in images:
+        sock_tx.send(img)
+
+    stats = SocketReaderStatistics()
+    srd = SocketReader(
+        sock=sock_rx,
+        local_ip_address=ip_address("127.100.4.210"),
+        anonymous=False,
+        statistics=stats,
+        loop=loop,
+    )
+    received: typing.List[typing.Tuple[Timestamp, int, typing.Optional[UDPFrame]]] = []
+    srd.add_listener(5, lambda t, i, f: received.append((t, i, f)))
+    run_until_complete(asyncio.sleep(0.5))
+    frames = [f for _, _, f in received]
+    assert frames[5] is None
+    assert [f.transfer_id for f in frames if f is not None] == list(range(10))
+    assert stats == SocketReaderStatistics(accepted_datagrams={5: 11}, dropped_datagrams={})
+
+    srd.remove_listener(5)
+    srd.close()
+    sock_tx.close()
+
+
+def _unittest_socket_reader_reactor() -> None:
+    from ipaddress import ip_address
+    from pytest import raises
+    from pyuavcan.transport import Priority
+
+    loop = asyncio.get_event_loop()
+    run_until_complete = loop.run_until_complete
+
+    sock_rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock_rx.bind(("127.100.0.100", 0))
+    sock_tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock_tx.bind(("127.100.0.5", 0))
+    sock_tx.connect(sock_rx.getsockname())
+
+    stats = SocketReaderStatistics()
+    srd = SocketReader(
+        sock=sock_rx,
+        local_ip_address=ip_address("127.100.4.210"),
+        anonymous=False,
+        statistics=stats,
+        loop=loop,
+        reactor=True,
+    )
+    threads_before = threading.active_count()
+    if srd._thread is not None:  # pragma: no cover  # pylint: disable=protected-access
+        srd.close()
+        return  # The event loop does not support readers.
+    assert "reactor=True" in repr(srd)
+
+    received: typing.List[typing.Tuple[Timestamp, int, typing.Optional[UDPFrame]]] = []
+    srd.add_listener(5, lambda t, i, f: received.append((t, i, f)))
+    for index in range(10):
+        image = b"".join(
+            UDPFrame(
+                priority=Priority.HIGH,
+                transfer_id=index,
+                index=0,
+                end_of_transfer=True,
+                payload=memoryview(b"HARDBASS"),
+            ).compile_header_and_payload()
+        )
+        sock_tx.send(image)
+        if index == 4:  # A header with an invalid priority shall not affect the valid frames around it.
+            sock_tx.send(image[:1] + b"\x09" + image[2:])
+    sock_tx.send(b"abc")
+    run_until_complete(asyncio.sleep(0.5))
+    assert threading.active_count() == threads_before
+    assert [x.transfer_id for _, _, x in received if x is not None] == list(range(10))
+    assert [i for i, (_, _, x) in enumerate(received) if x is None] == [5, 11]
+    assert all(nid == 5 for _, nid, _ in received)
+    assert stats == SocketReaderStatistics(accepted_datagrams={5: 12}, dropped_datagrams={})
+
+    srd.remove_listener(5)
+    srd.close()
+    srd.close()  # Idempotency
+    assert sock_rx.fileno() < 0
+    with raises(pyuavcan.transport.ResourceClosedError):
+        srd.add_listener(5, lambda t, i, f: received.append((t, i, f)))
+    sock_tx.close()
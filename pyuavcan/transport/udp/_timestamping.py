@@ -0,0 +1,203 @@
+# Copyright (c) 2021 UAVCAN Consortium
+# This software is distributed under the terms of the MIT License.
+# Author: Pavel Kirienko <pavel@uavcan.org>
+
+"""
+Kernel timestamping of UDP datagrams; supported on GNU/Linux only.
+See https://www.kernel.org/doc/Documentation/networking/timestamping.txt.
+
+The kernel reports the time of the system clock only. The monotonic time is derived from it by subtracting the
+age of the kernel timestamp from a monotonic time sample taken in the user space shortly afterwards.
+"""
+
+from __future__ import annotations
+import sys
+import socket
+import struct
+import typing
+import logging
+from pyuavcan.transport import Timestamp
+
+
+AVAILABLE = sys.platform.startswith("linux")
+
+SO_TIMESTAMPNS = 35
+"""Also used as the ancillary message type (SCM_TIMESTAMPNS)."""
+
+SO_TIMESTAMPING = 37
+"""Also used as the ancillary message type (SCM_TIMESTAMPING)."""
+
+TIMESPEC_STRUCT = struct.Struct("@ll")
+
+_SOF_TIMESTAMPING_TX_SOFTWARE = 1 << 1
+_SOF_TIMESTAMPING_SOFTWARE = 1 << 4
+_SOF_TIMESTAMPING_OPT_ID = 1 << 7
+_SOF_TIMESTAMPING_OPT_TSONLY = 1 << 11
+
+_MSG_ERRQUEUE = getattr(socket, "MSG_ERRQUEUE", 0x2000)
+_SOL_IP = 0
+_IP_RECVERR = 11
+_SOL_IPV6 = 41
+_IPV6_RECVERR = 25
+_SO_EE_ORIGIN_TIMESTAMPING = 4
+_SOCK_EXTENDED_ERR_STRUCT = struct.Struct("=IBBBBII")
+_ANCILLARY_BUFFER_SIZE = 256
+
+_logger = logging.getLogger(__name__)
+
+
+def enable_receive_timestamping(sock: socket.socket) -> bool:
+    """
+    Requests the kernel to timestamp the datagrams received via the socket.
+    Returns False if this is not supported.
+    """
+    if AVAILABLE:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+            return True
+        except OSError as ex:  # pragma: no cover
+            _logger.info("Could not enable receive timestamping on %r: %r", sock, ex)
+    return False
+
+
+def make_timestamp(system_ns: int, reference: Timestamp) -> Timestamp:
+    """
+    :param system_ns: The kernel timestamp.
+    :param reference: The current time sampled after the kernel timestamp has been obtained.
+    """
+    age = max(0, reference.system_ns - system_ns)
+    return Timestamp(system_ns=system_ns, monotonic_ns=max(0, reference.monotonic_ns - age))
+
+
+class TransmitTimestamper:
+    """
+    Obtains the transmission timestamps of outgoing datagrams from the error queue of the socket.
+    The datagrams are identified by their sequence number counted from the moment timestamping was enabled.
+    The caller shall report the number of transmitted datagrams via :meth:`count_transmitted`.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._enabled = False
+        self._next_id = 0
+        self._pending: typing.Dict[int, int] = {}
+        self._confirmed = False
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def confirmed(self) -> bool:
+        """
+        True if the kernel has reported at least one timestamp since timestamping was enabled.
+        Some drivers accept the socket option but never report the timestamps.
+        """
+        return self._confirmed
+
+    @property
+    def next_id(self) -> int:
+        """The sequence number that will be assigned to the next transmitted datagram."""
+        return self._next_id
+
+    def enable(self) -> bool:
+        """
+        Returns False if this is not supported, in which case the instance remains disabled.
+        """
+        if not self._enabled and AVAILABLE:
+            flags = (
+                _SOF_TIMESTAMPING_TX_SOFTWARE
+                | _SOF_TIMESTAMPING_SOFTWARE
+                | _SOF_TIMESTAMPING_OPT_ID
+                | _SOF_TIMESTAMPING_OPT_TSONLY
+            )
+            try:
+                self._sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPING, flags)
+            except OSError as ex:  # pragma: no cover
+                _logger.info("Could not enable transmission timestamping on %r: %r", self._sock, ex)
+            else:
+                self._enabled = True
+                self._next_id = 0  # The kernel resets the counter when the option is enabled.
+                self._pending.clear()
+                self._confirmed = False
+        return self._enabled
+
+    def disable(self) -> None:
+        if self._enabled:
+            self._enabled = False
+            if self._sock.fileno() >= 0:
+                self._sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPING, 0)
+                self._drain()
+            self._pending.clear()
+
+    def count_transmitted(self, count: int) -> None:
+        if self._enabled:
+            self._next_id += count
+
+    def fetch(self, datagram_id: int) -> typing.Optional[int]:
+        """
+        Returns the kernel timestamp of the specified datagram in nanoseconds (system clock),
+        or None if it is not available (yet). Timestamps of the preceding datagrams are discarded.
+        """
+        if self._enabled:
+            self._drain()
+        for key in [k for k in self._pending if k < datagram_id]:
+            del self._pending[key]
+        return self._pending.pop(datagram_id, None)
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                _, ancdata, _, _ = self._sock.recvmsg(1, _ANCILLARY_BUFFER_SIZE, _MSG_ERRQUEUE)
+            except BlockingIOError:
+                break
+            ts_ns: typing.Optional[int] = None
+            datagram_id: typing.Optional[int] = None
+            for cmsg_level, cmsg_type, cmsg_data in ancdata:
+                if cmsg_level == socket.SOL_SOCKET and cmsg_type == SO_TIMESTAMPING:
+                    sec, nsec = TIMESPEC_STRUCT.unpack_from(cmsg_data)  # The first one is the software timestamp.
+                    ts_ns = sec * 1_000_000_000 + nsec
+                elif (cmsg_level, cmsg_type) in ((_SOL_IP, _IP_RECVERR), (_SOL_IPV6, _IPV6_RECVERR)):
+                    _, origin, _, _, _, _, data = _SOCK_EXTENDED_ERR_STRUCT.unpack_from(cmsg_data)
+                    if origin == _SO_EE_ORIGIN_TIMESTAMPING:
+                        datagram_id = data
+            if ts_ns is not None and ts_ns > 0 and datagram_id is not None:
+                self._pending[datagram_id] = ts_ns
+                self._confirmed = True
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(enabled={self._enabled}, confirmed={self._confirmed}, next_id={self._next_id})"
+
+
+def _unittest_transmit_timestamper() -> None:
+    import time
+
+    rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx.bind(("127.100.0.1", 0))
+    tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    tx.bind(("127.100.0.2", 0))
+    tx.connect(rx.getsockname())
+    tx.setblocking(False)
+
+    tt = TransmitTimestamper(tx)
+    assert not tt.enabled
+    assert tt.fetch(0) is None
+    if not tt.enable():
+        return
+    assert not tt.confirmed
+    begin = time.time_ns()
+    for _ in range(3):
+        tx.send(b"abc")
+    tt.count_transmitted(3)
+    assert tt.next_id == 3
+    time.sleep(0.1)
+    ts_2 = tt.fetch(2)
+    assert ts_2 is not None and begin <= ts_2 <= time.time_ns()
+    assert tt.confirmed
+    assert tt.fetch(0) is None  # Discarded.
+    ref = Timestamp.now()
+    assert make_timestamp(ts_2, ref).monotonic_ns <= ref.monotonic_ns
+    tt.disable()
+    assert not tt.enabled
+    rx.close()
+    tx.close()
@@ -59,6 +59,7 @@ class UDPTransport(pyuavcan.transport.Transport):
         service_transfer_multiplier: int = 1,
         loop: typing.Optional[asyncio.AbstractEventLoop] = None,
         anonymous: bool = False,
+        reactor: bool = False,
     ):
         """
         :param local_ip_address: Specifies which local IP address to use for this transport.
@@ -130,6 +131,13 @@ class UDPTransport(pyuavcan.transport.Transport):
         :param loop: The event loop to use. Defaults to :func:`asyncio.get_event_loop`.
 
         :param anonymous: DEPRECATED and scheduled for removal; replace with ``local_node_id=None``.
+
+        :param reactor: By default, every input socket (one per subject or service) is served by a dedicated
+            worker thread. If this option is enabled, the input sockets are registered with the event loop instead,
+            so that the number of threads does not depend on the number of input sessions.
+            This is recommended for nodes that subscribe to many subjects.
+            The event loop shall support :meth:`asyncio.AbstractEventLoop.add_reader`
+            (the proactor event loop on Windows does not); otherwise, this option has no effect.
         """
         if anonymous:  # Backward compatibility. Will be removed.
             import warnings
@@ -148,6 +156,7 @@ class UDPTransport(pyuavcan.transport.Transport):
         self._mtu = int(mtu)
         self._srv_multiplier = int(service_transfer_multiplier)
         self._loop = loop if loop is not None else asyncio.get_event_loop()
+        self._reactor = bool(reactor)
 
         low, high = self.VALID_SERVICE_TRANSFER_MULTIPLIER_RANGE
         if not (low <= self._srv_multiplier <= high):
@@ -328,6 +337,7 @@ class UDPTransport(pyuavcan.transport.Transport):
                         specifier.data_specifier, SocketReaderStatistics()
                     ),
                     loop=self.loop,
+                    reactor=self._reactor,
                 )
 
             cls: typing.Union[typing.Type[PromiscuousUDPInputSession], typing.Type[SelectiveUDPInputSession]] = (
@@ -391,4 +401,5 @@ class UDPTransport(pyuavcan.transport.Transport):
             "local_node_id": self.local_node_id,
             "service_transfer_multiplier": self._srv_multiplier,
             "mtu": self._mtu,
+            "reactor": self._reactor,
         }
@@ -0,0 +1,287 @@
+# Copyright (c) 2021 UAVCAN Consortium
+# This software is distributed under the terms of the MIT License.
+# Author: Pavel Kirienko <pavel@uavcan.org>
+
+"""
+Batched datagram I/O.
+On transmission, the header is not concatenated with the payload in the user space (scatter-gather).
+On GNU/Linux, multiple datagrams are transmitted or received using a single system call
+``sendmmsg(2)`` or ``recvmmsg(2)`` invoked via ctypes, because the standard library does not expose them;
+elsewhere, the datagrams are processed one by one using the standard socket API.
+"""
+
+from __future__ import annotations
+import sys
+import mmap
+import ctypes
+import socket
+import typing
+import struct
+import logging
+import dataclasses
+import numpy
+from pyuavcan.transport.commons import _mmsg
+from ._timestamping import SO_TIMESTAMPNS, TIMESPEC_STRUCT
+
+
+Datagram = typing.Sequence[typing.Union[bytes, memoryview]]
+"""A datagram represented as a sequence of fragments that are transmitted as a single contiguous packet."""
+
+_logger = logging.getLogger(__name__)
+
+
+def send_datagrams(sock: socket.socket, datagrams: typing.Sequence[Datagram]) -> int:
+    """
+    Transmits the datagrams via the connected non-blocking socket in the specified order without blocking.
+    Returns the number of datagrams that have been transmitted, which may be less than the number of datagrams
+    if the socket is not writeable. The number is zero only if the sequence is empty.
+    If the first datagram could not be transmitted, the corresponding :class:`OSError` is raised;
+    :class:`BlockingIOError` means that the caller should wait until the socket is writeable.
+    """
+    if not datagrams:
+        return 0
+    if _sendmmsg is not None:
+        return _sendmmsg(sock, datagrams)
+    count = 0
+    for dgr in datagrams:
+        try:
+            if _HAS_SENDMSG:
+                sock.sendmsg(dgr)
+            else:  # pragma: no cover
+                sock.send(b"".join(dgr))
+        except OSError:
+            if count == 0:
+                raise
+            break  # The error will be reported on the next invocation.
+        count += 1
+    return count
+
+
+@dataclasses.dataclass(frozen=True)
+class ReceivedDatagram:
+    data: bytes
+    source_ip_address: str
+    system_timestamp_ns: typing.Optional[int] = None
+    """
+    The reception time reported by the kernel (if timestamping is enabled on the socket) in the domain of
+    :func:`time.time_ns`; None if not available.
+    """
+
+
+class DatagramReceiver:
+    """
+    Receives all datagrams that are pending in a non-blocking socket at once.
+    On GNU/Linux, up to :attr:`BATCH_SIZE` datagrams are received per system call into a recycled set of
+    receive buffers, from which each datagram is then copied into a new buffer of the exact size.
+    We MUST create a new buffer for each received datagram because the rest of the stack is completely zero-copy;
+    meaning that the data we allocate here, at the very bottom of the protocol stack,
+    is likely to be carried all the way up to the application layer without being copied.
+    Ownership of the returned data is transferred to the caller.
+
+    The receive buffers are mapped anonymously, so the physical memory is committed only for the pages
+    that have actually been written by the OS. Instances are not thread-safe.
+    """
+
+    BATCH_SIZE = 32
+    MAX_DATAGRAM_SIZE = 0xFFFF  # Per libpcap documentation, this is to be sufficient always.
+
+    def __init__(self) -> None:
+        self._ring: typing.Optional[_ReceiveRing] = None
+
+    def receive(self, sock: socket.socket, max_count: int) -> typing.List[ReceivedDatagram]:
+        """
+        Returns up to max_count datagrams that are pending in the socket; empty if there are none.
+        Errors other than the lack of pending data are propagated as :class:`OSError`.
+        """
+        out: typing.List[ReceivedDatagram] = []
+        if _recvmmsg is not None:
+            if self._ring is None:
+                self._ring = _ReceiveRing(self.BATCH_SIZE, self.MAX_DATAGRAM_SIZE)
+            while len(out) < max_count:
+                batch = self._ring.receive(sock, min(self.BATCH_SIZE, max_count - len(out)))
+                out += batch
+                if len(batch) < self.BATCH_SIZE:
+                    break
+        else:
+            while len(out) < max_count:
+                try:
+                    data, endpoint = sock.recvfrom(self.MAX_DATAGRAM_SIZE)
+                except BlockingIOError:
+                    break
+                assert len(data) < self.MAX_DATAGRAM_SIZE, "Datagram might have been truncated"
+                out.append(ReceivedDatagram(data, endpoint[0]))
+        return out
+
+
+class _ReceiveRing:
+    _NAME_SIZE = 128  # sizeof(struct sockaddr_storage)
+    _CONTROL_SIZE = 64  # Sufficient for the timestamp.
+    _CMSG_ALIGNMENT = ctypes.sizeof(ctypes.c_size_t)
+    _CMSG_HEADER_STRUCT = struct.Struct("@Nii")  # struct cmsghdr without the data
+
+    def __init__(self, count: int, datagram_size: int) -> None:
+        assert _recvmmsg is not None
+        self._count = int(count)
+        self._datagram_size = int(datagram_size)
+        self._data = mmap.mmap(-1, self._count * self._datagram_size)
+        self._data_base = ctypes.addressof(ctypes.c_char.from_buffer(self._data))
+        self._names = (ctypes.c_char * (self._NAME_SIZE * self._count))()
+        self._controls = (ctypes.c_char * (self._CONTROL_SIZE * self._count))()
+        self._iovecs = (_mmsg.IOVec * self._count)()
+        self._messages = (_mmsg.MMsgHdr * self._count)()
+        for index in range(self._count):
+            self._iovecs[index].iov_base = self._data_base + index * self._datagram_size
+            self._iovecs[index].iov_len = self._datagram_size
+            hdr = self._messages[index].msg_hdr
+            hdr.msg_name = ctypes.addressof(self._names) + index * self._NAME_SIZE
+            hdr.msg_iov = ctypes.pointer(self._iovecs[index])
+            hdr.msg_iovlen = 1
+            hdr.msg_control = ctypes.addressof(self._controls) + index * self._CONTROL_SIZE
+
+    def receive(self, sock: socket.socket, count: int) -> typing.List[ReceivedDatagram]:
+        assert _recvmmsg is not None and 0 < count <= self._count
+        for msg in self._messages[:count]:
+            msg.msg_hdr.msg_namelen = self._NAME_SIZE  # Overwritten by the kernel on each call.
+            msg.msg_hdr.msg_controllen = self._CONTROL_SIZE
+        try:
+            result = _mmsg.check_result(_recvmmsg(sock.fileno(), self._messages, count, socket.MSG_DONTWAIT, None))
+        except BlockingIOError:
+            return []
+        out: typing.List[ReceivedDatagram] = []
+        for index in range(result):
+            msg = self._messages[index]
+            assert not (msg.msg_hdr.msg_flags & socket.MSG_TRUNC), "Datagram has been truncated"
+            offset = index * self._datagram_size
+            out.append(
+                ReceivedDatagram(
+                    self._data[offset : offset + msg.msg_len],
+                    self._parse_name(index),
+                    self._parse_timestamp(index, msg.msg_hdr.msg_controllen),
+                )
+            )
+        return out
+
+    def _parse_timestamp(self, index: int, control_length: int) -> typing.Optional[int]:
+        control = self._controls[index * self._CONTROL_SIZE : index * self._CONTROL_SIZE + control_length]
+        offset = 0
+        header_size = socket.CMSG_LEN(0)
+        while offset + header_size <= len(control):
+            cmsg_len, cmsg_level, cmsg_type = self._CMSG_HEADER_STRUCT.unpack_from(control, offset)
+            if cmsg_len < header_size:  # pragma: no cover
+                break
+            if cmsg_level == socket.SOL_SOCKET and cmsg_type == SO_TIMESTAMPNS:
+                sec, nsec = TIMESPEC_STRUCT.unpack_from(control, offset + header_size)
+                return int(sec * 1_000_000_000 + nsec)
+            offset += (cmsg_len + self._CMSG_ALIGNMENT - 1) & ~(self._CMSG_ALIGNMENT - 1)
+        return None
+
+    def _parse_name(self, index: int) -> str:
+        name = self._names[index * self._NAME_SIZE : (index + 1) * self._NAME_SIZE]
+        family = int.from_bytes(name[:2], sys.byteorder)
+        if family == socket.AF_INET:
+            return socket.inet_ntop(socket.AF_INET, name[4:8])
+        if family == socket.AF_INET6:
+            return socket.inet_ntop(socket.AF_INET6, name[8:24])
+        raise ValueError(f"Unsupported address family: {family}")  # pragma: no cover
+
+
+def _make_sendmmsg() -> typing.Optional[typing.Callable[[socket.socket, typing.Sequence[Datagram]], int]]:
+    if _mmsg.sendmmsg is None:
+        return None
+    fun = _mmsg.sendmmsg
+
+    def sendmmsg(sock: socket.socket, datagrams: typing.Sequence[Datagram]) -> int:
+        # The buffers may be read-only (e.g., bytes), which ctypes cannot reference directly, so we use NumPy
+        # to obtain their addresses without copying. The arrays shall be kept alive until the call is completed.
+        keepalive: typing.List[numpy.ndarray] = []
+        iovecs: typing.List[_mmsg.IOVec] = []
+        spans: typing.List[typing.Tuple[int, int]] = []
+        for dgr in datagrams:
+            start = len(iovecs)
+            for frag in dgr:
+                if len(frag) > 0:
+                    arr = numpy.frombuffer(frag, dtype=numpy.uint8)
+                    keepalive.append(arr)
+                    iovecs.append(_mmsg.IOVec(arr.ctypes.data, arr.nbytes))
+            spans.append((start, len(iovecs) - start))
+        # One extra so that empty datagrams can point past the end.
+        iov_array = (_mmsg.IOVec * (len(iovecs) + 1))(*iovecs)
+        msg_array = (_mmsg.MMsgHdr * len(spans))()
+        for msg, (start, length) in zip(msg_array, spans):
+            msg.msg_hdr.msg_iov = ctypes.pointer(iov_array[start])
+            msg.msg_hdr.msg_iovlen = length
+        result = fun(sock.fileno(), msg_array, len(msg_array), socket.MSG_DONTWAIT)
+        del keepalive
+        return _mmsg.check_result(result)
+
+    return sendmmsg
+
+
+_sendmmsg = _make_sendmmsg()
+_recvmmsg = _mmsg.recvmmsg
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+
+def _unittest_send_datagrams() -> None:
+    from pytest import raises
+
+    rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx.bind(("127.100.0.1", 0))
+    rx.settimeout(1.0)
+    tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    tx.bind(("127.100.0.2", 0))
+    tx.connect(rx.getsockname())
+    tx.setblocking(False)
+
+    assert send_datagrams(tx, []) == 0
+    datagrams = [
+        [memoryview(b"head"), memoryview(bytearray(b"payload"))],
+        [b"", b"xyz", memoryview(b"0123456789")[3:5]],
+        [],
+    ]
+    assert send_datagrams(tx, datagrams) == 3
+    assert rx.recv(1000) == b"headpayload"
+    assert rx.recv(1000) == b"xyz34"
+    assert rx.recv(1000) == b""
+    with raises(socket.timeout):
+        rx.recv(1000)
+
+    tx.close()
+    with raises(OSError):
+        send_datagrams(tx, datagrams)
+    rx.close()
+
+
+def _unittest_receive_datagrams() -> None:
+    import time
+    from ._timestamping import enable_receive_timestamping
+
+    rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx.bind(("127.100.0.1", 0))
+    rx.setblocking(False)
+    tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    tx.bind(("127.100.0.2", 0))
+    tx.connect(rx.getsockname())
+
+    receiver = DatagramReceiver()
+    assert receiver.receive(rx, 100) == []
+    timestamping = enable_receive_timestamping(rx)
+    begin = time.time_ns()
+    count = DatagramReceiver.BATCH_SIZE * 2 + 3
+    for index in range(count):
+        tx.send(index.to_bytes(2, "big") * index)
+    time.sleep(0.5)
+    out = receiver.receive(rx, count - 1)
+    out += receiver.receive(rx, 100)
+    assert receiver.receive(rx, 100) == []
+    assert len(out) == count
+    for index, dgr in enumerate(out):
+        assert dgr.data == index.to_bytes(2, "big") * index
+        assert isinstance(dgr.data, bytes)
+        assert dgr.source_ip_address == "127.100.0.2"
+        if timestamping and _recvmmsg is not None:
+            assert dgr.system_timestamp_ns is not None
+            assert begin <= dgr.system_timestamp_ns <= time.time_ns()
+
+    rx.close()
+    tx.close()
@@ -44,3 +44,100 @@ def _unittest_module_import_path_usage_suggestion(caplog: typing.Any) -> None:
 def _unittest_issue_133() -> None:
     with pytest.raises(ValueError, match=".*output directory.*"):
         pyuavcan.dsdl.generate_package(pathlib.Path.cwd() / "irrelevant")
+
+
+def _unittest_incremental_generation(caplog: typing.Any) -> None:
+    import os
+    import shutil
+
+    caplog.set_level(logging.INFO)
+    source_directory = tempfile.TemporaryDirectory()
+    output_directory = tempfile.TemporaryDirectory()
+    root_namespace_directory = pathlib.Path(source_directory.name, "sirius_cyber_corp")
+    shutil.copytree(DEMO_DIR / "custom_data_types" / "sirius_cyber_corp", root_namespace_directory)
+
+    def generate() -> pyuavcan.dsdl.GeneratedPackageInfo:
+        out = pyuavcan.dsdl.generate_package(root_namespace_directory, output_directory=output_directory.name)
+        assert out is not None
+        assert len(out.models) == 2
+        return out
+
+    def mark_generated_modules() -> typing.List[pathlib.Path]:
+        # A regenerated module loses the mark; this is more robust than comparing the modification time.
+        out = sorted(generate().path.glob("*_1_0.py"))
+        assert len(out) == 2
+        for p in out:
+            os.chmod(p, 0o644)
+            with open(p, "a") as f:
+                f.write("# MARK\n")
+        return out
+
+    def marked() -> typing.List[bool]:
+        return ["# MARK" in p.read_text() for p in modules]
+
+    def touch_definition(name: str) -> None:
+        with open(root_namespace_directory / name, "a") as f:
+            f.write("# Changed\n")
+
+    modules = mark_generated_modules()
+    assert [p.name.split("_")[0] for p in modules] == ["PerformLinearLeastSquaresFit", "PointXY"]
+
+    # Nothing has changed, nothing is regenerated.
+    caplog.clear()
+    generate()
+    assert any("up to date" in e[2] for e in caplog.record_tuples)
+    assert marked() == [True, True]
+
+    # A type that no other type depends on is regenerated alone.
+    touch_definition("PerformLinearLeastSquaresFit.1.0.uavcan")
+    generate()
+    assert marked() == [False, True]
+
+    # The dependents of a changed type are also regenerated.
+    modules = mark_generated_modules()
+    touch_definition("PointXY.1.0.uavcan")
+    generate()
+    assert marked() == [False, False]
+
+    # A new type causes complete regeneration.
+    modules = mark_generated_modules()
+    shutil.copy(root_namespace_directory / "PointXY.1.0.uavcan", root_namespace_directory / "PointXY.1.1.uavcan")
+    info = pyuavcan.dsdl.generate_package(root_namespace_directory, output_directory=output_directory.name)
+    assert info is not None and len(info.models) == 3
+    assert marked() == [False, False]
+
+    for d in (source_directory, output_directory):
+        try:
+            d.cleanup()  # This may fail on Windows with Python 3.7, we don't care.
+        except PermissionError:  # pragma: no cover
+            pass
+
+
+def _unittest_parallel_generation() -> None:
+    import shutil
+
+    def generate(jobs: typing.Optional[int]) -> typing.Dict[str, str]:
+        output_directory = tempfile.mkdtemp()
+        try:
+            info = pyuavcan.dsdl.generate_package(
+                DEMO_DIR / "public_regulated_data_types" / "uavcan", output_directory=output_directory, jobs=jobs
+            )
+            assert info is not None
+            out = {}
+            for p in sorted(info.path.rglob("*.py")):
+                # The timestamp is the only part of the output that is allowed to differ.
+                text = "\n".join(x for x in p.read_text().splitlines() if "Generated at" not in x)
+                out[str(p.relative_to(info.path))] = text
+            assert not any(p.is_dir() and p.name.startswith(".") for p in pathlib.Path(output_directory).iterdir())
+            return out
+        finally:
+            shutil.rmtree(output_directory, ignore_errors=True)  # This may fail on Windows, we don't care.
+
+    with pytest.raises(ValueError):
+        pyuavcan.dsdl.generate_package(DEMO_DIR / "public_regulated_data_types" / "uavcan", jobs=0)
+
+    serial = generate(1)
+    assert "__init__.py" in serial
+    assert "node/__init__.py" in serial.keys() or "node\\__init__.py" in serial.keys()
+    assert generate(3) == serial
+    assert generate(None) == serial
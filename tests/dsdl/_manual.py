@@ -2,11 +2,13 @@
 # This software is distributed under the terms of the MIT License.
 # Author: Pavel Kirienko <pavel@uavcan.org>
 
+import copy
 import typing
 import logging
 
 import numpy
 import pytest
+import pydsdl
 
 import pyuavcan.dsdl
 
@@ -65,6 +67,21 @@ def _unittest_slow_manual_del(generated_packages: typing.List[pyuavcan.dsdl.Gene
     assert obj.else_[1].x[1].y == 13
     assert len(obj.raise_) == 0
 
+    # The model is restored lazily on first access and only once.
+    assert not isinstance(vars(uavcan.node.Heartbeat_1_0)["_MODEL_"], pydsdl.CompositeType)
+    assert pyuavcan.dsdl.get_model(uavcan.node.Heartbeat_1_0) is pyuavcan.dsdl.get_model(obj)
+    assert pyuavcan.dsdl.get_model(obj).full_name == "uavcan.node.Heartbeat"
+
+    # The classes are memoized and indexed by fixed port-ID.
+    model = pyuavcan.dsdl.get_model(uavcan.node.Heartbeat_1_0)
+    assert pyuavcan.dsdl.get_class(model) is uavcan.node.Heartbeat_1_0
+    assert pyuavcan.dsdl.get_class(model) is uavcan.node.Heartbeat_1_0
+    # An equal model obtained elsewhere (e.g., by re-reading the DSDL source) hits the cache as well.
+    assert pyuavcan.dsdl.get_class(copy.copy(model)) is uavcan.node.Heartbeat_1_0
+    cache = pyuavcan.dsdl._composite_object._class_cache  # pylint: disable=protected-access
+    assert cache["uavcan.node.Heartbeat", 1, 0][0] is model  # The entry was not replaced.
+    assert uavcan.node.Heartbeat_1_0 in pyuavcan.dsdl.find_classes_by_fixed_port_id(model.fixed_port_id, False)
+
     with pytest.raises(AttributeError, match="nonexistent"):
         pyuavcan.dsdl.get_attribute(obj, "nonexistent")
 
@@ -98,6 +115,20 @@ def _unittest_slow_manual_heartbeat(generated_packages: typing.List[pyuavcan.dsd
     assert obj.mode.value == uavcan.node.Mode_1_0.INITIALIZATION
     assert obj.vendor_specific_status_code == 0b10101111
 
+    assert uavcan.node.Heartbeat_1_0._STATIC_PREFIX_FIELDS_ == {  # pylint: disable=protected-access
+        "uptime": 0,
+        "health": 32,
+        "mode": 40,
+        "vendor_specific_status_code": 48,
+    }
+    view = pyuavcan.dsdl.LazyView(
+        uavcan.node.Heartbeat_1_0,
+        _compile_serialized_representation(_bin(0xEFBE_ADDE, 32), "00000010", "00000001", "10101111"),
+    )
+    assert view.mode.value == uavcan.node.Mode_1_0.INITIALIZATION
+    assert view.uptime == 0xDEADBEEF
+    assert repr(view.materialize()) == repr(obj)
+
     with pytest.raises(AttributeError, match="nonexistent"):
         pyuavcan.dsdl.get_attribute(obj, "nonexistent")
 
@@ -184,6 +215,78 @@ def _unittest_slow_delimited(generated_packages: typing.List[pyuavcan.dsdl.Gener
     assert None is pyuavcan.dsdl.deserialize(A_1_1, [memoryview(b"\x01" + b"\xFF" * 4)])
 
 
+# noinspection PyUnusedLocal
+def _unittest_slow_manual_batch(generated_packages: typing.List[pyuavcan.dsdl.GeneratedPackageInfo]) -> None:
+    del generated_packages
+    import uavcan.node
+    from sirius_cyber_corp import PointXY_1_0, PerformLinearLeastSquaresFit_1_0
+
+    objects = [uavcan.node.Heartbeat_1_0(uptime=i, vendor_specific_status_code=i % 256) for i in range(10_000)]
+    fragments = pyuavcan.dsdl.serialize_many(objects)
+    assert len(fragments) == len(objects)
+    assert all(f.obj is fragments[0].obj for f in fragments)  # One contiguous buffer
+    for o, f in zip(objects[:100], fragments):
+        assert f.tobytes() == b"".join(pyuavcan.dsdl.serialize(o))
+    restored = pyuavcan.dsdl.deserialize_many(uavcan.node.Heartbeat_1_0, ([f] for f in fragments))
+    assert [x.uptime for x in restored if x is not None] == list(range(10_000))
+
+    # Columnar form for fixed-layout types.
+    rows = pyuavcan.dsdl.serialize_columns(PointXY_1_0, {"x": [1.0, -2.5, 0.0], "y": numpy.array([3, 4, 5])})
+    assert rows.shape == (3, 4)
+    assert rows[1].tobytes() == b"".join(pyuavcan.dsdl.serialize(PointXY_1_0(x=-2.5, y=4)))
+    cols = pyuavcan.dsdl.deserialize_columns(PointXY_1_0, rows)
+    assert list(cols["x"]) == [1.0, -2.5, 0.0]
+    assert list(cols["y"]) == [3.0, 4.0, 5.0]
+    cols = pyuavcan.dsdl.deserialize_columns(PointXY_1_0, [[memoryview(b"\x00\x3c")], [memoryview(b"")]])
+    assert list(cols["x"]) == [1.0, 0.0]  # Implicit zero extension
+    assert list(cols["y"]) == [0.0, 0.0]
+    assert pyuavcan.dsdl.serialize_columns(PointXY_1_0, cols).shape == (2, 4)
+
+    res = PerformLinearLeastSquaresFit_1_0.Response
+    rows = pyuavcan.dsdl.serialize_columns(res, {"slope": [1.5]})
+    assert pyuavcan.dsdl.deserialize(res, [rows[0].data]).slope == 1.5  # type: ignore
+
+    with pytest.raises(ValueError):
+        pyuavcan.dsdl.serialize_columns(PointXY_1_0, {"z": [1.0]})
+    with pytest.raises(ValueError):
+        pyuavcan.dsdl.serialize_columns(PointXY_1_0, {"x": [1.0], "y": [1.0, 2.0]})
+    with pytest.raises(ValueError):
+        pyuavcan.dsdl.serialize_columns(PointXY_1_0, {"x": [1.0, 1e6]})  # Overflows float16.
+    rows = pyuavcan.dsdl.serialize_columns(PointXY_1_0, {"x": [float("inf"), float("nan")]})
+    cols = pyuavcan.dsdl.deserialize_columns(PointXY_1_0, rows)
+    assert cols["x"][0] == float("inf") and numpy.isnan(cols["x"][1])
+    with pytest.raises(TypeError):
+        pyuavcan.dsdl.deserialize_columns(uavcan.node.Heartbeat_1_0, [])
+    with pytest.raises(TypeError):
+        pyuavcan.dsdl.serialize_columns(PerformLinearLeastSquaresFit_1_0.Request, {})
+
+
+# noinspection PyUnusedLocal
+def _unittest_slow_manual_import_cost(generated_packages: typing.List[pyuavcan.dsdl.GeneratedPackageInfo]) -> None:
+    """
+    Importing and using a generated type shall not import the code generator and PyDSDL.
+    A new process is needed because these modules are already imported into this one.
+    """
+    del generated_packages
+    import os
+    import sys
+    import subprocess
+    from .conftest import DESTINATION_DIR, LIBRARY_ROOT_DIR
+
+    code = """if True:
+        import sys
+        import pyuavcan.dsdl
+        import uavcan.node
+        msg = uavcan.node.Heartbeat_1_0(uptime=123)
+        assert pyuavcan.dsdl.deserialize(uavcan.node.Heartbeat_1_0, list(pyuavcan.dsdl.serialize(msg))).uptime == 123
+        print(sorted({m.split(".")[0] for m in sys.modules} & {"pydsdl", "nunavut"}))
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(DESTINATION_DIR), str(LIBRARY_ROOT_DIR), env.get("PYTHONPATH", "")])
+    out = subprocess.run([sys.executable, "-c", code], env=env, check=True, stdout=subprocess.PIPE, timeout=60)
+    assert out.stdout.decode().strip() == "[]"
+
+
 def _compile_serialized_representation(*binary_chunks: str) -> typing.Sequence[memoryview]:
     s = "".join(binary_chunks)
     s = s.ljust(len(s) + 8 - len(s) % 8, "0")
@@ -154,6 +154,13 @@ def _serialize_deserialize(obj: pyuavcan.dsdl.CompositeObject) -> typing.Tuple[f
     if not _util.are_close(pyuavcan.dsdl.get_model(obj), obj, d):  # pragma: no cover
         assert False, f"{obj} != {d}; sr: {bytes().join(chunks).hex()}"  # Branched for performance reasons
 
+    # The fields of the static prefix decoded individually shall match those of the fully deserialized object.
+    view = pyuavcan.dsdl.LazyView(type(obj), chunks)
+    field_types = {f.name: f.data_type for f in pyuavcan.dsdl.get_model(obj).fields_except_padding}
+    for name in type(obj)._STATIC_PREFIX_FIELDS_:  # pylint: disable=protected-access
+        field_type = field_types[name] if name in field_types else field_types[name.rstrip("_")]  # Name mangling.
+        assert _util.are_close(field_type, getattr(view, name), pyuavcan.dsdl.get_attribute(d, name)), name
+
     # Similar floats may produce drastically different string representations, so if there is at least one float inside,
     # we skip the string representation equality check.
     if pydsdl.FloatType.__name__ not in repr(pyuavcan.dsdl.get_model(d)):
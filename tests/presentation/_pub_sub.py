@@ -32,6 +32,8 @@ async def _unittest_slow_presentation_pub_sub_anon(
     assert pres_a.transport is tran_a
 
     sub_heart = pres_b.make_subscriber_with_fixed_subject_id(uavcan.node.Heartbeat_1_0)
+    sub_heart_lazy = pres_b.make_subscriber_with_fixed_subject_id(uavcan.node.Heartbeat_1_0, lazy=True)
+    assert isinstance(sub_heart_lazy, pyuavcan.presentation.LazySubscriber)
 
     with pytest.raises(TypeError):
         # noinspection PyTypeChecker
@@ -91,6 +93,14 @@ async def _unittest_slow_presentation_pub_sub_anon(
     assert transfer.priority == Priority.SLOW
     assert transfer.transfer_id == 0
 
+    item = await sub_heart_lazy.receive_for(1)
+    assert item
+    rx, _ = item
+    assert isinstance(rx, pyuavcan.dsdl.LazyView)
+    assert rx.health.value == uavcan.node.Health_1_0.CAUTION  # Decoded individually from the static prefix.
+    assert rx.uptime == 123456
+    assert repr(rx.materialize()) == repr(heart)
+
     stat = sub_heart.sample_statistics()
     # Remember that anonymous transfers over redundant transports are NOT deduplicated.
     # Hence, to support the case of redundant transports, we use 'greater or equal' here.
@@ -140,6 +150,7 @@ async def _unittest_slow_presentation_pub_sub(
     pub_record = pres_b.make_publisher(Complex_254_255, 2222)
     sub_record = pres_a.make_subscriber(Complex_254_255, 2222)
     sub_record2 = pres_a.make_subscriber(Complex_254_255, 2222)
+    sub_record3 = pres_a.make_subscriber(Complex_254_255, 2222)
 
     heart = uavcan.node.Heartbeat_1_0(
         uptime=123456,
@@ -177,6 +188,46 @@ async def _unittest_slow_presentation_pub_sub(
     rx = await sub_heart.receive_for(_RX_TIMEOUT)
     assert rx is None
 
+    # Batched publication preserves the ordering of the messages.
+    assert await pub_heart.publish_many([]) == 0
+    assert await pub_heart.publish_many(uavcan.node.Heartbeat_1_0(uptime=i) for i in range(10)) == 10
+    for i in range(10):
+        item = await sub_heart.receive_for(_RX_TIMEOUT)
+        assert item
+        assert item[0].uptime == i
+    with pytest.raises(TypeError):
+        await pub_heart.publish_many([heart, Complex_254_255(bytes_=[1])])  # type: ignore
+
+    # Sampling modes.
+    sub_heart.decimation = 3
+    assert await pub_heart.publish_many(uavcan.node.Heartbeat_1_0(uptime=i) for i in range(7)) == 7
+    await asyncio.sleep(_RX_TIMEOUT)
+    assert [x.uptime for x, _ in [await sub_heart.receive_for(0) for _ in range(3)]] == [0, 3, 6]  # type: ignore
+    assert (await sub_heart.receive_for(_RX_TIMEOUT)) is None
+    assert sub_heart.sample_statistics().skipped == 4
+    with pytest.raises(ValueError):
+        sub_heart.decimation = 0
+    sub_heart.decimation = 1
+
+    sub_heart.max_rate = 0.1
+    assert await pub_heart.publish_many(uavcan.node.Heartbeat_1_0(uptime=i) for i in range(3)) == 3
+    item = await sub_heart.receive_for(_RX_TIMEOUT)
+    assert item and item[0].uptime == 0
+    assert (await sub_heart.receive_for(_RX_TIMEOUT)) is None
+    assert sub_heart.sample_statistics().skipped == 6
+    with pytest.raises(ValueError):
+        sub_heart.max_rate = 0
+    sub_heart.max_rate = None
+
+    sub_heart.latest_only = True
+    assert await pub_heart.publish_many(uavcan.node.Heartbeat_1_0(uptime=i) for i in range(3)) == 3
+    await asyncio.sleep(_RX_TIMEOUT)
+    item = await sub_heart.receive_for(0)
+    assert item and item[0].uptime == 2
+    assert (await sub_heart.receive_for(_RX_TIMEOUT)) is None
+    assert sub_heart.sample_statistics().skipped == 8
+    sub_heart.latest_only = False
+
     sub_heart.close()
     sub_heart.close()  # Shall not raise.
 
@@ -186,7 +237,15 @@ async def _unittest_slow_presentation_pub_sub(
         print("HANDLER:", message, cb_transfer)
         handler_output.append((message, cb_transfer))
 
-    sub_record2.receive_in_background(handler)
+    sub_record2.receive_in_background(handler, direct=True)
+
+    queued_handler_output: typing.List[typing.Tuple[Complex_254_255, pyuavcan.transport.TransferFrom]] = []
+
+    async def queued_handler(message: Complex_254_255, cb_transfer: pyuavcan.transport.TransferFrom) -> None:
+        await asyncio.sleep(0.01)  # Does not delay the other handlers of the subject because it is queued.
+        queued_handler_output.append((message, cb_transfer))
+
+    sub_record3.receive_in_background(queued_handler)
 
     record = Complex_254_255(bytes_=[1, 2, 3, 1])
     assert pub_record.priority == pyuavcan.presentation.DEFAULT_PRIORITY
@@ -237,6 +296,7 @@ async def _unittest_slow_presentation_pub_sub(
     pub_heart.close()
     sub_record.close()
     sub_record2.close()
+    sub_record3.close()
     pub_record.close()
     await asyncio.sleep(1.1)
 
@@ -256,5 +316,49 @@ async def _unittest_slow_presentation_pub_sub(
     assert handler_output[0][1].source_node_id == 42
     assert handler_output[0][1].transfer_id == 0
     assert handler_output[0][1].priority == Priority.NOMINAL
+    assert len(queued_handler_output) == 1
+    assert repr(queued_handler_output[0][0]) == repr(record)
+    assert queued_handler_output[0][1].transfer_id == 0
+
+    await asyncio.sleep(1)  # Let all pending tasks finalize properly to avoid stack traces in the output.
+
+
+@pytest.mark.asyncio  # type: ignore
+async def _unittest_slow_presentation_pub_buffer_pool(
+    generated_packages: typing.List[pyuavcan.dsdl.GeneratedPackageInfo],
+) -> None:
+    assert generated_packages
+    import uavcan.node
+    from pyuavcan.dsdl import SerializationBufferPoolStatistics
+    from pyuavcan.transport.loopback import LoopbackTransport
+
+    pres = pyuavcan.presentation.Presentation(LoopbackTransport(1234))
+    pub = pres.make_publisher(uavcan.node.Heartbeat_1_0, 2345)
+    assert pub._maybe_impl is not None  # pylint: disable=protected-access
+    pool = pub._maybe_impl._buffer_pool  # pylint: disable=protected-access
+
+    # Nobody retains the payload, so the same buffer is reused for every message.
+    for i in range(10):
+        assert await pub.publish(uavcan.node.Heartbeat_1_0(uptime=i))
+    assert pool.sample_statistics() == SerializationBufferPoolStatistics(acquired=10, allocated=1, recycled=10)
+
+    # The loopback transport delivers the payload by reference, so the buffers retained by the subscriber
+    # are discarded rather than reused, and the received messages are not corrupted.
+    sub = pres.make_subscriber(uavcan.node.Heartbeat_1_0, 2345)
+    assert await pub.publish_many([uavcan.node.Heartbeat_1_0(uptime=i) for i in range(3)]) == 3
+    assert pool.sample_statistics() == SerializationBufferPoolStatistics(
+        acquired=13, allocated=3, recycled=10, discarded=3
+    )
+    for i in range(3):
+        item = await sub.receive_for(_RX_TIMEOUT)
+        assert item is not None
+        assert item[0].uptime == i
+    sub.close()
+
+    assert await pub.publish(uavcan.node.Heartbeat_1_0(uptime=99))
+    assert pool.sample_statistics() == SerializationBufferPoolStatistics(
+        acquired=14, allocated=4, recycled=11, discarded=3
+    )
 
+    pres.close()
     await asyncio.sleep(1)  # Let all pending tasks finalize properly to avoid stack traces in the output.
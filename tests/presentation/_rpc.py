@@ -2,8 +2,10 @@
 # This software is distributed under the terms of the MIT License.
 # Author: Pavel Kirienko <pavel@uavcan.org>
 
+import time
 import typing
 import asyncio
+import concurrent.futures
 import pytest
 import pyuavcan
 from .conftest import TransportFactory
@@ -101,6 +103,57 @@ async def _unittest_slow_presentation_rpc(
     assert last_metadata.transfer_id == 1
     assert last_metadata.priority == Priority.IMMEDIATE
 
+    # Concurrent request handling: the slow handlers are executed in parallel instead of one after another.
+    assert server.concurrency == 1
+    with pytest.raises(ValueError):
+        server.concurrency = 0
+    server.concurrency = 4
+    assert server.concurrency == 4
+
+    async def slow_server_handler(
+        _request: uavcan.register.Access_1_0.Request, _metadata: pyuavcan.presentation.ServiceRequestMetadata
+    ) -> typing.Optional[uavcan.register.Access_1_0.Response]:
+        await asyncio.sleep(0.5)
+        return response
+
+    server.serve_in_background(slow_server_handler)
+    started_at = asyncio.get_running_loop().time()
+    results = await asyncio.gather(*(client0.call(last_request) for _ in range(4)))
+    assert all(repr(x[0]) == repr(response) for x in results if x is not None)
+    assert all(x is not None for x in results)
+    assert asyncio.get_running_loop().time() - started_at < 1.5
+
+    # Synchronous handlers are offloaded to the executor so that they do not block the event loop.
+    def blocking_server_handler(
+        _request: uavcan.register.Access_1_0.Request, _metadata: pyuavcan.presentation.ServiceRequestMetadata
+    ) -> typing.Optional[uavcan.register.Access_1_0.Response]:
+        time.sleep(0.5)
+        return response
+
+    with pytest.raises(TypeError):
+        server.executor = 123  # type: ignore
+    server.executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+    server.serve_in_background(blocking_server_handler)
+    started_at = asyncio.get_running_loop().time()
+    results = await asyncio.gather(*(client0.call(last_request) for _ in range(4)))
+    assert all(x is not None for x in results)
+    assert asyncio.get_running_loop().time() - started_at < 1.5
+
+    # Pipelined calls: the responses are matched with the requests regardless of the order of arrival.
+    with pytest.raises(ValueError):
+        await client0.call_many([last_request], max_in_flight=0)
+    server.serve_in_background(slow_server_handler)
+    histogram_before = client0.sample_statistics().response_latency_histogram
+    assert set(histogram_before) == set(pyuavcan.presentation.ClientStatistics.RESPONSE_LATENCY_BINS)
+    started_at = asyncio.get_running_loop().time()
+    results = await client0.call_many([last_request] * 20, max_in_flight=8)
+    assert len(results) == 20
+    assert all(x is not None and repr(x[0]) == repr(response) for x in results)
+    assert asyncio.get_running_loop().time() - started_at < 4.0  # Four batches of concurrently handled requests.
+    histogram_after = client0.sample_statistics().response_latency_histogram
+    assert sum(histogram_after.values()) - sum(histogram_before.values()) == 20
+    assert histogram_after[0.1] == histogram_before[0.1]  # The handler takes longer than that.
+
     server.close()
     client0.close()
     client1.close()
@@ -117,6 +117,16 @@ def _generate() -> typing.Iterator[typing.Callable[[], typing.Iterator[Transport
 
     yield udp_loopback
 
+    def udp_loopback_reactor() -> typing.Iterator[TransportFactory]:
+        from pyuavcan.transport.udp import UDPTransport
+
+        def one(nid: typing.Optional[int]) -> UDPTransport:
+            return UDPTransport("127.0.0.1", local_node_id=nid, reactor=True)
+
+        yield lambda nid_a, nid_b: (one(nid_a), one(nid_b), False)
+
+    yield udp_loopback_reactor
+
     def heterogeneous_udp_serial() -> typing.Iterator[TransportFactory]:
         from pyuavcan.transport.redundant import RedundantTransport
         from pyuavcan.transport.udp import UDPTransport
@@ -194,6 +194,7 @@ async def _unittest_can_transport_anon() -> None:
     assert tr2.sample_statistics() == can.CANTransportStatistics(
         in_frames=2, in_frames_uavcan=2, in_frames_uavcan_accepted=1
     )
+    assert tr2.sample_statistics().in_frames_rejected_by_transport == 1
 
     received = await promiscuous_m2345.receive(tr.loop.time() + 1.0)
     assert received is not None
@@ -370,6 +371,7 @@ async def _unittest_can_transport_non_anon(caplog: typing.Any) -> None:
     assert tr2.sample_statistics() == can.CANTransportStatistics(
         in_frames=2, in_frames_uavcan=2, in_frames_uavcan_accepted=1
     )
+    assert tr2.sample_statistics().in_frames_rejected_by_transport == 1
 
     received = await promiscuous_m2345.receive(tr.loop.time() + 1.0)
     assert received is not None
@@ -1183,6 +1185,166 @@ async def _unittest_can_spoofing() -> None:
         )
 
 
+@pytest.mark.asyncio  # type: ignore
+async def _unittest_can_transfer_queue() -> None:
+    from pyuavcan.transport import MessageDataSpecifier, PayloadMetadata, Transfer, Priority, Timestamp
+    from pyuavcan.transport import InputSessionSpecifier, OutputSessionSpecifier
+    from .media.mock import MockMedia
+
+    asyncio.get_running_loop().slow_callback_duration = 5.0
+
+    peers: typing.Set[MockMedia] = set()
+    tr = can.CANTransport(MockMedia(peers, 8, 1), 10)
+    tr2 = can.CANTransport(MockMedia(peers, 8, 1), 20)
+    meta = PayloadMetadata(1024)
+    pub = tr.get_output_session(OutputSessionSpecifier(MessageDataSpecifier(1234), None), meta)
+    sub = tr2.get_input_session(InputSessionSpecifier(MessageDataSpecifier(1234), None), meta)
+
+    async def publish(transfer_id: int, priority: Priority) -> None:
+        payload = _mem(f"transfer {transfer_id:02}" * 3)  # Multi-frame.
+        assert await pub.send(Transfer(Timestamp.now(), priority, transfer_id, [payload]), tr.loop.time() + 1.0)
+
+    async def receive_ids() -> typing.List[int]:
+        out: typing.List[int] = []
+        while True:
+            transfer = await sub.receive(0)
+            if transfer is None:
+                return out
+            assert b"".join(transfer.fragmented_payload).startswith(f"transfer {transfer.transfer_id:02}".encode())
+            out.append(transfer.transfer_id)
+
+    assert sub.transfer_queue_capacity is None  # Disabled by default.
+    assert sub.overflow_policy == can.CANInputSession.OverflowPolicy.DROP_OLDEST
+    with pytest.raises(ValueError):
+        sub.transfer_queue_capacity = 0
+    with pytest.raises(ValueError):
+        sub.overflow_policy = 123  # type: ignore
+
+    # Frames received before the eager reassembly is enabled are reassembled immediately.
+    await publish(0, Priority.NOMINAL)
+    await asyncio.sleep(0.1)
+    assert sub.sample_statistics().frames == 0
+    sub.transfer_queue_capacity = 3
+    assert sub.sample_statistics().frames == 5
+    assert sub.sample_statistics().transfers == 1
+    assert sub.sample_statistics().queue_high_water_mark == 1
+
+    for i in range(1, 5):
+        await publish(i, Priority.NOMINAL)
+    await asyncio.sleep(0.1)
+    assert sub.sample_statistics().drops == 2
+    assert await receive_ids() == [2, 3, 4]
+    assert sub.sample_statistics().queue_high_water_mark == 3
+    assert await sub.receive(tr.loop.time() + 0.1) is None
+
+    sub.overflow_policy = can.CANInputSession.OverflowPolicy.DROP_NEWEST
+    for i in range(5, 10):
+        await publish(i, Priority.NOMINAL)
+    await asyncio.sleep(0.1)
+    assert sub.sample_statistics().drops == 4
+    assert await receive_ids() == [5, 6, 7]
+
+    sub.overflow_policy = can.CANInputSession.OverflowPolicy.DROP_LOWEST_PRIORITY
+    await publish(10, Priority.LOW)
+    await publish(11, Priority.SLOW)
+    await publish(12, Priority.LOW)
+    await publish(13, Priority.HIGH)  # Evicts 11.
+    await publish(14, Priority.OPTIONAL)  # Dropped.
+    await publish(15, Priority.NOMINAL)  # Evicts 12.
+    await asyncio.sleep(0.1)
+    assert sub.sample_statistics().drops == 7
+    assert await receive_ids() == [10, 13, 15]
+
+    # The transfers queued before the eager reassembly is disabled are delivered first.
+    await publish(16, Priority.NOMINAL)
+    await asyncio.sleep(0.1)
+    sub.transfer_queue_capacity = None
+    await publish(17, Priority.NOMINAL)
+    await asyncio.sleep(0.1)
+    assert await receive_ids() == [16, 17]
+
+    # The receiver is woken up by a new transfer.
+    sub.transfer_queue_capacity = 1
+    task = asyncio.ensure_future(sub.receive(tr.loop.time() + 1.0))
+    await asyncio.sleep(0.1)
+    assert not task.done()
+    await publish(18, Priority.NOMINAL)
+    transfer = await task
+    assert transfer is not None and transfer.transfer_id == 18
+
+    tr.close()
+    tr2.close()
+    await asyncio.sleep(0.1)
+
+
+@pytest.mark.asyncio  # type: ignore
+async def _unittest_can_send_many() -> None:
+    from pyuavcan.transport import MessageDataSpecifier, PayloadMetadata, Transfer, Priority, Timestamp
+    from pyuavcan.transport import InputSessionSpecifier, OutputSessionSpecifier
+    from pyuavcan.transport.can.media import Envelope
+    from .media.mock import MockMedia
+
+    asyncio.get_running_loop().slow_callback_duration = 5.0
+
+    peers: typing.Set[MockMedia] = set()
+    media = MockMedia(peers, 8, 1)
+    tr = can.CANTransport(media, 10)
+    tr2 = can.CANTransport(MockMedia(peers, 8, 1), 20)
+    meta = PayloadMetadata(1024)
+    pub = tr.get_output_session(OutputSessionSpecifier(MessageDataSpecifier(1234), None), meta)
+    sub = tr2.get_input_session(InputSessionSpecifier(MessageDataSpecifier(1234), None), meta)
+
+    num_media_sends = 0
+    original_send = media.send
+
+    async def send(frames: typing.Iterable[Envelope], monotonic_deadline: float) -> int:
+        nonlocal num_media_sends
+        num_media_sends += 1
+        return await original_send(frames, monotonic_deadline)
+
+    media.send = send  # type: ignore
+
+    def make(transfer_id: int, priority: Priority = Priority.NOMINAL) -> Transfer:
+        return Transfer(Timestamp.now(), priority, transfer_id, [_mem(f"transfer {transfer_id:02}" * 3)])
+
+    async def receive_ids() -> typing.List[int]:
+        out: typing.List[int] = []
+        while True:
+            transfer = await sub.receive(tr.loop.time() + 0.1)
+            if transfer is None:
+                return out
+            assert b"".join(transfer.fragmented_payload) == f"transfer {transfer.transfer_id:02}".encode() * 3
+            out.append(transfer.transfer_id)
+
+    # Transfers sharing the same CAN ID are emitted at once; each transfer takes 5 frames.
+    assert await pub.send_many([], tr.loop.time() + 1.0) == 0
+    assert await pub.send_many([make(i) for i in range(5)], tr.loop.time() + 1.0) == 5
+    assert num_media_sends == 1
+    assert await receive_ids() == [0, 1, 2, 3, 4]
+    assert pub.sample_statistics().transfers == 5
+    assert pub.sample_statistics().frames == 25
+
+    # A different priority means a different CAN ID.
+    num_media_sends = 0
+    assert await pub.send_many([make(5), make(6), make(7, Priority.HIGH)], tr.loop.time() + 1.0) == 3
+    assert num_media_sends == 2
+    assert await receive_ids() == [5, 6, 7]
+
+    # The feedback requires that the transfers are sent one by one.
+    num_media_sends = 0
+    feedback: typing.List[pyuavcan.transport.Feedback] = []
+    pub.enable_feedback(feedback.append)
+    assert await pub.send_many([make(8), make(9)], tr.loop.time() + 1.0) == 2
+    assert num_media_sends == 2
+    assert len(feedback) == 2
+    assert await receive_ids() == [8, 9]
+    assert pub.sample_statistics().transfers == 10
+
+    tr.close()
+    tr2.close()
+    await asyncio.sleep(0.1)
+
+
 def _mem(data: typing.Union[str, bytes, bytearray]) -> memoryview:
     return memoryview(data.encode() if isinstance(data, str) else data)
 
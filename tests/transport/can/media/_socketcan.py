@@ -104,6 +104,26 @@ async def _unittest_can_socketcan() -> None:
     assert rx_external[2].data == bytearray(range(6))
     assert rx_external[2].format == FrameFormat.BASE
 
+    # Burst transfer; the frames are transmitted and received in batches but the ordering shall be retained.
+    rx_a.clear()
+    burst = [
+        Envelope(DataFrame(FrameFormat.EXTENDED, 0x1000 + i, bytearray([i % 256] * (i % 9))), loopback=False)
+        for i in range(100)
+    ]
+    assert len(burst) == await media_a.send(burst, asyncio.get_event_loop().time() + 1.0)
+    await asyncio.sleep(0.5)
+    assert [e.frame for _, e in rx_a] == [e.frame for e in burst]
+    assert not any(e.loopback for _, e in rx_a)
+
+    # Kernel acceptance filtering; the rejected frames do not reach the user space.
+    media_a.configure_acceptance_filters([FilterConfiguration(0x1001, 0x1FFFFFFF, FrameFormat.EXTENDED)])
+    rx_a.clear()
+    assert len(burst) == await media_a.send(burst, asyncio.get_event_loop().time() + 1.0)
+    await asyncio.sleep(0.5)
+    assert [e.frame for _, e in rx_a] == [burst[1].frame]
+    rejected = media_a.number_of_frames_rejected_by_acceptance_filters
+    assert rejected is None or rejected >= len(burst) - 1
+
     media_a.close()
     media_b.close()
 
@@ -2,6 +2,7 @@
 # This software is distributed under the terms of the MIT License.
 # Author: Pavel Kirienko <pavel@uavcan.org>
 
+import time
 import typing
 import asyncio
 import logging
@@ -505,5 +506,116 @@ async def _unittest_serial_spoofing() -> None:
         assert await tr.spoof(transfer, monotonic_deadline=asyncio.get_running_loop().time())
 
 
+@pytest.mark.asyncio  # type: ignore
+async def _unittest_serial_transmit_coalescing() -> None:
+    from pyuavcan.transport import MessageDataSpecifier, PayloadMetadata, Transfer, Priority, Timestamp
+    from pyuavcan.transport import InputSessionSpecifier, OutputSessionSpecifier
+
+    get_monotonic = asyncio.get_event_loop().time
+
+    tr = SerialTransport(serial_port="loop://", local_node_id=42, mtu=1024, baudrate=10_000_000)
+    writes: typing.List[int] = []
+    original_write = tr.serial_port.write
+
+    def write(data: typing.Any) -> typing.Optional[int]:
+        writes.append(len(data))
+        return original_write(data)
+
+    tr.serial_port.write = write  # type: ignore
+    ds = MessageDataSpecifier(2345)
+    pub = tr.get_output_session(OutputSessionSpecifier(ds, None), PayloadMetadata(10000))
+    sub = tr.get_input_session(InputSessionSpecifier(ds, None), PayloadMetadata(10000))
+
+    def payload(i: int) -> memoryview:
+        return _mem(bytes([i]) * 3000)
+
+    # All transfers are queued before the transmission task gets to run, so they are emitted with one write call.
+    # Each transfer consists of three frames.
+    results = await asyncio.gather(
+        *(
+            pub.send(
+                Transfer(
+                    timestamp=Timestamp.now(), priority=Priority.LOW, transfer_id=i, fragmented_payload=[payload(i)]
+                ),
+                monotonic_deadline=get_monotonic() + 5.0,
+            )
+            for i in range(10)
+        )
+    )
+    assert all(results)
+    assert len(writes) == 1
+    assert tr.sample_statistics().out_frames == 30
+    assert tr.sample_statistics().out_transfers == 10
+    assert tr.sample_statistics().out_bytes == sum(writes)
+    for i in range(10):
+        rx = await sub.receive(get_monotonic() + 5.0)
+        assert rx is not None
+        assert rx.transfer_id == i
+        assert b"".join(rx.fragmented_payload) == payload(i).tobytes()
+
+    # An expired transfer is dropped without being written.
+    assert not await pub.send(
+        Transfer(timestamp=Timestamp.now(), priority=Priority.LOW, transfer_id=10, fragmented_payload=[]),
+        monotonic_deadline=get_monotonic() - 1.0,
+    )
+    assert len(writes) == 1
+    assert tr.sample_statistics().out_incomplete == 1
+
+    # Cancellation of one sender does not affect the transfers of the others, even if they are written together.
+    def slow_write(data: typing.Any) -> typing.Optional[int]:
+        time.sleep(0.5)
+        return write(data)
+
+    tr.serial_port.write = slow_write  # type: ignore
+    tasks = [
+        asyncio.ensure_future(
+            pub.send(
+                Transfer(
+                    timestamp=Timestamp.now(), priority=Priority.LOW, transfer_id=i, fragmented_payload=[payload(i)]
+                ),
+                monotonic_deadline=get_monotonic() + 5.0,
+            )
+        )
+        for i in range(11, 14)
+    ]
+    await asyncio.sleep(0.2)  # The write is in progress now.
+    tasks[0].cancel()
+    assert all(await asyncio.gather(*tasks[1:]))
+    assert tasks[0].cancelled()
+    assert len(writes) == 2
+    for i in range(11, 14):
+        rx = await sub.receive(get_monotonic() + 5.0)
+        assert rx is not None
+        assert rx.transfer_id == i
+
+    # A transfer whose deadline expires while the write is in progress is reported as failed by its deadline,
+    # whereas the write is not aborted for the other transfers.
+    async def send_timed(transfer_id: int, timeout: float) -> typing.Tuple[bool, float]:
+        started_at = get_monotonic()
+        result = await pub.send(
+            Transfer(
+                timestamp=Timestamp.now(),
+                priority=Priority.LOW,
+                transfer_id=transfer_id,
+                fragmented_payload=[payload(transfer_id)],
+            ),
+            monotonic_deadline=started_at + timeout,
+        )
+        return result, get_monotonic() - started_at
+
+    (short_result, short_elapsed), (long_result, long_elapsed) = await asyncio.gather(
+        send_timed(14, 0.2), send_timed(15, 5.0)
+    )
+    assert not short_result
+    assert short_elapsed < 0.4  # Returned by the deadline rather than when the write was completed.
+    assert long_result
+    assert long_elapsed >= 0.5
+    assert len(writes) == 3
+    assert tr.sample_statistics().out_incomplete == 2
+
+    tr.close()
+    await asyncio.sleep(1)
+
+
 def _mem(data: typing.Union[str, bytes, bytearray]) -> memoryview:
     return memoryview(data.encode() if isinstance(data, str) else data)
@@ -326,5 +326,68 @@ async def _unittest_udp_transport_ipv4_capture() -> None:
     assert frame.priority == Priority.NOMINAL
 
 
+@pytest.mark.asyncio  # type: ignore
+async def _unittest_udp_output_session_tx_timestamping() -> None:
+    """
+    With the feedback enabled, the output session waits for the kernel transmission timestamps.
+    It shall not stall for the full timeout on every transfer if the timestamps are not available.
+    """
+    import time
+    import socket
+    from pyuavcan.transport import OutputSessionSpecifier, MessageDataSpecifier, Priority, PayloadMetadata
+    from pyuavcan.transport import Transfer, Timestamp, Feedback
+    from pyuavcan.transport.udp import UDPOutputSession
+
+    loop = asyncio.get_running_loop()
+    sock_rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock_rx.bind(("127.100.0.1", 0))
+
+    def make_session() -> UDPOutputSession:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(("127.100.0.2", 0))
+        sock.connect(sock_rx.getsockname())
+        sock.setblocking(False)
+        return UDPOutputSession(
+            specifier=OutputSessionSpecifier(MessageDataSpecifier(3210), None),
+            payload_metadata=PayloadMetadata(1024),
+            mtu=1024,
+            multiplier=1,
+            sock=sock,
+            loop=loop,
+            finalizer=lambda: None,
+        )
+
+    async def send_burst(ses: UDPOutputSession, count: int) -> typing.Tuple[float, typing.List[Feedback]]:
+        feedback: typing.List[Feedback] = []
+        ses.enable_feedback(feedback.append)
+        started_at = time.monotonic()
+        for index in range(count):
+            transfer = Transfer(Timestamp.now(), Priority.NOMINAL, index, [_mem("abc")])
+            assert await ses.send(transfer, loop.time() + 1.0)
+        return time.monotonic() - started_at, feedback
+
+    # The kernel timestamps are awaited without polling, so the transfers are not delayed by the waiting.
+    ses = make_session()
+    elapsed, feedback = await send_burst(ses, 10)
+    assert len(feedback) == 10
+    assert elapsed < 0.5
+    for fb in feedback:
+        assert fb.original_transfer_timestamp.monotonic <= fb.first_frame_transmission_timestamp.monotonic
+    ses.close()
+
+    # Emulate a driver that does not deliver the timestamps: only the first transfer waits for the timeout.
+    ses = make_session()
+    ses._tx_timestamper.fetch = lambda _: None  # type: ignore  # pylint: disable=protected-access
+    elapsed, feedback = await send_burst(ses, 1)
+    assert len(feedback) == 1
+    assert elapsed >= 0.09
+    elapsed, feedback = await send_burst(ses, 10)
+    assert len(feedback) == 10
+    assert elapsed < 0.5
+    ses.close()
+
+    sock_rx.close()
+
+
 def _mem(data: typing.Union[str, bytes, bytearray]) -> memoryview:
     return memoryview(data.encode() if isinstance(data, str) else data)